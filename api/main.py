@@ -1,8 +1,17 @@
 """FastAPI application for article selector."""
 
+import os
+
+import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from core.agents import close_http_client
+from core.micro_batcher import MicroBatcher
+from core.response_tracker import adrain_response_writers
+from core.settings import settings
+from projects.article_selector.models import Article
+
 # Import projects to register agents and workflows
 import projects.article_selector.agents  # noqa: F401
 import projects.article_selector.workflows  # noqa: F401
@@ -30,6 +39,25 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Micro-batch concurrent /classify requests into shared first pass calls
+    classify_batcher = None
+    
+    @app.on_event("startup")
+    async def start_classify_batcher():
+        nonlocal classify_batcher
+        from projects.article_selector.agents.tracked_agents import get_tracked_first_pass_agent
+        
+        first_pass = get_tracked_first_pass_agent()
+        classify_batcher = MicroBatcher(first_pass.aclassify_many, max_batch_size=16, max_wait=0.05)
+        classify_batcher.start()
+    
+    @app.on_event("shutdown")
+    async def stop_classify_batcher():
+        if classify_batcher is not None:
+            await classify_batcher.stop()
+        await adrain_response_writers()
+        await close_http_client()
+    
     # Add health check endpoint
     @app.get("/health")
     async def health_check():
@@ -47,8 +75,37 @@ def create_app() -> FastAPI:
         from core.workflows import workflow_registry
         return workflow_registry.list_workflows()
     
+    # Add first pass classification endpoint
+    @app.post("/classify")
+    async def classify(article: Article):
+        response = await classify_batcher.submit(article)
+        return {"status": response["status"], "reasoning": response["reasoning"]}
+    
     return app
 
 
 # Create the app instance
-app = create_app()
\ No newline at end of file
+app = create_app()
+
+
+def run_server():
+    """Run the API with Uvicorn.
+    
+    Uses APP_WORKERS worker processes, defaulting to one per CPU capped at
+    LLM_MAX_CONCURRENCY. Reload mode (API_RELOAD) always runs a single worker.
+    """
+    workers = settings.api_workers or min(os.cpu_count() or 1, settings.max_concurrent_llm_calls)
+    
+    uvicorn.run(
+        "api.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        reload=settings.api_reload,
+        workers=1 if settings.api_reload else workers,
+        loop="uvloop",
+        http="httptools",
+    )
+
+
+if __name__ == "__main__":
+    run_server()
@@ -1,35 +1,43 @@
 #!/usr/bin/env python3
 """Check available Agno models."""
 
+import importlib.util
 import pkgutil
-import agno.models
+
+# Locate agno.models without executing its package body
+models_spec = importlib.util.find_spec("agno.models")
 
 print("Available Agno model modules:")
-for importer, modname, ispkg in pkgutil.iter_modules(agno.models.__path__):
+for importer, modname, ispkg in pkgutil.iter_modules(models_spec.submodule_search_locations):
     print(f"  - agno.models.{modname}")
-    
-# Try to import specific models
-try:
-    from agno.models.google import Gemini
+
+
+def _available(module: str, sdk: str) -> bool:
+    """Check a model module and its provider SDK are installed, without importing them."""
+    try:
+        return importlib.util.find_spec(module) is not None and importlib.util.find_spec(sdk) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Probe specific models
+if _available("agno.models.google", "google.genai"):
     print("\n✅ Google Gemini model available!")
-except ImportError as e:
-    print(f"\n❌ Google Gemini not available: {e}")
+else:
+    print("\n❌ Google Gemini not available")
 
-try:
-    from agno.models.aws import Claude
+if _available("agno.models.aws", "boto3"):
     print("✅ AWS Claude model available!")
-except ImportError as e:
-    print(f"❌ AWS Claude not available: {e}")
+else:
+    print("❌ AWS Claude not available")
 
-try:
-    from agno.models.openai import GPT
+if _available("agno.models.openai", "openai"):
     print("✅ OpenAI GPT model available!")
-except ImportError as e:
-    print(f"❌ OpenAI GPT not available: {e}")
+else:
+    print("❌ OpenAI GPT not available")
 
 # Check for vertex AI
-try:
-    from agno.models.gcp import VertexAI
+if _available("agno.models.gcp", "google.cloud.aiplatform"):
     print("✅ GCP VertexAI model available!")
-except ImportError as e:
-    print(f"❌ GCP VertexAI not available: {e}")
\ No newline at end of file
+else:
+    print("❌ GCP VertexAI not available")
@@ -35,7 +35,7 @@ def check_content_table():
             
             # Get sample
             sample_query = """
-                SELECT title, url, body, timestamp 
+                SELECT substr(title, 1, 80), substr(url, 1, 80), substr(body, 1, 150), timestamp 
                 FROM newsletter_data.content 
                 WHERE timestamp IS NOT NULL 
                 AND body IS NOT NULL 
@@ -48,9 +48,9 @@ def check_content_table():
             print("\n📰 Recent articles from content table:")
             for row in samples:
                 title, url, body, timestamp = row
-                print(f"\n   Title: {title[:80]}...")
-                print(f"   URL: {url[:80]}...")
-                print(f"   Body: {body[:150]}...")
+                print(f"\n   Title: {title}...")
+                print(f"   URL: {url}...")
+                print(f"   Body: {body}...")
                 print(f"   Timestamp: {timestamp}")
                 
             # Check date range
@@ -2,16 +2,23 @@
 """Process articles from database through the selection pipeline."""
 
 import argparse
+import asyncio
+import hashlib
 import json
 import sys
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
+from urllib.parse import urlparse
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.agents import close_http_client
+from core.batch_processor import BatchProcessor
 from core.database import get_database
+from core.duckdb_pool import DuckDBPool
 from core.settings import settings
 from projects.article_selector.agents.tracked_agents import (
     get_tracked_first_pass_agent,
@@ -19,16 +26,29 @@ from projects.article_selector.agents.tracked_agents import (
     get_tracked_selector_agent,
 )
 from projects.article_selector.models import Article
-from core.response_tracker import response_tracker
+from core.response_tracker import adrain_response_writers
 from core.output_formatter import SelectionOutputFormatter
 import time
 
 
-def process_batch(
+def _dedupe_key(article: Article) -> str:
+    """Key identifying duplicate articles by normalized URL and title."""
+    parsed = urlparse(article.url or '')
+    return hashlib.sha256(
+        (parsed.netloc + parsed.path + article.title[:200]).encode()
+    ).hexdigest()
+
+
+async def process_batch(
     batch_size: int = 50,
     max_selected: int = 10,
     debug: bool = False,
-    export_json: bool = True
+    export_json: bool = True,
+    max_concurrency: int = 10,
+    rpm: int = 100,
+    batch_api: bool = False,
+    resume: bool = False,
+    articles_per_call: int = 8
 ):
     """Process a batch of articles from the database.
     
@@ -37,6 +57,12 @@ def process_batch(
         max_selected: Maximum articles to select
         debug: Enable debug mode
         export_json: Export results to JSON file
+        max_concurrency: Maximum concurrent agent calls per phase
+        rpm: Maximum agent requests per minute
+        batch_api: Run first pass through the provider Batch API
+        resume: Score and select from all relevant articles in the database,
+            not just the ones classified in this run
+        articles_per_call: Articles classified per first pass agent call
     """
     start_time = time.time()
     
@@ -46,74 +72,172 @@ def process_batch(
     
     # Connect to database
     db = get_database()
+    pool = DuckDBPool(db)
     print(f"Database: {'MotherDuck' if settings.use_motherduck() else 'Local DuckDB'}")
     
-    # Get unprocessed articles
-    articles_data = db.get_unprocessed_articles(limit=batch_size)
+    # Stream unprocessed articles as Arrow record batches (only the columns we need)
+    record_batches = await pool.run(lambda d: list(d.iter_unprocessed_articles(limit=batch_size)))
+    
+    article_ids = []
+    articles = []
+    for rb in record_batches:
+        article_ids.extend(rb.column('id').to_pylist())
+        articles.extend(
+            Article(title=title, content=content, url=url, domain=domain)
+            for title, content, url, domain in zip(
+                rb.column('title').to_pylist(),
+                rb.column('content').to_pylist(),
+                rb.column('url').to_pylist(),
+                rb.column('domain').to_pylist(),
+            )
+        )
     
-    if not articles_data:
+    if not articles:
         print("No unprocessed articles found in database.")
+        pool.close()
         return
     
-    print(f"Found {len(articles_data)} unprocessed articles")
+    print(f"Found {len(articles)} unprocessed articles")
     
     # Initialize tracked agents
     first_pass = get_tracked_first_pass_agent(debug_mode=debug)
     scoring = get_tracked_scoring_agent(debug_mode=debug)
     selector = get_tracked_selector_agent(debug_mode=debug)
+    batch_processor = BatchProcessor()
     
     # Process through pipeline
     print(f"\n{'='*40}")
     print("PHASE 1: First Pass Filtering")
     print(f"{'='*40}")
     
-    relevant_count = 0
-    for article_data in articles_data:
-        article = Article(
-            title=article_data['title'],
-            content=article_data['content'],
-            url=article_data.get('url'),
-            domain=article_data.get('domain'),
-        )
-        
-        print(f"\n📄 {article.title[:60]}...")
+    # Collapse duplicates (e.g. RSS cross-posts) so each is classified once
+    dedupe_keys = [_dedupe_key(article) for article in articles]
+    groups = defaultdict(list)
+    for idx, key in enumerate(dedupe_keys):
+        groups[key].append(idx)
+    representatives = [members[0] for members in groups.values()]
+    print(f"Unique articles: {len(representatives)}/{len(articles)} "
+          f"({1 - len(representatives) / len(articles):.0%} duplicates)")
+    
+    # Reuse cached results for articles whose content was already classified
+    content_hashes = [
+        hashlib.sha256((article.title + article.content).encode()).hexdigest()
+        for article in articles
+    ]
+    await pool.run(lambda d: d.evict_first_pass_cache(max_age_days=30))
+    cached = await pool.run(lambda d: d.get_cached_first_pass(content_hashes))
+    pending = [idx for idx in representatives if content_hashes[idx] not in cached]
+    print(f"Cache hits: {len(representatives) - len(pending)}/{len(representatives)}")
+    
+    if not pending:
+        new_responses = []
+    elif batch_api:
+        # Submit the whole phase as one batch job and wait for it
+        from projects.article_selector.agents.batch_first_pass import submit_batch, poll_until_done
         
-        # Process with tracked agent
-        response = first_pass.process_article(
-            article=article,
-            article_id=article_data['id'],
-            save_responses=True
+        job_name = submit_batch([
+            {'id': article_ids[idx], **articles[idx].model_dump()}
+            for idx in pending
+        ])
+        print(f"Submitted batch job: {job_name}")
+        results = await asyncio.to_thread(poll_until_done, job_name)
+        results_by_id = {r['article_id']: r for r in results}
+        new_responses = [
+            results_by_id.get(
+                str(article_ids[idx]),
+                {"status": "Irrelevant", "reasoning": "Error: missing from batch results"}
+            )
+            for idx in pending
+        ]
+    else:
+        # Pack several articles into each call and run the calls concurrently
+        chunk_size = max(1, articles_per_call)
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        chunk_responses = await batch_processor.run_batch(
+            lambda chunk: first_pass.aclassify_many(
+                [articles[idx] for idx in chunk],
+                save_responses=True,
+                article_ids=[article_ids[idx] for idx in chunk]
+            ),
+            chunks,
+            max_concurrency=max_concurrency,
+            rpm=rpm
         )
+        new_responses = []
+        for chunk, response in zip(chunks, chunk_responses):
+            if isinstance(response, BaseException):
+                new_responses.extend([response] * len(chunk))
+            else:
+                new_responses.extend(response)
+    
+    responses = [cached.get(h) for h in content_hashes]
+    for idx, response in zip(pending, new_responses):
+        responses[idx] = response
+    
+    # Fan each representative's result out to its duplicates
+    for members in groups.values():
+        for member in members[1:]:
+            if responses[member] is None:
+                responses[member] = responses[members[0]]
+    
+    relevant_count = 0
+    log = []
+    relevant_articles = []
+    first_pass_rows = []
+    cache_rows = []
+    for article, article_id, content_hash, response in zip(articles, article_ids, content_hashes, responses):
+        log.append(f"\n📄 {article.title[:60]}...")
+        
+        if isinstance(response, BaseException):
+            log.append(f"   Error: {response}")
+            continue
         
         status = response['status']
-        result = response['result']
+        result = response.get('result')
         
-        # Save to database
-        db.save_first_pass_result(
-            article_id=article_data['id'],
-            status=status,
-            reasoning=str(result.content)[:500]
-        )
+        # Queue for a single bulk insert after the loop
+        reasoning = (str(result.content) if result is not None else response['reasoning'])[:500]
+        first_pass_rows.append((article_id, status, reasoning))
+        
+        # Cache fresh, successful results for future runs
+        if content_hash not in cached and not reasoning.startswith("Error:"):
+            cache_rows.append((content_hash, status, reasoning))
         
-        print(f"   Status: {status}")
-        if is_relevant:
+        log.append(f"   Status: {status}")
+        if status == 'Relevant':
             relevant_count += 1
+            relevant_articles.append({
+                'id': article_id,
+                'title': article.title,
+                'url': article.url,
+                'domain': article.domain,
+                'content': article.content,
+                'first_pass_reasoning': reasoning,
+                'overall_score': None,
+                'article': article,
+            })
     
-    print(f"\n✅ First pass complete: {relevant_count}/{len(articles_data)} articles passed")
+    # Write the per-article log in one go instead of a print per line
+    sys.stdout.write("\n".join(log) + "\n")
+    
+    await pool.run(lambda d: d.save_first_pass_results(first_pass_rows))
+    await pool.run(lambda d: d.put_cached_first_pass_many(cache_rows))
+    
+    print(f"\n✅ First pass complete: {relevant_count}/{len(articles)} articles passed")
     
     # Track phase statistics
     phase_stats = {
         'first_pass': {
-            'total': len(articles_data),
+            'total': len(articles),
             'relevant': relevant_count,
-            'filtered': len(articles_data) - relevant_count,
-            'pass_rate': (relevant_count / len(articles_data) * 100) if articles_data else 0
+            'filtered': len(articles) - relevant_count,
+            'pass_rate': (relevant_count / len(articles) * 100) if articles else 0
         }
     }
     
     if relevant_count == 0:
         print("No articles passed first pass filtering.")
-        db.close()
+        pool.close()
         return
     
     # Get relevant articles for scoring
@@ -121,50 +245,88 @@ def process_batch(
     print("PHASE 2: Scoring")
     print(f"{'='*40}")
     
-    relevant_articles = db.get_relevant_articles()
+    if resume:
+        # Pick up relevant articles from earlier runs as well
+        relevant_articles = await pool.run(lambda d: d.get_relevant_articles())
+        for article_data in relevant_articles:
+            article_data['article'] = Article(
+                title=article_data['title'],
+                content=article_data['content'],
+                url=article_data.get('url'),
+                domain=article_data.get('domain'),
+            )
+    
+    # Index by id once; scoring mutates these rows in place for the stats and Phase 3
+    by_id = {article_data['id']: article_data for article_data in relevant_articles}
     
-    for article_data in relevant_articles:
+    log = []
+    to_score = []
+    for article_data in by_id.values():
         if article_data.get('overall_score') is not None:
-            print(f"\n📊 {article_data['title'][:60]}...")
-            print(f"   Already scored: {article_data['overall_score']:.1f}/10")
+            log.append(f"\n📊 {article_data['title'][:60]}...")
+            log.append(f"   Already scored: {article_data['overall_score']:.1f}/10")
             continue
-        
-        print(f"\n📊 Scoring: {article_data['title'][:60]}...")
-        
-        article = Article(
-            title=article_data['title'],
-            content=article_data['content'],
-            url=article_data.get('url'),
-            domain=article_data.get('domain'),
-        )
-        
-        response = scoring.score_article(
-            article=article,
+        to_score.append(article_data)
+    
+    # Run scoring calls concurrently within provider limits
+    responses = await batch_processor.run_batch(
+        lambda article_data: scoring.ascore_article(
+            article=article_data['article'],
             first_pass_reasoning=article_data.get('first_pass_reasoning', 'N/A'),
             article_id=article_data['id'],
             save_responses=True
-        )
+        ),
+        to_score,
+        max_concurrency=max_concurrency,
+        rpm=rpm
+    )
+    
+    scoring_rows = []
+    for article_data, response in zip(to_score, responses):
+        log.append(f"\n📊 Scoring: {article_data['title'][:60]}...")
+        
+        if isinstance(response, BaseException):
+            log.append(f"   Error: {response}")
+            continue
         
         result = response['result']
+        if result is None:
+            # Leave the article unscored so a later --resume run retries it
+            log.append(f"   {response['rationale']}")
+            continue
         
         # Parse scoring (simplified - use structured output in production)
         # This is a placeholder - you'd parse the actual scores
-        db.save_scoring_result(
-            article_id=article_data['id'],
+        reasoning = str(result.content)[:1000]
+        scoring_rows.append((article_data['id'], 8.0, 7.5, 8.5, 8.0, reasoning, "Include"))
+        
+        # Keep the in-memory rows current so Phase 3 can reuse them
+        article_data.update(
             relevance_score=8.0,
             quality_score=7.5,
             impact_score=8.5,
             overall_score=8.0,
-            reasoning=str(result.content)[:1000],
+            reasoning=reasoning,
             recommendation="Include"
         )
         
-        print(f"   Score: 8.0/10 (placeholder)")
+        log.append(f"   Score: 8.0/10 (placeholder)")
+    
+    sys.stdout.write("\n".join(log) + "\n")
+    
+    await pool.run(lambda d: d.save_scoring_results(scoring_rows))
     
     # Track scoring statistics
-    scored_count = len([a for a in relevant_articles if a.get('overall_score') is not None])
-    avg_score = sum(a.get('overall_score', 0) for a in relevant_articles) / max(len(relevant_articles), 1)
-    high_quality = len([a for a in relevant_articles if a.get('overall_score', 0) > 7])
+    scored_count = high_quality = 0
+    total_score = 0.0
+    for a in by_id.values():
+        score = a.get('overall_score')
+        if score is not None:
+            scored_count += 1
+            total_score += score
+            if score > 7:
+                high_quality += 1
+    avg_score = total_score / max(scored_count, 1)
     
     phase_stats['scoring'] = {
         'total': scored_count,
@@ -177,11 +339,17 @@ def process_batch(
     print("PHASE 3: Final Selection")
     print(f"{'='*40}")
     
-    scored_articles = db.get_relevant_articles()
+    # Reuse the Phase 2 rows, ordered like get_relevant_articles (score desc);
+    # articles whose scoring failed have no score and are left out
+    scored_articles = sorted(
+        (a for a in by_id.values() if a.get('overall_score') is not None),
+        key=lambda a: -a['overall_score']
+    )
+    top_articles = scored_articles[:max_selected]
     
     if not scored_articles:
         print("No scored articles available for selection.")
-        db.close()
+        pool.close()
         return
     
     # Process with tracked selector
@@ -207,28 +375,28 @@ def process_batch(
             'rank': idx + 1,
             'reasoning': f"Selected as top article #{idx + 1}"
         }
-        for idx, article in enumerate(scored_articles[:max_selected])
+        for idx, article in enumerate(top_articles)
     ]
     
-    db.save_selected_articles(selections, batch_id)
+    await pool.run(lambda d: d.save_selected_articles(selections, batch_id))
     
     # Track selection statistics
     phase_stats['selection'] = {
         'candidates': len(scored_articles),
         'selected': len(selections),
-        'avg_selected_score': sum(a.get('overall_score', 0) for a in scored_articles[:max_selected]) / max(len(selections), 1)
+        'avg_selected_score': sum(a['overall_score'] for a in top_articles) / max(len(selections), 1)
     }
     
     # Prepare selected articles for display
     selected_articles_display = []
-    for idx, article in enumerate(scored_articles[:max_selected]):
+    for idx, article in enumerate(top_articles):
         selected_articles_display.append({
             'rank': idx + 1,
             'title': article.get('title', 'Untitled'),
             'domain': article.get('domain', 'Unknown'),
             'url': article.get('url', ''),
             'content': article.get('content', '')[:500],
-            'overall_score': article.get('overall_score', 0),
+            'overall_score': article.get('overall_score') or 0,
             'selection_reasoning': f"Ranked #{idx + 1} based on relevance and quality scores",
             'tags': article.get('tags', [])
         })
@@ -240,7 +408,7 @@ def process_batch(
     SelectionOutputFormatter.display_selection_results(
         selected_articles=selected_articles_display,
         batch_id=batch_id,
-        total_processed=len(articles_data),
+        total_processed=len(articles),
         total_relevant=relevant_count,
         show_details=True
     )
@@ -254,7 +422,7 @@ def process_batch(
     # Export results
     if export_json:
         output_path = f"{settings.agent_response_output_dir}/selected_{batch_id}.json"
-        db.export_results_to_json(output_path)
+        await pool.run(lambda d: d.export_results_to_json(output_path))
         
         # Also save formatted report
         report_path = f"{settings.agent_response_output_dir}/selection_report_{batch_id}.json"
@@ -265,7 +433,16 @@ def process_batch(
             metadata=phase_stats
         )
     
-    db.close()
+    pool.close()
+
+
+async def run_process_batch(**kwargs):
+    """Run process_batch, then finish saving responses and release the shared LLM HTTP client."""
+    try:
+        await process_batch(**kwargs)
+    finally:
+        await adrain_response_writers()
+        await close_http_client()
 
 
 def load_csv(csv_path: str):
@@ -313,6 +490,34 @@ def main():
         action="store_true",
         help="Don't export results to JSON"
     )
+    process_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Maximum concurrent agent calls (default: MAX_CONCURRENT_LLM_CALLS setting)"
+    )
+    process_parser.add_argument(
+        "--rpm",
+        type=int,
+        default=None,
+        help="Maximum agent requests per minute, 0 to disable (default: LLM_REQUESTS_PER_MINUTE setting)"
+    )
+    process_parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Run first pass filtering through the Gemini Batch API (cheaper, higher latency)"
+    )
+    process_parser.add_argument(
+        "--articles-per-call",
+        type=int,
+        default=None,
+        help="Articles classified per first pass call, 1 to disable packing (default: FIRST_PASS_ARTICLES_PER_CALL setting)"
+    )
+    process_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Score and select from all relevant articles in the database, not just this batch"
+    )
     
     # Load command
     load_parser = subparsers.add_parser("load", help="Load articles from CSV")
@@ -335,12 +540,24 @@ def main():
     
     try:
         if args.command == "process":
-            process_batch(
+            # Settings-backed defaults are resolved only now, so --help never loads settings
+            if args.max_concurrency is None:
+                args.max_concurrency = settings.max_concurrent_llm_calls
+            if args.rpm is None:
+                args.rpm = settings.llm_requests_per_minute
+            if args.articles_per_call is None:
+                args.articles_per_call = settings.first_pass_articles_per_call
+            asyncio.run(run_process_batch(
                 batch_size=args.batch_size,
                 max_selected=args.max_selected,
                 debug=args.debug,
-                export_json=not args.no_export
-            )
+                export_json=not args.no_export,
+                max_concurrency=args.max_concurrency,
+                rpm=args.rpm,
+                batch_api=args.batch_api,
+                resume=args.resume,
+                articles_per_call=args.articles_per_call
+            ))
         elif args.command == "load":
             load_csv(args.csv_file)
     except Exception as e:
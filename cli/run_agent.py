@@ -2,6 +2,7 @@
 """CLI for running article selector agents."""
 
 import json
+import orjson
 import argparse
 from typing import Optional, Dict, Any
 from pathlib import Path
@@ -11,30 +12,53 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.agents import agent_registry
+from projects.article_selector.agents import get_first_pass_agent, get_scoring_agent
 from projects.article_selector.models import Article
 
 
+FIRST_PASS_TMPL = """Evaluate this article:
+Title: {title}
+Content: {content}
+Domain: {domain}
+URL: {url}"""
+
+SCORING_TMPL = """Score this article that passed first-pass filtering:
+Title: {title}
+Content: {content}
+Domain: {domain}
+URL: {url}
+First-pass reasoning: {first_pass_reasoning}"""
+
+
+class _Default(dict):
+    """Template mapping that renders missing fields as 'N/A'."""
+    
+    def __missing__(self, key: str) -> str:
+        return 'N/A'
+
+
+def _prompt_fields(article: Article) -> _Default:
+    """Build the template mapping for an article, skipping unset fields."""
+    fields = _Default((k, v) for k, v in article.__dict__.items() if v is not None)
+    fields.setdefault('domain', 'Unknown')
+    return fields
+
+
 def load_json_file(filepath: str) -> Dict[str, Any]:
     """Load JSON data from a file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def run_first_pass_agent(input_data: Dict[str, Any], debug: bool = False):
     """Run the first pass filtering agent."""
-    from projects.article_selector.agents import get_first_pass_agent
-    
     agent = get_first_pass_agent(debug_mode=debug)
     
     # Create article from input
     article = Article(**input_data)
     
     # Format message for agent
-    message = f"""Evaluate this article:
-Title: {article.title}
-Content: {article.content}
-Domain: {article.domain or 'Unknown'}
-URL: {article.url or 'N/A'}"""
+    message = FIRST_PASS_TMPL.format_map(_prompt_fields(article))
     
     # Run agent
     result = agent.run(message)
@@ -43,8 +67,6 @@ URL: {article.url or 'N/A'}"""
 
 def run_scoring_agent(input_data: Dict[str, Any], debug: bool = False):
     """Run the scoring agent."""
-    from projects.article_selector.agents import get_scoring_agent
-    
     agent = get_scoring_agent(debug_mode=debug)
     
     # Extract article and reasoning
@@ -52,12 +74,9 @@ def run_scoring_agent(input_data: Dict[str, Any], debug: bool = False):
     first_pass_reasoning = input_data.get("first_pass_reasoning", "Passed initial filtering")
     
     # Format message for agent
-    message = f"""Score this article that passed first-pass filtering:
-Title: {article.title}
-Content: {article.content}
-Domain: {article.domain or 'Unknown'}
-URL: {article.url or 'N/A'}
-First-pass reasoning: {first_pass_reasoning}"""
+    fields = _prompt_fields(article)
+    fields['first_pass_reasoning'] = first_pass_reasoning
+    message = SCORING_TMPL.format_map(fields)
     
     # Run agent
     result = agent.run(message)
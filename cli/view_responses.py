@@ -2,38 +2,43 @@
 """View and analyze saved agent responses."""
 
 import argparse
-import json
+import orjson
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.response_tracker import response_tracker
+from core.response_tracker import JSON_OPTIONS, get_response_tracker
 
 
 def view_summary():
     """Display summary of all saved responses."""
-    summary = response_tracker.get_summary()
+    summary = get_response_tracker().get_summary()
+    lines = []
     
-    print("\n" + "="*60)
-    print("RESPONSE TRACKER SUMMARY")
-    print("="*60)
+    lines.append("\n" + "="*60)
+    lines.append("RESPONSE TRACKER SUMMARY")
+    lines.append("="*60)
     
-    print(f"\nTotal Responses: {summary['total_responses']}")
+    lines.append(f"\nTotal Responses: {summary['total_responses']}")
     
-    print("\nResponses by Agent:")
+    lines.append("\nResponses by Agent:")
     for agent_type, count in summary['by_agent'].items():
-        print(f"  {agent_type:20} {count:5} files")
+        lines.append(f"  {agent_type:20} {count:5} files")
     
     if summary['latest_files']:
-        print("\nLatest Files:")
+        lines.append("\nLatest Files:")
         for file_info in summary['latest_files']:
-            print(f"\n  Agent: {file_info['agent']}")
-            print(f"  File:  {Path(file_info['file']).name}")
-            print(f"  Time:  {file_info['modified']}")
+            lines.append(f"\n  Agent: {file_info['agent']}")
+            lines.append(f"  File:  {Path(file_info['file']).name}")
+            lines.append(f"  Time:  {file_info['modified']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def list_responses(
@@ -48,7 +53,7 @@ def list_responses(
         article_id: Filter by article ID
         limit: Maximum files to show
     """
-    files = response_tracker.get_response_files(
+    files = get_response_tracker().scan_response_files(
         agent_type=agent_type,
         article_id=article_id,
         limit=limit
@@ -58,111 +63,142 @@ def list_responses(
         print("No response files found.")
         return
     
-    print(f"\nFound {len(files)} response file(s):")
-    print("-" * 60)
+    lines = [f"\nFound {len(files)} response file(s):", "-" * 60]
     
-    for filepath in files:
+    for filepath, size, mtime in files:
         path = Path(filepath)
-        stat = path.stat()
-        size_kb = stat.st_size / 1024
-        modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+        size_kb = size / 1024
+        modified = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime))
         
-        print(f"\n📄 {path.name}")
-        print(f"   Size: {size_kb:.1f} KB")
-        print(f"   Modified: {modified}")
-        print(f"   Path: {path.parent.name}/{path.name}")
+        lines.append(f"\n📄 {path.name}")
+        lines.append(f"   Size: {size_kb:.1f} KB")
+        lines.append(f"   Modified: {modified}")
+        lines.append(f"   Path: {path.parent.name}/{path.name}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def view_response(filepath: str, show_input: bool = True, show_output: bool = True):
-    """View a specific response file.
+def _format_record(data: dict, show_input: bool, show_output: bool) -> list:
+    """Format one interaction record for display.
     
     Args:
-        filepath: Path to response file
+        data: Interaction record
         show_input: Show input data
         show_output: Show output data
-    """
-    # Handle relative paths
-    if not Path(filepath).is_absolute():
-        # Try to find in output directory
-        possible_paths = [
-            Path(filepath),
-            Path(response_tracker.output_dir) / filepath,
-        ]
-        
-        # Check each agent directory
-        for agent_dir in response_tracker.agent_dirs.values():
-            possible_paths.append(agent_dir / filepath)
         
-        for path in possible_paths:
-            if path.exists():
-                filepath = str(path)
-                break
-        else:
-            print(f"Error: File not found: {filepath}")
-            sys.exit(1)
-    
-    # Check if it's a text file (sanity check input)
-    if filepath.endswith('.txt'):
-        print(f"\n{'='*60}")
-        print(f"SANITY CHECK INPUT: {Path(filepath).name}")
-        print('='*60)
-        with open(filepath, 'r') as f:
-            print(f.read())
-        return
-    
-    # Load JSON response
-    try:
-        data = response_tracker.load_response(filepath)
-    except Exception as e:
-        print(f"Error loading file: {e}")
-        sys.exit(1)
-    
-    print(f"\n{'='*60}")
-    print(f"RESPONSE FILE: {Path(filepath).name}")
-    print('='*60)
+    Returns:
+        Output lines
+    """
+    lines = []
     
     # Display metadata
-    print(f"\nAgent Type: {data.get('agent_type', 'Unknown')}")
-    print(f"Timestamp:  {data.get('timestamp', 'Unknown')}")
+    lines.append(f"\nAgent Type: {data.get('agent_type', 'Unknown')}")
+    lines.append(f"Timestamp:  {data.get('timestamp', 'Unknown')}")
     
     if 'article_id' in data:
-        print(f"Article ID: {data['article_id']}")
+        lines.append(f"Article ID: {data['article_id']}")
     if 'batch_id' in data:
-        print(f"Batch ID:   {data['batch_id']}")
+        lines.append(f"Batch ID:   {data['batch_id']}")
     
     # Display metadata
     if data.get('metadata'):
-        print("\nMetadata:")
+        lines.append("\nMetadata:")
         for key, value in data['metadata'].items():
-            print(f"  {key}: {value}")
+            lines.append(f"  {key}: {value}")
     
     # Display input
     if show_input and 'input' in data:
-        print("\n" + "-"*40)
-        print("INPUT:")
-        print("-"*40)
+        lines.append("\n" + "-"*40)
+        lines.append("INPUT:")
+        lines.append("-"*40)
         
         input_data = data['input']
         if isinstance(input_data, dict):
             for key, value in input_data.items():
-                if key == 'content' and len(str(value)) > 500:
-                    print(f"{key}: {str(value)[:500]}...")
+                if key == 'content' and isinstance(value, str) and len(value) > 500:
+                    lines.append(f"{key}: {value[:500]}...")
                 else:
-                    print(f"{key}: {value}")
+                    lines.append(f"{key}: {value}")
         else:
-            print(input_data)
+            lines.append(str(input_data))
     
     # Display output
     if show_output and 'output' in data:
-        print("\n" + "-"*40)
-        print("OUTPUT:")
-        print("-"*40)
+        lines.append("\n" + "-"*40)
+        lines.append("OUTPUT:")
+        lines.append("-"*40)
         
         output_data = data['output']
         if isinstance(output_data, dict):
-            print(json.dumps(output_data, indent=2))
+            lines.append(orjson.dumps(output_data, option=JSON_OPTIONS).decode())
         else:
-            print(output_data)
+            lines.append(str(output_data))
+    
+    return lines
+
+
+def view_response(filepath: str, show_input: bool = True, show_output: bool = True):
+    """View a specific response file.
+    
+    Args:
+        filepath: Path to response file
+        show_input: Show input data
+        show_output: Show output data
+    """
+    # Handle relative paths
+    if not Path(filepath).is_absolute() and not Path(filepath).exists():
+        # Look the name up in the tracker's output directories
+        path = get_response_tracker().find_response_file(filepath)
+        if path is None:
+            print(f"Error: File not found: {filepath}")
+            sys.exit(1)
+        filepath = str(path)
+    
+    # Check if it's a text file (sanity check input)
+    if filepath.endswith('.txt'):
+        with open(filepath, 'r') as f:
+            text = f.read()
+        sys.stdout.write(f"\n{'='*60}\nSANITY CHECK INPUT: {Path(filepath).name}\n{'='*60}\n{text}\n")
+        return
+    
+    # Load JSON response, keeping only the sections we display
+    keys = ['agent_type', 'timestamp', 'article_id', 'batch_id', 'metadata']
+    if show_input:
+        keys.append('input')
+    if show_output:
+        keys.append('output')
+    
+    try:
+        records = get_response_tracker().load_response_records(filepath, keys=keys)
+    except Exception as e:
+        print(f"Error loading file: {e}")
+        sys.exit(1)
+    
+    lines = [f"\n{'='*60}", f"RESPONSE FILE: {Path(filepath).name}", '='*60]
+    
+    if filepath.endswith('.jsonl'):
+        # Batch file: render each interaction in turn
+        lines.append(f"\n{len(records)} record(s)")
+        for idx, data in enumerate(records, 1):
+            lines.append(f"\n{'#'*60}\nRECORD {idx}/{len(records)}\n{'#'*60}")
+            lines.extend(_format_record(data, show_input, show_output))
+    else:
+        lines.extend(_format_record(records[0], show_input, show_output))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _parse_response(filepath: str, raw: bytes) -> dict:
+    """Parse a response file, folding a JSONL batch file into one comparable record."""
+    if not filepath.endswith('.jsonl'):
+        return orjson.loads(raw)
+    
+    records = [orjson.loads(line) for line in raw.splitlines() if line.strip()]
+    return {
+        'agent_type': records[0].get('agent_type') if records else None,
+        'timestamp': records[-1].get('timestamp') if records else None,
+        'output': [record.get('output') for record in records],
+    }
 
 
 def compare_responses(file1: str, file2: str):
@@ -173,8 +209,11 @@ def compare_responses(file1: str, file2: str):
         file2: Second file path
     """
     try:
-        data1 = response_tracker.load_response(file1)
-        data2 = response_tracker.load_response(file2)
+        raw1 = Path(file1).read_bytes()
+        raw2 = Path(file2).read_bytes()
+        data1 = _parse_response(file1, raw1)
+        # Byte-identical files need only one parse
+        data2 = data1 if raw1 == raw2 else _parse_response(file2, raw2)
     except Exception as e:
         print(f"Error loading files: {e}")
         sys.exit(1)
@@ -212,20 +251,34 @@ def clean_old_responses(days: int = 7, dry_run: bool = True):
         days: Remove files older than this many days
         dry_run: If True, only show what would be deleted
     """
-    import time
-    
     cutoff_time = time.time() - (days * 24 * 3600)
     files_to_delete = []
     total_size = 0
     
-    for agent_dir in response_tracker.agent_dirs.values():
-        if not agent_dir.exists():
-            continue
-        
-        for filepath in agent_dir.glob("*"):
-            if filepath.stat().st_mtime < cutoff_time:
-                files_to_delete.append(filepath)
-                total_size += filepath.stat().st_size
+    def scan(agent_dir):
+        paths = []
+        size = 0
+        try:
+            with os.scandir(agent_dir) as it:
+                for entry in it:
+                    # Skip non-response entries before paying for a stat
+                    if not entry.name.endswith((".json", ".jsonl", ".txt")):
+                        continue
+                    # One stat per entry, reused for mtime and size
+                    st = entry.stat()
+                    if st.st_mtime < cutoff_time:
+                        paths.append(entry.path)
+                        size += st.st_size
+        except FileNotFoundError:
+            pass
+        return paths, size
+    
+    # Directory scans are independent and IO-bound, so walk them in parallel
+    agent_dirs = list(get_response_tracker().agent_dirs.values())
+    with ThreadPoolExecutor(max_workers=min(8, len(agent_dirs) or 1)) as executor:
+        for paths, size in executor.map(scan, agent_dirs):
+            files_to_delete.extend(paths)
+            total_size += size
     
     if not files_to_delete:
         print(f"No files older than {days} days found.")
@@ -237,13 +290,13 @@ def clean_old_responses(days: int = 7, dry_run: bool = True):
     if dry_run:
         print("\nFiles that would be deleted:")
         for filepath in files_to_delete[:10]:
-            print(f"  - {filepath.name}")
+            print(f"  - {os.path.basename(filepath)}")
         if len(files_to_delete) > 10:
             print(f"  ... and {len(files_to_delete) - 10} more")
         print("\nRun with --confirm to actually delete files")
     else:
         for filepath in files_to_delete:
-            filepath.unlink()
+            os.unlink(filepath)
         print(f"✅ Deleted {len(files_to_delete)} files")
 
 
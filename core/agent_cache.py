@@ -0,0 +1,159 @@
+"""Persistent exact-match cache of agent responses, shared across runs."""
+
+import asyncio
+import functools
+import hashlib
+import time
+from typing import Any, Optional
+
+from agno.agent import Agent
+from agno.models.message import Message
+from agno.run.response import RunResponse
+
+from core.settings import settings
+from core.sqlite_store import SQLiteStore
+
+
+class AgentCache(SQLiteStore):
+    """Maps a hash of (agent, prompt) to the agent's text response in SQLite.
+
+    Feeds repeat articles from run to run, so an identical prompt to the same
+    agent configuration is answered from disk instead of another LLM call.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite database file path
+        """
+        super().__init__(path, ["""
+            CREATE TABLE IF NOT EXISTS agent_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+        """])
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[str]:
+        """Get the cached response for a key.
+
+        Args:
+            key: Cache key from agent_cache_key
+            max_age: Ignore entries older than this many seconds
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        min_created = time.time() - max_age if max_age is not None else 0.0
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value FROM agent_cache WHERE key = ? AND created >= ?",
+                (key, min_created)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: str):
+        """Store a response, replacing any previous one for the key.
+
+        Args:
+            key: Cache key from agent_cache_key
+            value: Response text
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO agent_cache (key, value, created) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+
+    def evict(self, max_age: float):
+        """Delete entries older than max_age seconds.
+
+        Args:
+            max_age: Maximum entry age in seconds
+        """
+        with self._lock:
+            self.conn.execute("DELETE FROM agent_cache WHERE created < ?", (time.time() - max_age,))
+
+
+@functools.lru_cache(maxsize=1)
+def get_agent_cache() -> Optional[AgentCache]:
+    """Get the shared agent cache configured by AGENT_CACHE_PATH.
+
+    Returns:
+        AgentCache instance, or None when caching is disabled
+    """
+    if not settings.agent_cache_path:
+        return None
+    cache = AgentCache(settings.agent_cache_path)
+    cache.evict(settings.agent_cache_max_age)
+    return cache
+
+
+AgentCache._shared_getter = staticmethod(get_agent_cache)
+
+
+def agent_cache_key(agent: Agent, prompt: str) -> str:
+    """Hash an agent's identity, model and instructions together with a prompt.
+
+    Editing an agent's instructions or switching its model changes the key, so
+    stale responses are never reused.
+
+    Args:
+        agent: Agent the prompt is sent to
+        prompt: User prompt
+
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (agent.agent_id or agent.name or "", agent.model.id, str(agent.instructions), prompt):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def run_with_cache(agent: Agent, prompt: str) -> Any:
+    """Run an agent on a user prompt, answering repeated prompts from the agent cache.
+
+    Args:
+        agent: Agent to run
+        prompt: User prompt
+
+    Returns:
+        The agent's RunResponse (rebuilt with just the content on a cache hit)
+    """
+    cache = get_agent_cache()
+    key = agent_cache_key(agent, prompt) if cache is not None else None
+    if key is not None:
+        cached = cache.get(key, max_age=settings.agent_cache_max_age)
+        if cached is not None:
+            return RunResponse(content=cached)
+
+    result = agent.run(messages=[Message(role="user", content=prompt)])
+    if key is not None and isinstance(result.content, str):
+        cache.put(key, result.content)
+    return result
+
+
+async def arun_with_cache(agent: Agent, prompt: str) -> Any:
+    """Async variant of run_with_cache; cache I/O runs in a worker thread.
+
+    Args:
+        agent: Agent to run
+        prompt: User prompt
+
+    Returns:
+        The agent's RunResponse (rebuilt with just the content on a cache hit)
+    """
+    cache = get_agent_cache()
+    key = agent_cache_key(agent, prompt) if cache is not None else None
+    if key is not None:
+        cached = await asyncio.to_thread(cache.get, key, settings.agent_cache_max_age)
+        if cached is not None:
+            return RunResponse(content=cached)
+
+    result = await agent.arun(messages=[Message(role="user", content=prompt)])
+    if key is not None and isinstance(result.content, str):
+        await asyncio.to_thread(cache.put, key, result.content)
+    return result
@@ -1,8 +1,11 @@
 """Core agent infrastructure."""
 
 from .base import AgentRegistry
+from .cached_agent import CachedAgent
+from .http_client import close_http_client, gemini_client_params, get_gemini, get_http_client
+from .prompt_cache import get_cached_content
 
 # Global agent registry
 agent_registry = AgentRegistry()
 
-__all__ = ["agent_registry"]
\ No newline at end of file
+__all__ = ["agent_registry", "CachedAgent", "close_http_client", "gemini_client_params", "get_cached_content", "get_gemini", "get_http_client"]
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Base agent classes and registry."""
 
-from typing import Dict, Callable, Optional, List, Any
+from typing import Dict, Callable, Optional, List, Any, Tuple
 from abc import ABC, abstractmethod
 
 
@@ -8,8 +8,8 @@ class AgentRegistry:
     """Registry for managing agents by category."""
     
     def __init__(self):
-        self._agents: Dict[str, Dict[str, Callable]] = {}
-        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._agents: Dict[Tuple[str, str], Callable] = {}
+        self._metadata: Dict[Tuple[str, str], Dict[str, Any]] = {}
     
     def register_agent(
         self, 
@@ -28,12 +28,9 @@ class AgentRegistry:
             description: Optional description of the agent
             **metadata: Additional metadata for the agent
         """
-        if category not in self._agents:
-            self._agents[category] = {}
-            self._metadata[category] = {}
-        
-        self._agents[category][agent_id] = factory
-        self._metadata[category][agent_id] = {
+        key = (category, agent_id)
+        self._agents[key] = factory
+        self._metadata[key] = {
             "description": description,
             **metadata
         }
@@ -48,7 +45,7 @@ class AgentRegistry:
         Returns:
             Agent factory function or None if not found
         """
-        return self._agents.get(category, {}).get(agent_id)
+        return self._agents.get((category, agent_id))
     
     def list_agents(self, category: Optional[str] = None) -> Dict[str, List[str]]:
         """List all registered agents.
@@ -59,9 +56,11 @@ class AgentRegistry:
         Returns:
             Dictionary of categories and their agent IDs
         """
-        if category:
-            return {category: list(self._agents.get(category, {}).keys())}
-        return {cat: list(agents.keys()) for cat, agents in self._agents.items()}
+        listing: Dict[str, List[str]] = {category: []} if category else {}
+        for cat, agent_id in self._agents:
+            if not category or cat == category:
+                listing.setdefault(cat, []).append(agent_id)
+        return listing
     
     def get_metadata(self, category: str, agent_id: str) -> Dict[str, Any]:
         """Get metadata for an agent.
@@ -73,4 +72,4 @@ class AgentRegistry:
         Returns:
             Agent metadata dictionary
         """
-        return self._metadata.get(category, {}).get(agent_id, {})
\ No newline at end of file
+        return self._metadata.get((category, agent_id), {})
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""Agent variant that answers near-duplicate prompts from a semantic cache."""
+
+from typing import Any, Optional
+
+from agno.agent import Agent
+
+from core.semantic_cache import SemanticCache
+
+
+class CachedAgent(Agent):
+    """Agent that skips the model call when a similar prompt was already answered.
+
+    Only non-streaming runs with text input are cached; everything else is passed
+    straight through to Agent.
+    """
+
+    semantic_cache: Optional[SemanticCache] = None
+
+    @staticmethod
+    def _cache_key(message: Any, messages: Any) -> Optional[str]:
+        """Collect the text of the user input, or None if it is not plain text."""
+        parts = []
+        for item in ([message] if message is not None else []) + list(messages or []):
+            content = item.get("content") if isinstance(item, dict) else getattr(item, "content", item)
+            if not isinstance(content, str):
+                return None
+            parts.append(content)
+        return "\n".join(parts) or None
+
+    def _lookup_key(self, message: Any, stream: Optional[bool], messages: Any) -> Optional[str]:
+        """Cache key for this run, or None when the run must bypass the cache."""
+        if self.semantic_cache is None or (stream if stream is not None else self.stream):
+            return None
+        return self._cache_key(message, messages)
+
+    def run(self, message: Any = None, *, stream: Optional[bool] = None, messages: Any = None, **kwargs: Any) -> Any:
+        key = self._lookup_key(message, stream, messages)
+        if key is not None:
+            cached = self.semantic_cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = super().run(message, stream=stream, messages=messages, **kwargs)
+        if key is not None:
+            self.semantic_cache.put(key, response)
+        return response
+
+    async def arun(self, message: Any = None, *, stream: Optional[bool] = None, messages: Any = None, **kwargs: Any) -> Any:
+        key = self._lookup_key(message, stream, messages)
+        if key is not None:
+            cached = self.semantic_cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await super().arun(message, stream=stream, messages=messages, **kwargs)
+        if key is not None:
+            self.semantic_cache.put(key, response)
+        return response
@@ -0,0 +1,58 @@
+"""Shared HTTP/2 keep-alive client and Gemini models for LLM provider calls."""
+
+import functools
+from typing import Any, Dict, Optional
+
+import httpx
+from agno.models.google import Gemini
+from google.genai import types
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client, creating it if needed.
+
+    Returns:
+        HTTP/2 client with a keep-alive pool shared by all agent calls
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=60,
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    # Shared models hold provider clients bound to the closed HTTP client
+    get_gemini.cache_clear()
+
+
+def gemini_client_params() -> Dict[str, Any]:
+    """Client params routing a Gemini model's async calls through the shared client."""
+    return {"http_options": types.HttpOptions(httpx_async_client=get_http_client())}
+
+
+@functools.lru_cache(maxsize=8)
+def get_gemini(model_id: str, cached_content: Optional[str] = None) -> Gemini:
+    """Get the process-wide Gemini model for a model ID.
+
+    Agents built for the same model share one instance, and therefore one
+    provider client, instead of each initializing their own.
+
+    Args:
+        model_id: Gemini model ID
+        cached_content: Optional cached-content resource holding the system prompt
+
+    Returns:
+        Shared Gemini model routed through the shared HTTP client
+    """
+    return Gemini(id=model_id, client_params=gemini_client_params(), cached_content=cached_content)
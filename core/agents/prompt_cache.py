@@ -0,0 +1,65 @@
+"""Server-side Gemini context caching for static agent prompts."""
+
+import hashlib
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from google import genai
+from google.genai import types
+
+# (model_id, cache_key, prompt hash) -> (cached content name or None, expiry)
+_entries: Dict[Tuple[str, str, str], Tuple[Optional[str], float]] = {}
+_lock = threading.Lock()
+
+
+def get_cached_content(
+    model_id: str,
+    cache_key: str,
+    instructions: str,
+    ttl: int = 3600,
+) -> Optional[str]:
+    """Get a Gemini cached-content entry holding an agent's static instructions.
+
+    The entry is created once per process and TTL window, so every agent built
+    with the same key reuses the server-side prefix and is billed only for
+    per-request tokens. Creation failures (e.g. a prompt below the model's
+    minimum cacheable size) are remembered for the TTL and yield None, in which
+    case the caller should send the instructions normally.
+
+    Args:
+        model_id: Gemini model the cache is bound to
+        cache_key: Name identifying the prompt (used as the cache display name)
+        instructions: Static system instructions to cache
+        ttl: Lifetime of the cache entry in seconds
+
+    Returns:
+        Cached content resource name, or None if caching is unavailable
+    """
+    key = (model_id, cache_key, hashlib.sha256(instructions.encode()).hexdigest())
+    with _lock:
+        name, expires_at = _entries.get(key, (None, 0.0))
+        # Leave a minute of headroom so in-flight requests don't hit an expired cache
+        if time.time() < expires_at - 60:
+            return name
+
+        try:
+            client = genai.Client()
+            cache = client.caches.create(
+                model=model_id,
+                config=types.CreateCachedContentConfig(
+                    display_name=cache_key,
+                    system_instruction=(
+                        f"{instructions}\n\nThe current date is {datetime.now():%Y-%m-%d}."
+                    ),
+                    ttl=f"{ttl}s",
+                ),
+            )
+            name = cache.name
+        except Exception as e:
+            print(f"⚠️  Prompt caching unavailable for {cache_key}: {e}")
+            name = None
+
+        _entries[key] = (name, time.time() + ttl)
+        return name
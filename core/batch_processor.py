@@ -0,0 +1,46 @@
+"""Bounded-concurrency, rate-limited execution of async agent calls."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List
+
+
+class BatchProcessor:
+    """Runs an async callable over a batch of inputs without exceeding provider limits."""
+
+    async def run_batch(
+        self,
+        coro_fn: Callable[[Any], Awaitable[Any]],
+        inputs: Iterable[Any],
+        max_concurrency: int = 10,
+        rpm: int = 100,
+    ) -> List[Any]:
+        """Run coro_fn for every input with a concurrency cap and a request rate limit.
+
+        Args:
+            coro_fn: Async callable invoked once per input
+            inputs: Inputs to process
+            max_concurrency: Maximum number of in-flight calls
+            rpm: Maximum requests started per minute (0 disables rate limiting)
+
+        Returns:
+            Results in input order; failed calls are returned as exceptions
+        """
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+        interval = 60.0 / rpm if rpm > 0 else 0.0
+        loop = asyncio.get_running_loop()
+        next_slot = loop.time()
+
+        async def _run(item: Any) -> Any:
+            nonlocal next_slot
+            async with sem:
+                # Reserve the next start slot; no await between read and update
+                now = loop.time()
+                slot = max(now, next_slot)
+                next_slot = slot + interval
+                await asyncio.sleep(max(0.0, slot - now))
+                return await coro_fn(item)
+
+        return await asyncio.gather(
+            *[_run(item) for item in inputs],
+            return_exceptions=True
+        )
@@ -1,12 +1,20 @@
 """Database connection and management for DuckDB/MotherDuck."""
 
+import copy
+import functools
 import os
+from contextlib import contextmanager
 import duckdb
-from typing import Optional, List, Dict, Any
+import orjson
+import pyarrow as pa
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
 from pathlib import Path
 import pandas as pd
 from datetime import datetime
 
+# Bump whenever _init_tables changes so existing databases pick up the new DDL
+SCHEMA_VERSION = 1
+
 
 class ArticleDatabase:
     """Manages article storage in DuckDB/MotherDuck."""
@@ -27,6 +35,7 @@ class ArticleDatabase:
             use_motherduck: Whether to use MotherDuck (cloud) or local DuckDB
         """
         self.use_motherduck = use_motherduck
+        self._in_transaction = False
         
         if use_motherduck and motherduck_token:
             # Connect to MotherDuck
@@ -43,7 +52,16 @@ class ArticleDatabase:
         self._init_tables()
     
     def _init_tables(self):
-        """Initialize database tables if they don't exist."""
+        """Initialize database tables if they don't exist.
+        
+        Skipped when the database already records the current SCHEMA_VERSION.
+        """
+        try:
+            row = self.conn.execute("SELECT max(version) FROM schema_version").fetchone()
+            if row and row[0] is not None and row[0] >= SCHEMA_VERSION:
+                return
+        except duckdb.CatalogException:
+            pass
         
         # Articles table
         self.conn.execute("""
@@ -102,74 +120,133 @@ class ArticleDatabase:
                 FOREIGN KEY (article_id) REFERENCES articles(id)
             )
         """)
+        
+        # Indexes on join and filter columns
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_fp_article ON first_pass_results(article_id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_sr_article ON scoring_results(article_id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_sa_article ON selected_articles(article_id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_fp_status ON first_pass_results(status)")
+        
+        # First pass result cache keyed by article content hash
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS first_pass_cache (
+                content_hash VARCHAR PRIMARY KEY,
+                status VARCHAR,
+                reasoning TEXT,
+                cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Record the schema version so later connections skip the DDL above
+        self.conn.execute("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER)")
+        self.conn.execute("INSERT INTO schema_version VALUES (?)", [SCHEMA_VERSION])
     
     def load_articles_from_csv(self, csv_path: str) -> int:
         """Load articles from CSV file.
         
+        The CSV is read by DuckDB directly; columns missing from the file are
+        filled with defaults in the same SELECT.
+        
         Args:
             csv_path: Path to CSV file
             
         Returns:
             Number of articles loaded
         """
-        df = pd.read_csv(csv_path)
-        
-        # Map CSV columns to database columns
-        column_mapping = {
-            'ID': 'id',
-            'Title': 'title',
-            'URL': 'url',
-            'Domain': 'domain',
-            'Content': 'content',
+        defaults = {
+            'published_date': 'CURRENT_TIMESTAMP',
+            'author': 'NULL',
+            'tags': 'NULL',
+            'metadata': 'NULL',
+            'created_at': 'CURRENT_TIMESTAMP',
         }
         
-        df = df.rename(columns=column_mapping)
-        
-        # Add missing columns with default values
-        if 'published_date' not in df.columns:
-            df['published_date'] = datetime.now()
-        if 'author' not in df.columns:
-            df['author'] = None
-        if 'tags' not in df.columns:
-            df['tags'] = None
-        if 'metadata' not in df.columns:
-            df['metadata'] = None
-        if 'created_at' not in df.columns:
-            df['created_at'] = datetime.now()
-        
-        # Select only the columns we need in the correct order
-        columns_order = ['id', 'title', 'url', 'domain', 'content', 
-                        'published_date', 'author', 'tags', 'metadata', 'created_at']
-        df = df[columns_order]
+        # Sniff the header only, to see which columns the file provides; header
+        # names match case-insensitively, so both "ID"/"Title" and "id"/"title" work
+        csv_columns = {
+            row[0].lower(): row[0] for row in self.conn.execute(
+                "DESCRIBE SELECT * FROM read_csv_auto(?, header=true)", [csv_path]
+            ).fetchall()
+        }
+        
+        select_list = []
+        for column in ['id', 'title', 'url', 'domain', 'content']:
+            source = csv_columns.get(column)
+            select_list.append(f'"{source}"' if source else 'NULL')
+        for column, default in defaults.items():
+            source = csv_columns.get(column)
+            select_list.append(f'"{source}"' if source else default)
         
         # Insert into database
-        self.conn.execute("INSERT OR REPLACE INTO articles SELECT * FROM df")
+        count = self.conn.execute(f"""
+            INSERT OR REPLACE INTO articles
+            SELECT {", ".join(select_list)}
+            FROM read_csv_auto(?, header=true)
+        """, [csv_path]).fetchone()[0]
         
-        count = len(df)
         print(f"Loaded {count} articles from {csv_path}")
         return count
     
-    def get_unprocessed_articles(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def _query_unprocessed(
+        self,
+        limit: int,
+        columns: Sequence[str],
+        max_content_chars: int
+    ) -> duckdb.DuckDBPyConnection:
+        """Execute the unprocessed-articles query projecting only the given columns."""
+        select_list = ", ".join(
+            f"substr(a.content, 1, {int(max_content_chars)}) AS content" if column == "content" else f"a.{column}"
+            for column in columns
+        )
+        return self.conn.execute(f"""
+            SELECT {select_list}
+            FROM articles a
+            WHERE NOT EXISTS (
+                SELECT 1 FROM first_pass_results fp WHERE fp.article_id = a.id
+            )
+            LIMIT ?
+        """, [limit])
+    
+    def get_unprocessed_articles(
+        self,
+        limit: int = 50,
+        max_content_chars: int = 5000,
+        columns: Sequence[str] = ("id", "title", "url", "domain", "content", "published_date", "tags")
+    ) -> List[Dict[str, Any]]:
         """Get articles that haven't been processed yet.
         
         Args:
             limit: Maximum number of articles to return
+            max_content_chars: Content is truncated in SQL to this many characters
+            columns: Article columns to select
             
         Returns:
             List of article dictionaries
         """
-        result = self.conn.execute("""
-            SELECT a.* 
-            FROM articles a
-            LEFT JOIN first_pass_results fp ON a.id = fp.article_id
-            WHERE fp.id IS NULL
-            LIMIT ?
-        """, [limit]).fetchall()
+        return self._query_unprocessed(limit, columns, max_content_chars).fetch_arrow_table().to_pylist()
+    
+    def iter_unprocessed_articles(
+        self,
+        limit: int = 50,
+        columns: Sequence[str] = ("id", "title", "content", "url", "domain"),
+        rows_per_batch: int = 1000,
+        max_content_chars: int = 5000
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream unprocessed articles as Arrow record batches.
         
-        columns = ['id', 'title', 'url', 'domain', 'content', 'published_date', 
-                   'author', 'tags', 'metadata', 'created_at']
+        Only the requested columns are projected, and rows are never
+        materialized as Python tuples or dicts.
         
-        return [dict(zip(columns, row)) for row in result]
+        Args:
+            limit: Maximum number of articles to return
+            columns: Article columns to select
+            rows_per_batch: Rows per record batch
+            max_content_chars: Content is truncated in SQL to this many characters
+        
+        Yields:
+            Record batches with the requested columns
+        """
+        yield from self._query_unprocessed(limit, columns, max_content_chars).fetch_record_batch(rows_per_batch)
     
     def save_first_pass_result(
         self,
@@ -191,6 +268,17 @@ class ArticleDatabase:
             VALUES (?, ?, ?, ?)
         """, [article_id, status, reasoning, confidence])
     
+    def save_first_pass_results(self, rows: List[Tuple[int, str, str]]):
+        """Save many first pass results in one transaction.
+        
+        Args:
+            rows: (article_id, status, reasoning) tuples
+        """
+        self._insert_rows("""
+            INSERT INTO first_pass_results (article_id, status, reasoning)
+            SELECT * FROM df
+        """, rows, ['article_id', 'status', 'reasoning'])
+    
     def save_scoring_result(
         self,
         article_id: int,
@@ -220,6 +308,21 @@ class ArticleDatabase:
         """, [article_id, relevance_score, quality_score, impact_score,
               overall_score, reasoning, recommendation])
     
+    def save_scoring_results(self, rows: List[Tuple[int, float, float, float, float, str, str]]):
+        """Save many scoring results in one transaction.
+        
+        Args:
+            rows: (article_id, relevance_score, quality_score, impact_score,
+                overall_score, reasoning, recommendation) tuples
+        """
+        self._insert_rows("""
+            INSERT INTO scoring_results 
+            (article_id, relevance_score, quality_score, impact_score, 
+             overall_score, reasoning, recommendation)
+            SELECT * FROM df
+        """, rows, ['article_id', 'relevance_score', 'quality_score', 'impact_score',
+                    'overall_score', 'reasoning', 'recommendation'])
+    
     def save_selected_articles(
         self,
         selections: List[Dict[str, Any]],
@@ -234,21 +337,85 @@ class ArticleDatabase:
         if not batch_id:
             batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        for selection in selections:
-            self.conn.execute("""
-                INSERT INTO selected_articles (article_id, rank, selection_reasoning, batch_id)
-                VALUES (?, ?, ?, ?)
-            """, [selection['article_id'], selection['rank'], 
-                  selection.get('reasoning', ''), batch_id])
+        self._insert_rows("""
+            INSERT INTO selected_articles (article_id, rank, selection_reasoning, batch_id)
+            SELECT * FROM df
+        """, [(selection['article_id'], selection['rank'],
+               selection.get('reasoning', ''), batch_id)
+              for selection in selections],
+            ['article_id', 'rank', 'selection_reasoning', 'batch_id'])
+    
+    def get_cached_first_pass(self, content_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up cached first pass results by article content hash.
+        
+        Args:
+            content_hashes: SHA-256 hashes of article title + content
+            
+        Returns:
+            Mapping of content hash to cached status and reasoning
+        """
+        if not content_hashes:
+            return {}
+        
+        result = self.conn.execute("""
+            SELECT content_hash, status, reasoning
+            FROM first_pass_cache
+            WHERE content_hash IN (SELECT UNNEST(?))
+        """, [content_hashes]).fetchall()
+        
+        return {
+            content_hash: {"status": status, "reasoning": reasoning}
+            for content_hash, status, reasoning in result
+        }
+    
+    def put_cached_first_pass(self, content_hash: str, status: str, reasoning: str):
+        """Cache a first pass result by article content hash.
+        
+        Args:
+            content_hash: SHA-256 hash of article title + content
+            status: Relevant or Irrelevant
+            reasoning: Explanation for the decision
+        """
+        self.conn.execute("""
+            INSERT OR REPLACE INTO first_pass_cache (content_hash, status, reasoning, cached_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        """, [content_hash, status, reasoning])
+    
+    def put_cached_first_pass_many(self, rows: List[Tuple[str, str, str]]):
+        """Cache many first pass results in one transaction.
+        
+        Args:
+            rows: (content_hash, status, reasoning) tuples
+        """
+        self._insert_rows("""
+            INSERT OR REPLACE INTO first_pass_cache (content_hash, status, reasoning, cached_at)
+            SELECT *, CURRENT_TIMESTAMP FROM df
+        """, rows, ['content_hash', 'status', 'reasoning'])
+    
+    def evict_first_pass_cache(self, max_age_days: int = 30):
+        """Remove cached first pass results older than max_age_days.
+        
+        Args:
+            max_age_days: Maximum age of cache entries to keep
+        """
+        self.conn.execute("""
+            DELETE FROM first_pass_cache
+            WHERE cached_at < CURRENT_TIMESTAMP - to_days(?)
+        """, [max_age_days])
     
     def get_relevant_articles(self) -> List[Dict[str, Any]]:
         """Get all articles marked as relevant in first pass.
         
+        Scoring columns are listed explicitly so scoring_results.id never
+        shadows the article id.
+        
         Returns:
             List of relevant articles with their scores
         """
         result = self.conn.execute("""
-            SELECT a.*, fp.reasoning as first_pass_reasoning, sr.*
+            SELECT a.*, fp.reasoning as first_pass_reasoning,
+                   sr.relevance_score, sr.quality_score, sr.impact_score,
+                   sr.overall_score, sr.reasoning, sr.recommendation
             FROM articles a
             JOIN first_pass_results fp ON a.id = fp.article_id
             LEFT JOIN scoring_results sr ON a.id = sr.article_id
@@ -264,29 +431,109 @@ class ArticleDatabase:
     def export_results_to_json(self, output_path: str):
         """Export selected articles to JSON file.
         
+        Rows are written by DuckDB's COPY directly, then re-indented for readability.
+        
         Args:
             output_path: Path for output JSON file
         """
-        result = self.conn.execute("""
-            SELECT a.*, sa.rank, sa.selection_reasoning, sa.batch_id,
-                   sr.overall_score, sr.reasoning as score_reasoning
-            FROM selected_articles sa
-            JOIN articles a ON sa.article_id = a.id
-            LEFT JOIN scoring_results sr ON a.id = sr.article_id
-            ORDER BY sa.batch_id DESC, sa.rank
-        """).df()
-        
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        result.to_json(output_path, orient='records', indent=2)
+        escaped_path = str(output_path).replace("'", "''")
+        self.conn.execute(f"""
+            COPY (
+                SELECT a.*, sa.rank, sa.selection_reasoning, sa.batch_id,
+                       sr.overall_score, sr.reasoning as score_reasoning
+                FROM selected_articles sa
+                JOIN articles a ON sa.article_id = a.id
+                LEFT JOIN scoring_results sr ON a.id = sr.article_id
+                ORDER BY sa.batch_id DESC, sa.rank
+            ) TO '{escaped_path}' (FORMAT JSON, ARRAY true)
+        """)
+        
+        # Pretty-print to match the previous export layout
+        path = Path(output_path)
+        path.write_bytes(orjson.dumps(orjson.loads(path.read_bytes()), option=orjson.OPT_INDENT_2))
         print(f"Exported results to {output_path}")
     
+    def ingest_response_dir(self, glob_path: str):
+        """Expose saved agent response files as the ``raw_responses`` view.
+        
+        DuckDB parses the matched files in parallel, so analytics over saved
+        responses run as SQL instead of loading each file in Python.
+        
+        Args:
+            glob_path: Glob matching response JSON files (e.g. 'agent_responses/**/*.json')
+        """
+        escaped_glob = str(glob_path).replace("'", "''")
+        self.conn.execute(f"""
+            CREATE OR REPLACE VIEW raw_responses AS
+            SELECT * FROM read_json_auto('{escaped_glob}', filename=true, union_by_name=true)
+        """)
+    
+    def _insert_rows(self, query: str, rows: List[Tuple], columns: List[str]):
+        """Bulk insert rows as one vectorized statement inside a single transaction.
+        
+        Args:
+            query: INSERT statement selecting from ``df``, the rows registered as a view
+            rows: Row tuples in the order of ``columns``
+            columns: Column names for the DataFrame
+        """
+        if not rows:
+            return
+        
+        self.conn.register("df", pd.DataFrame(rows, columns=columns))
+        try:
+            with self.transaction():
+                self.conn.execute(query)
+        finally:
+            self.conn.unregister("df")
+    
+    @contextmanager
+    def transaction(self) -> Iterator["ArticleDatabase"]:
+        """Group several writes into one transaction, e.g. a loop of single-row saves.
+        
+        Nested use joins the outer transaction. Rolls back if the block raises.
+        """
+        if self._in_transaction:
+            yield self
+            return
+        
+        self.conn.begin()
+        self._in_transaction = True
+        try:
+            yield self
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+    
+    def cursor(self) -> "ArticleDatabase":
+        """Get a handle on a new cursor sharing this database connection.
+        
+        Cursors can be used from other threads, unlike the connection itself.
+        
+        Returns:
+            ArticleDatabase bound to the new cursor
+        """
+        handle = copy.copy(self)
+        handle.conn = self.conn.cursor()
+        handle._in_transaction = False
+        return handle
+    
     def close(self):
         """Close database connection."""
         self.conn.close()
+        if get_database.cache_info().currsize and get_database() is self:
+            get_database.cache_clear()
 
 
+@functools.lru_cache(maxsize=1)
 def get_database() -> ArticleDatabase:
-    """Get database instance from environment configuration.
+    """Get the shared database instance from environment configuration.
+    
+    The instance is cached for the process; closing it clears the cache so the
+    next call reconnects.
     
     Returns:
         ArticleDatabase instance
@@ -0,0 +1,66 @@
+"""Async-friendly pool of DuckDB cursors with executor offload."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional, TypeVar
+
+from core.database import ArticleDatabase
+
+T = TypeVar("T")
+
+
+class DuckDBPool:
+    """Hands out ArticleDatabase cursors and runs their blocking calls off the event loop.
+
+    DuckDB is synchronous, so every query is executed on a dedicated thread pool
+    sized to the number of cursors; the event loop only awaits the result.
+    """
+
+    def __init__(self, db: ArticleDatabase, max_size: int = 8):
+        """Initialize the pool.
+
+        Args:
+            db: Database whose connection the pooled cursors share
+            max_size: Number of cursors (and executor threads)
+        """
+        self.db = db
+        self.max_size = max_size
+        self._handles: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        for _ in range(max_size):
+            self._handles.put_nowait(db.cursor())
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=max_size,
+            thread_name_prefix="duckdb"
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ArticleDatabase]:
+        """Borrow a cursor-backed database handle for the duration of the block."""
+        handle = await self._handles.get()
+        try:
+            yield handle
+        finally:
+            self._handles.put_nowait(handle)
+
+    async def run(self, fn: Callable[[ArticleDatabase], T]) -> T:
+        """Run a blocking database call on a pooled handle in the executor.
+
+        Args:
+            fn: Callable receiving a database handle
+
+        Returns:
+            The callable's return value
+        """
+        async with self.acquire() as handle:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, handle)
+
+    def close(self):
+        """Close pooled cursors, the executor and the underlying database."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        while not self._handles.empty():
+            self._handles.get_nowait().close()
+        self.db.close()
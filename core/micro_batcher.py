@@ -0,0 +1,119 @@
+"""Server-side micro-batching of concurrent requests into shared upstream calls."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """Collects concurrently submitted items into size/time-capped batches.
+
+    Each batch is handed to ``handler`` as a list and must produce one result per
+    item, in order. Batches are dispatched as independent tasks so collection of
+    the next window continues while earlier batches are in flight.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 16,
+        max_wait: float = 0.05,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            handler: Async callable processing a list of items
+            max_batch_size: Maximum items per batch (B_max)
+            max_wait: Maximum seconds to wait for a batch to fill (tau)
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    def start(self):
+        """Start the background batching task on the running loop."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop collecting and wait for in-flight batches to finish.
+
+        Items not yet dispatched (queued or mid-collection) fail with
+        RuntimeError instead of waiting forever.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._queue is not None:
+            leftover = []
+            while not self._queue.empty():
+                leftover.append(self._queue.get_nowait())
+            self._fail(leftover, RuntimeError("MicroBatcher stopped"))
+            self._queue = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        if self._queue is None:
+            raise RuntimeError("MicroBatcher has not been started")
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, fut))
+        return await fut
+
+    async def _run(self):
+        """Pop up to max_batch_size items or wait at most max_wait, then dispatch."""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[Any, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                task = asyncio.create_task(self._dispatch(batch))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Items already pulled off the queue would otherwise never resolve
+            self._fail(batch, RuntimeError("MicroBatcher stopped"))
+            raise
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run the handler for one batch and fulfil each request's future."""
+        try:
+            results = await self.handler([item for item, _ in batch])
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():
+                fut.set_result(result)
+        if len(results) < len(batch):
+            self._fail(
+                batch[len(results):],
+                RuntimeError(f"Handler returned {len(results)} results for {len(batch)} items")
+            )
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Any, asyncio.Future]], exc: BaseException):
+        """Fail every still-pending future in a batch with exc."""
+        for _, fut in batch:
+            if not fut.done():
+                fut.set_exception(exc)
@@ -1,9 +1,43 @@
 """Output formatting for article selection results."""
 
-from typing import List, Dict, Any, Optional
+import sys
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 from pathlib import Path
-import json
+from core.response_tracker import dump_json
+
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+_SCORE_LABELS = (
+    ("relevance_score", "Relevance"),
+    ("quality_score", "Quality"),
+    ("impact_score", "Impact"),
+    ("overall_score", "Overall"),
+)
+
+# (phase key, heading, ((stat key, label, format), ...)) for the processing summary
+_PHASE_SPECS = (
+    ("first_pass", "First Pass Filtering", (
+        ("total", "Processed", "{}"),
+        ("relevant", "Relevant", "{}"),
+        ("filtered", "Filtered", "{}"),
+        ("pass_rate", "Pass Rate", "{:.1f}%"),
+    )),
+    ("scoring", "Article Scoring", (
+        ("total", "Scored", "{}"),
+        ("avg_score", "Avg Score", "{:.1f}/10"),
+        ("high_quality", "High Quality (>7)", "{}"),
+    )),
+    ("selection", "Final Selection", (
+        ("candidates", "Candidates", "{}"),
+        ("selected", "Selected", "{}"),
+        ("avg_selected_score", "Avg Selected Score", "{:.1f}/10"),
+    )),
+)
+
+# Report directories already created in this process
+_ensured_dirs: Set[Path] = set()
 
 
 class SelectionOutputFormatter:
@@ -27,74 +61,87 @@ class SelectionOutputFormatter:
             show_details: Whether to show detailed article information
         """
         # Header
-        print("\n" + "="*80)
-        print("📰 ARTICLE SELECTION RESULTS")
-        print("="*80)
+        parts = []
+        parts.append("\n" + _SEP_EQ)
+        parts.append("📰 ARTICLE SELECTION RESULTS")
+        parts.append(_SEP_EQ)
         
         # Summary statistics
         if batch_id:
-            print(f"\n🔖 Batch ID: {batch_id}")
+            parts.append(f"\n🔖 Batch ID: {batch_id}")
         
-        print(f"\n📊 Statistics:")
-        print(f"   • Total Processed: {total_processed}")
-        print(f"   • Passed First Pass: {total_relevant}")
-        print(f"   • Final Selected: {len(selected_articles)}")
-        print(f"   • Selection Rate: {len(selected_articles)/max(total_processed, 1)*100:.1f}%")
+        parts.append(f"\n📊 Statistics:")
+        parts.append(f"   • Total Processed: {total_processed}")
+        parts.append(f"   • Passed First Pass: {total_relevant}")
+        parts.append(f"   • Final Selected: {len(selected_articles)}")
+        parts.append(f"   • Selection Rate: {len(selected_articles)/max(total_processed, 1)*100:.1f}%")
         
         # Selected articles
-        print(f"\n🏆 TOP {len(selected_articles)} SELECTED ARTICLES:")
-        print("-"*80)
+        parts.append(f"\n🏆 TOP {len(selected_articles)} SELECTED ARTICLES:")
+        parts.append(_SEP_DASH)
         
         for idx, article in enumerate(selected_articles, 1):
-            SelectionOutputFormatter._display_article(idx, article, show_details)
+            parts.append(SelectionOutputFormatter._display_article(idx, article, show_details))
         
         # Footer
-        print("\n" + "="*80)
-        print("✅ SELECTION COMPLETE")
-        print("="*80)
+        parts.append("\n" + _SEP_EQ)
+        parts.append("✅ SELECTION COMPLETE")
+        parts.append(_SEP_EQ)
+        
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
     
     @staticmethod
-    def _display_article(rank: int, article: Dict[str, Any], show_details: bool = True):
-        """Display a single article with formatting.
+    def _display_article(rank: int, article: Dict[str, Any], show_details: bool = True) -> str:
+        """Format a single article for display.
         
         Args:
             rank: Article rank
             article: Article data
             show_details: Whether to show detailed information
+            
+        Returns:
+            The article's formatted lines
         """
         # Rank and title
         title = article.get('title', 'Untitled')[:100]
-        print(f"\n{rank}. {title}")
+        parts = []
+        parts.append(f"\n{rank}. {title}")
         
         # Article metadata
         domain = article.get('domain', 'Unknown')
         url = article.get('url', 'N/A')
         score = article.get('overall_score', article.get('score', 'N/A'))
         
-        print(f"   📍 Domain: {domain}")
+        parts.append(f"   📍 Domain: {domain}")
         # Don't truncate URLs - show full URL
-        print(f"   🔗 URL: {url}")
+        parts.append(f"   🔗 URL: {url}")
         
         if isinstance(score, (int, float)):
-            print(f"   ⭐ Score: {score:.1f}/10")
+            parts.append(f"   ⭐ Score: {score:.1f}/10")
         else:
-            print(f"   ⭐ Score: {score}")
+            parts.append(f"   ⭐ Score: {score}")
         
         # Show details if requested
         if show_details:
             # Selection reasoning
-            if article.get('selection_reasoning'):
-                print(f"   💭 Selection Reason: {article['selection_reasoning'][:200]}")
+            reasoning = article.get('selection_reasoning')
+            if reasoning:
+                parts.append(f"   💭 Selection Reason: {reasoning[:200]}")
             
-            # Content preview
-            if article.get('content'):
-                content_preview = article['content'][:150].replace('\n', ' ')
-                print(f"   📄 Preview: {content_preview}...")
+            # Content preview, sliced before translating newlines
+            content = article.get('content')
+            if content:
+                content_preview = content[:150].translate(_NL_TABLE)
+                parts.append(f"   📄 Preview: {content_preview}...")
             
             # Tags if available
-            if article.get('tags'):
-                tags = ', '.join(article['tags'][:5])
-                print(f"   🏷️  Tags: {tags}")
+            tags = article.get('tags')
+            if tags:
+                tags = ', '.join(tags[:5])
+                parts.append(f"   🏷️  Tags: {tags}")
+        
+        return "\n".join(parts)
     
     @staticmethod
     def display_comparative_ranking(
@@ -107,34 +154,36 @@ class SelectionOutputFormatter:
             ranked_articles: Articles with comparative rankings
             comparison_criteria: Criteria used for comparison
         """
-        print("\n" + "="*80)
-        print("🏅 COMPARATIVE RANKING RESULTS")
-        print("="*80)
+        parts = []
+        parts.append("\n" + _SEP_EQ)
+        parts.append("🏅 COMPARATIVE RANKING RESULTS")
+        parts.append(_SEP_EQ)
         
         if comparison_criteria:
-            print("\n📋 Ranking Criteria:")
+            parts.append("\n📋 Ranking Criteria:")
             for key, value in comparison_criteria.items():
-                print(f"   • {key}: {value}")
+                parts.append(f"   • {key}: {value}")
         
-        print(f"\n📊 Ranked Articles ({len(ranked_articles)} total):")
-        print("-"*80)
+        parts.append(f"\n📊 Ranked Articles ({len(ranked_articles)} total):")
+        parts.append(_SEP_DASH)
         
         for idx, article in enumerate(ranked_articles, 1):
-            print(f"\n{idx}. {article.get('title', 'Untitled')[:80]}")
+            get = article.get
+            parts.append(f"\n{idx}. {get('title', 'Untitled')[:80]}")
             
             # Show comparative scores if available
-            if article.get('relevance_score'):
-                print(f"   Relevance: {article['relevance_score']:.1f}")
-            if article.get('quality_score'):
-                print(f"   Quality: {article['quality_score']:.1f}")
-            if article.get('impact_score'):
-                print(f"   Impact: {article['impact_score']:.1f}")
-            if article.get('overall_score'):
-                print(f"   Overall: {article['overall_score']:.1f}")
+            for key, label in _SCORE_LABELS:
+                value = get(key)
+                if value:
+                    parts.append(f"   {label}: {value:.1f}")
             
             # Comparison notes
-            if article.get('comparison_notes'):
-                print(f"   Notes: {article['comparison_notes'][:150]}")
+            notes = get('comparison_notes')
+            if notes:
+                parts.append(f"   Notes: {notes[:150]}")
+        
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
     
     @staticmethod
     def save_selection_report(
@@ -159,12 +208,14 @@ class SelectionOutputFormatter:
             "metadata": metadata or {}
         }
         
-        # Ensure output directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        # Ensure output directory exists, once per directory
+        parent = Path(output_path).parent
+        if parent not in _ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(parent)
         
         # Save as JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        dump_json(report, output_path)
         
         print(f"\n📁 Report saved to: {output_path}")
     
@@ -179,42 +230,29 @@ class SelectionOutputFormatter:
             phase_stats: Statistics for each processing phase
             elapsed_time: Total processing time in seconds
         """
-        print("\n" + "="*80)
-        print("⚙️  PROCESSING SUMMARY")
-        print("="*80)
-        
-        print("\n📈 Phase Statistics:")
-        
-        # First pass
-        if 'first_pass' in phase_stats:
-            fp = phase_stats['first_pass']
-            print(f"\n   First Pass Filtering:")
-            print(f"      • Processed: {fp.get('total', 0)}")
-            print(f"      • Relevant: {fp.get('relevant', 0)}")
-            print(f"      • Filtered: {fp.get('filtered', 0)}")
-            print(f"      • Pass Rate: {fp.get('pass_rate', 0):.1f}%")
-        
-        # Scoring
-        if 'scoring' in phase_stats:
-            sc = phase_stats['scoring']
-            print(f"\n   Article Scoring:")
-            print(f"      • Scored: {sc.get('total', 0)}")
-            print(f"      • Avg Score: {sc.get('avg_score', 0):.1f}/10")
-            print(f"      • High Quality (>7): {sc.get('high_quality', 0)}")
-        
-        # Selection
-        if 'selection' in phase_stats:
-            sel = phase_stats['selection']
-            print(f"\n   Final Selection:")
-            print(f"      • Candidates: {sel.get('candidates', 0)}")
-            print(f"      • Selected: {sel.get('selected', 0)}")
-            print(f"      • Avg Selected Score: {sel.get('avg_selected_score', 0):.1f}/10")
+        parts = []
+        parts.append("\n" + _SEP_EQ)
+        parts.append("⚙️  PROCESSING SUMMARY")
+        parts.append(_SEP_EQ)
+        
+        parts.append("\n📈 Phase Statistics:")
+        
+        for phase, heading, fields in _PHASE_SPECS:
+            stats = phase_stats.get(phase)
+            if stats is None:
+                continue
+            parts.append(f"\n   {heading}:")
+            for key, label, fmt in fields:
+                parts.append(f"      • {label}: {fmt.format(stats.get(key, 0))}")
         
         # Timing
-        print(f"\n⏱️  Processing Time: {elapsed_time:.2f} seconds")
+        parts.append(f"\n⏱️  Processing Time: {elapsed_time:.2f} seconds")
         
         if elapsed_time > 0:
             articles_per_sec = phase_stats.get('first_pass', {}).get('total', 0) / elapsed_time
-            print(f"   • Throughput: {articles_per_sec:.1f} articles/second")
+            parts.append(f"   • Throughput: {articles_per_sec:.1f} articles/second")
+        
+        parts.append("\n" + _SEP_EQ)
         
-        print("\n" + "="*80)
\ No newline at end of file
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
@@ -0,0 +1,116 @@
+"""Single-file SQLite store for agent interaction records."""
+
+import functools
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from core.settings import settings
+from core.sqlite_store import SQLiteStore
+
+
+class ResponseStore(SQLiteStore):
+    """Appends agent interaction records to one WAL-mode SQLite database.
+
+    Replaces one JSON file per interaction with an insert into a single file,
+    so large runs don't pay for thousands of small file creates and fsyncs.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file path
+        """
+        super().__init__(path, [
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                agent TEXT NOT NULL,
+                article_id TEXT,
+                ts TEXT NOT NULL,
+                json BLOB NOT NULL
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_responses_agent_article ON responses (agent, article_id)",
+        ])
+
+    def put(self, agent: str, article_id: Optional[str], ts: str, record: bytes):
+        """Insert one interaction record.
+
+        Args:
+            agent: Agent type
+            article_id: ID of the article the record belongs to
+            ts: ISO timestamp of the interaction
+            record: JSON-encoded record
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO responses (agent, article_id, ts, json) VALUES (?, ?, ?, ?)",
+                (agent, article_id, ts, record)
+            )
+
+    def put_many(self, rows: Iterable[Tuple[str, Optional[str], str, bytes]]):
+        """Insert many (agent, article_id, ts, json) records in one transaction.
+
+        Args:
+            rows: Records to insert
+        """
+        with self._lock:
+            self.conn.execute("BEGIN")
+            try:
+                self.conn.executemany(
+                    "INSERT INTO responses (agent, article_id, ts, json) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def get(self, agent: str, article_id: str) -> Optional[bytes]:
+        """Get the latest record saved for an article by an agent.
+
+        Args:
+            agent: Agent type
+            article_id: Article ID
+
+        Returns:
+            JSON-encoded record, or None if there is none
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT json FROM responses WHERE agent = ? AND article_id = ? ORDER BY ts DESC LIMIT 1",
+                (agent, article_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def iter_records(self, agent: Optional[str] = None) -> Iterator[Tuple[str, Optional[str], str, bytes]]:
+        """Iterate stored (agent, article_id, ts, json) records in insertion order.
+
+        Args:
+            agent: Only yield records from this agent type
+        """
+        with self._lock:
+            if agent:
+                rows: List[Tuple] = self.conn.execute(
+                    "SELECT agent, article_id, ts, json FROM responses WHERE agent = ? ORDER BY rowid",
+                    (agent,)
+                ).fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT agent, article_id, ts, json FROM responses ORDER BY rowid"
+                ).fetchall()
+        yield from rows
+
+
+@functools.lru_cache(maxsize=1)
+def get_response_store() -> Optional[ResponseStore]:
+    """Get the shared response store configured by AGENT_RESPONSE_STORE.
+
+    Returns:
+        ResponseStore instance, or None when responses are saved as files
+    """
+    if not settings.agent_response_store:
+        return None
+    return ResponseStore(settings.agent_response_store)
+
+
+ResponseStore._shared_getter = staticmethod(get_response_store)
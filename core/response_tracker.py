@@ -1,24 +1,120 @@
 """Response tracking system for saving agent inputs and outputs."""
 
-import json
+import asyncio
+import atexit
+import functools
+import heapq
+import orjson
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from core.response_store import ResponseStore, get_response_store
 from core.settings import settings
 
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+# Compact encoding for records stored one per line or row
+RECORD_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Background writer batching: max records per write and max wait for a batch to fill
+WRITE_BATCH_SIZE = 1000
+WRITE_BATCH_WAIT = 0.05
+
+# Trackers whose background writer has been started
+_writing_trackers: List["ResponseTracker"] = []
+
+
+def _write_bytes(path: Path, data: bytes):
+    """Write bytes to a file with raw os.open/os.write, bypassing buffered IO wrappers.
+    
+    Args:
+        path: Destination file path (created or truncated)
+        data: Bytes to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# fdatasync skips the metadata flush where the platform has it (not macOS)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def dump_json(obj: Any, path: Path):
+    """Write an object as indented JSON in one binary write.
+    
+    Args:
+        obj: Object to serialize; unknown types are stringified
+        path: Destination file path
+    """
+    _write_bytes(path, orjson.dumps(obj, option=JSON_OPTIONS, default=str))
+
+
+def _dumps_record(record: Dict[str, Any]) -> bytes:
+    """Encode an interaction record as compact JSON; unknown types are stringified."""
+    return orjson.dumps(record, option=RECORD_OPTIONS, default=str)
+
+
+def _file_timestamp(iso_timestamp: str) -> str:
+    """Turn an ISO timestamp into the YYYYMMDD_HHMMSS form used in filenames."""
+    return (
+        f"{iso_timestamp[0:4]}{iso_timestamp[5:7]}{iso_timestamp[8:10]}_"
+        f"{iso_timestamp[11:13]}{iso_timestamp[14:16]}{iso_timestamp[17:19]}"
+    )
+
+
+def _serialize_unknown(output_data: Any) -> Any:
+    """Serialize an output whose type gives no hint, checking the instance itself."""
+    if hasattr(output_data, 'content'):
+        return str(output_data.content)
+    return str(output_data)
+
+
+def _resolve_serializer(cls: type) -> Callable[[Any], Any]:
+    """Pick the serializer for an output type.
+    
+    Args:
+        cls: Type of the agent output
+        
+    Returns:
+        Callable turning an instance of ``cls`` into JSON-serializable data
+    """
+    if hasattr(cls, 'model_dump'):
+        # Pydantic model; encode straight to JSON bytes and embed them as a
+        # pre-serialized fragment, skipping the intermediate dict
+        if hasattr(cls, '__pydantic_serializer__'):
+            return lambda obj: orjson.Fragment(obj.__pydantic_serializer__.to_json(obj, fallback=str))
+        return lambda obj: obj.model_dump()
+    if hasattr(cls, 'content'):
+        # Agent response object
+        return lambda obj: str(obj.content)
+    if issubclass(cls, dict):
+        return lambda obj: obj
+    return _serialize_unknown
+
 
 class ResponseTracker:
     """Tracks and saves agent inputs and outputs to JSON files."""
     
-    def __init__(self, output_dir: Optional[str] = None):
+    def __init__(self, output_dir: Optional[str] = None, store: Optional[ResponseStore] = None):
         """Initialize response tracker.
         
         Args:
             output_dir: Directory to save responses (uses settings default if not provided)
+            store: SQLite store receiving agent interactions instead of per-record
+                JSON files (uses the AGENT_RESPONSE_STORE store if not provided)
         """
         self.output_dir = Path(output_dir or settings.agent_response_output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store or get_response_store()
         
         # Create subdirectories for each agent type
         self.agent_dirs = {
@@ -30,6 +126,35 @@ class ResponseTracker:
         
         for dir_path in self.agent_dirs.values():
             dir_path.mkdir(parents=True, exist_ok=True)
+        # Output directories for agent types outside agent_dirs, created on first use
+        self._extra_dirs: Dict[str, Path] = {}
+        
+        # Filename -> path index, built lazily on first lookup
+        self._name_index: Optional[Dict[str, Path]] = None
+        self._missing_names: Set[str] = set()
+        
+        # Sidecar metadata index, one JSON line per saved file
+        self.index_path = self.output_dir / ".index.jsonl"
+        self._index_lock = threading.Lock()
+        
+        # Agent interactions buffered while in batch mode, keyed by agent type
+        self._batch_mode = False
+        self._pending: Dict[str, Tuple[Path, List[Dict[str, Any]]]] = {}
+        self._pending_lock = threading.Lock()
+        
+        # Interactions queued for the background writer thread, started on first use
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_lock = threading.Lock()
+        
+        # Output type -> serializer, filled in by _serialize_output
+        self._serializers: Dict[type, Callable[[Any], Any]] = {}
+        
+        # Per-agent file counts and latest (mtime, path), seeded from the sidecar
+        # index on first get_summary and then kept current by each save
+        self._counts: Optional[Dict[str, int]] = None
+        self._latest: Dict[str, Tuple[float, str]] = {}
+        self._counted_paths: Set[str] = set()
+        self._counts_lock = threading.Lock()
     
     def save_agent_interaction(
         self,
@@ -41,6 +166,10 @@ class ResponseTracker:
     ) -> str:
         """Save agent input and output to JSON file.
         
+        With a response store configured the record is inserted there instead.
+        Otherwise, inside a batch() block the record is buffered and written by
+        flush().
+        
         Args:
             agent_type: Type of agent (first_pass, scoring, selector)
             article_id: ID of the article being processed
@@ -49,19 +178,141 @@ class ResponseTracker:
             metadata: Additional metadata to save
             
         Returns:
-            Path to saved file
+            Path to saved file (the pending batch file in batch mode, the
+            database file with a response store)
         """
+        data = self._agent_record(agent_type, article_id, input_data, output_data, metadata)
+        
+        if self.store is not None:
+            self.store.put(agent_type, data["article_id"], data["timestamp"], _dumps_record(data))
+            return str(self.store.path)
+        
+        if self._batch_mode:
+            return self._buffer(agent_type, data)
+        
         # Determine output directory
-        output_dir = self.agent_dirs.get(agent_type, self.output_dir / agent_type)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._get_agent_dir(agent_type)
         
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{agent_type}_article_{article_id}_{timestamp}.json"
-        filepath = output_dir / filename
+        return self._write_agent_file(output_dir, data)
+    
+    def _write_records(self, records: List[Dict[str, Any]]) -> List[str]:
+        """Write built agent interaction records to the store or their own files."""
+        if self.store is not None:
+            self.store.put_many([
+                (data["agent_type"], data["article_id"], data["timestamp"], _dumps_record(data))
+                for data in records
+            ])
+            return [str(self.store.path)] * len(records)
         
-        # Prepare data to save
-        data = {
+        return [
+            self._write_agent_file(self._get_agent_dir(data["agent_type"]), data)
+            for data in records
+        ]
+    
+    def enqueue_agent_interaction(
+        self,
+        agent_type: str,
+        article_id: Any,
+        input_data: Dict[str, Any],
+        output_data: Any,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Queue an agent interaction for the background writer and return immediately.
+        
+        A single writer thread drains the queue in batches of up to
+        WRITE_BATCH_SIZE records, so callers never wait on disk. Call drain()
+        (or drain_response_writers() for every tracker) before reading the
+        responses back; anything still queued at interpreter exit is written then.
+        
+        Args:
+            agent_type: Type of agent (first_pass, scoring, selector)
+            article_id: ID of the article being processed
+            input_data: Input sent to the agent
+            output_data: Output received from the agent
+            metadata: Additional metadata to save
+        """
+        data = self._agent_record(agent_type, article_id, input_data, output_data, metadata)
+        
+        if self._batch_mode and self.store is None:
+            self._buffer(agent_type, data)
+            return
+        
+        self._get_write_queue().put_nowait(data)
+    
+    def _get_write_queue(self) -> queue.Queue:
+        """Get the background writer's queue, starting the writer thread on first use."""
+        if self._write_queue is None:
+            with self._writer_lock:
+                if self._write_queue is None:
+                    write_queue: queue.Queue = queue.Queue()
+                    threading.Thread(
+                        target=self._writer_loop,
+                        args=(write_queue,),
+                        name="response-writer",
+                        daemon=True
+                    ).start()
+                    self._write_queue = write_queue
+                    _writing_trackers.append(self)
+        return self._write_queue
+    
+    def _writer_loop(self, write_queue: queue.Queue):
+        """Write queued records in batches, waiting briefly for each batch to fill."""
+        while True:
+            records = [write_queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_WAIT
+            while len(records) < WRITE_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    records.append(write_queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_records(records)
+            except Exception as e:
+                print(f"⚠️  Failed to save {len(records)} agent interactions: {e}")
+            finally:
+                for _ in records:
+                    write_queue.task_done()
+    
+    def drain(self):
+        """Block until every queued agent interaction has been written."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+    
+    async def adrain(self):
+        """Wait for queued agent interactions to be written without blocking the event loop."""
+        if self._write_queue is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.drain)
+    
+    def _get_agent_dir(self, agent_type: str) -> Path:
+        """Get an agent type's output directory, creating it once for unknown types.
+        
+        Args:
+            agent_type: Type of agent
+            
+        Returns:
+            Existing output directory for the agent type
+        """
+        output_dir = self.agent_dirs.get(agent_type) or self._extra_dirs.get(agent_type)
+        if output_dir is None:
+            output_dir = self.output_dir / agent_type
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._extra_dirs[agent_type] = output_dir
+        return output_dir
+    
+    def _agent_record(
+        self,
+        agent_type: str,
+        article_id: Any,
+        input_data: Dict[str, Any],
+        output_data: Any,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the saved representation of one agent interaction."""
+        return {
             "agent_type": agent_type,
             "article_id": str(article_id),
             "timestamp": datetime.now().isoformat(),
@@ -69,13 +320,112 @@ class ResponseTracker:
             "output": self._serialize_output(output_data),
             "metadata": metadata or {}
         }
+    
+    def _write_agent_file(self, output_dir: Path, data: Dict[str, Any]) -> str:
+        """Write one agent interaction record to its own JSON file."""
+        # Generate filename from the record's own timestamp rather than a second clock read
+        timestamp = _file_timestamp(data["timestamp"])
+        filename = f"{data['agent_type']}_article_{data['article_id']}_{timestamp}.json"
+        filepath = output_dir / filename
         
         # Save to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        dump_json(data, filepath)
         
+        self._index_file(filepath, article_id=data["article_id"])
         return str(filepath)
     
+    def _buffer(self, agent_type: str, data: Dict[str, Any]) -> str:
+        """Queue a record for the agent type's batch file and return that file's path."""
+        with self._pending_lock:
+            if agent_type not in self._pending:
+                output_dir = self._get_agent_dir(agent_type)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                self._pending[agent_type] = (output_dir / f"{agent_type}_batch_{timestamp}.jsonl", [])
+            filepath, records = self._pending[agent_type]
+            records.append(data)
+        return str(filepath)
+    
+    def flush(self, agent_type: Optional[str] = None) -> List[str]:
+        """Write buffered interactions, one JSONL file per agent type.
+        
+        Each file is written with a single open() and fsync'd once.
+        
+        Args:
+            agent_type: Only flush this agent type (flushes all if not provided)
+            
+        Returns:
+            Paths to written files
+        """
+        with self._pending_lock:
+            if agent_type is None:
+                pending = list(self._pending.values())
+                self._pending.clear()
+            else:
+                pending = [self._pending.pop(agent_type)] if agent_type in self._pending else []
+        
+        paths = []
+        for filepath, records in pending:
+            with open(filepath, 'ab') as f:
+                f.writelines(
+                    _dumps_record(record) + b"\n"
+                    for record in records
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            self._index_file(filepath)
+            paths.append(str(filepath))
+        return paths
+    
+    @contextmanager
+    def batch(self) -> Iterator["ResponseTracker"]:
+        """Buffer save_agent_interaction calls and flush them as batch files on exit.
+        
+        Nested blocks join the outermost one, which does the flush.
+        """
+        if self._batch_mode:
+            yield self
+            return
+        
+        self._batch_mode = True
+        try:
+            yield self
+        finally:
+            self._batch_mode = False
+            self.flush()
+    
+    @contextmanager
+    def batch_writer(self, agent_type: str, batch_id: str) -> Iterator[Callable[..., None]]:
+        """Stream agent interactions into one JSONL file kept open for the block.
+        
+        The yielded callable takes save_agent_interaction's arguments minus
+        agent_type. The file is flushed and synced once, when the block exits.
+        
+        Args:
+            agent_type: Type of agent
+            batch_id: Batch identifier used in the file name
+            
+        Yields:
+            Callable writing one interaction record
+        """
+        filepath = self._get_agent_dir(agent_type) / f"{agent_type}_{batch_id}.jsonl"
+        with open(filepath, 'ab') as f:
+            def write(
+                article_id: Any,
+                input_data: Dict[str, Any],
+                output_data: Any,
+                metadata: Optional[Dict[str, Any]] = None
+            ):
+                data = self._agent_record(agent_type, article_id, input_data, output_data, metadata)
+                f.write(_dumps_record(data) + b"\n")
+            
+            try:
+                yield write
+            finally:
+                f.flush()
+                _fdatasync(f.fileno())
+        
+        self._index_file(filepath, batch_id=batch_id)
+    
     def save_batch_interaction(
         self,
         agent_type: str,
@@ -96,11 +446,11 @@ class ResponseTracker:
         Returns:
             Path to saved file
         """
-        output_dir = self.agent_dirs.get(agent_type, self.output_dir / agent_type)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._get_agent_dir(agent_type)
         
         # Generate filename for batch
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{agent_type}_batch_{batch_id}_{timestamp}.json"
         filepath = output_dir / filename
         
@@ -108,18 +458,42 @@ class ResponseTracker:
         data = {
             "agent_type": agent_type,
             "batch_id": batch_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "input": input_data,
             "output": self._serialize_output(output_data),
             "metadata": metadata or {}
         }
         
         # Save to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        dump_json(data, filepath)
         
+        self._index_file(filepath, batch_id=batch_id)
         return str(filepath)
     
+    async def asave_batch_interaction(
+        self,
+        agent_type: str,
+        batch_id: str,
+        input_data: Dict[str, Any],
+        output_data: Any,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Save batch input and output without blocking the event loop.
+        
+        Returns:
+            Path to saved file
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self.save_batch_interaction,
+            agent_type,
+            batch_id,
+            input_data,
+            output_data,
+            metadata
+        )
+    
     def save_sanity_check_input(
         self,
         agent_type: str,
@@ -136,17 +510,16 @@ class ResponseTracker:
         Returns:
             Path to saved file
         """
-        output_dir = self.agent_dirs.get(agent_type, self.output_dir / agent_type)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._get_agent_dir(agent_type)
         
         # Generate filename matching ADK pattern
         filename = f"sanity_check_{agent_type}_input_{article_id}.txt"
         filepath = output_dir / filename
         
         # Save plain text
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(input_text)
+        _write_bytes(filepath, input_text.encode('utf-8'))
         
+        self._index_file(filepath, article_id=str(article_id))
         return str(filepath)
     
     def save_global_ranking(
@@ -163,47 +536,257 @@ class ResponseTracker:
         Returns:
             Path to saved file
         """
-        output_dir = self.agent_dirs.get('comparative_ranker', self.output_dir / 'comparative_ranker')
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._get_agent_dir('comparative_ranker')
         
         # Generate filename
-        batch_id = batch_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        batch_id = batch_id or now.strftime("%Y%m%d_%H%M%S")
         filename = f"global_ranked_articles_{batch_id}.json"
         filepath = output_dir / filename
         
         # Prepare data
         data = {
             "batch_id": batch_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "total_articles": len(ranked_articles),
             "ranked_articles": ranked_articles
         }
         
         # Save to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        dump_json(data, filepath)
         
+        self._index_file(filepath, batch_id=batch_id)
         return str(filepath)
     
+    def _index_file(
+        self,
+        filepath: Path,
+        article_id: Optional[str] = None,
+        batch_id: Optional[str] = None
+    ):
+        """Record a newly written file in the name index and the sidecar metadata index."""
+        if self._name_index is not None:
+            self._name_index[filepath.name] = filepath
+        self._missing_names.discard(filepath.name)
+        
+        st = filepath.stat()
+        record = {
+            "agent": filepath.parent.name,
+            "file": str(filepath),
+            "article_id": article_id,
+            "batch_id": batch_id,
+            "mtime": st.st_mtime,
+            "size": st.st_size,
+        }
+        with self._index_lock, open(self.index_path, 'ab') as f:
+            f.write(orjson.dumps(record) + b"\n")
+        
+        if self._counts is not None:
+            self._count_file(record)
+    
+    def _count_file(self, record: Dict[str, Any]):
+        """Add an index record to the per-agent counts and latest-file tracking."""
+        agent_type = record["agent"]
+        with self._counts_lock:
+            if record["file"] not in self._counted_paths:
+                self._counted_paths.add(record["file"])
+                self._counts[agent_type] = self._counts.get(agent_type, 0) + 1
+            if agent_type not in self._latest or record["mtime"] >= self._latest[agent_type][0]:
+                self._latest[agent_type] = (record["mtime"], record["file"])
+    
+    def _all_agent_dirs(self) -> Dict[str, Path]:
+        """Get every agent output directory, including ones for types outside agent_dirs.
+        
+        Subdirectories created by earlier runs (e.g. filter_and_score) are
+        registered in _extra_dirs when first seen.
+        
+        Returns:
+            Output directories keyed by agent type
+        """
+        try:
+            with os.scandir(self.output_dir) as it:
+                for entry in it:
+                    if entry.is_dir() and entry.name not in self.agent_dirs:
+                        self._extra_dirs.setdefault(entry.name, Path(entry.path))
+        except FileNotFoundError:
+            pass
+        return {**self.agent_dirs, **self._extra_dirs}
+    
+    def _read_index(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """Read the sidecar metadata index.
+        
+        Returns:
+            Index records keyed by file path (later lines win for rewritten
+            files) and the number of lines read
+        """
+        records = {}
+        lines = 0
+        with open(self.index_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    lines += 1
+                    record = orjson.loads(line)
+                    records[record["file"]] = record
+        return records, lines
+    
+    def _write_index(self, records: Dict[str, Dict[str, Any]]):
+        """Replace the sidecar metadata index with one line per record."""
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with self._index_lock:
+            with open(tmp_path, 'wb') as f:
+                f.writelines(orjson.dumps(record) + b"\n" for record in records.values())
+            os.replace(tmp_path, self.index_path)
+    
+    def _rebuild_index(self, previous: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """Rebuild the sidecar metadata index from the agent directories.
+        
+        Article and batch IDs are carried over from the previous index for
+        files it already knew; files it did not know get none, since recovering
+        them would mean parsing every file.
+        
+        Args:
+            previous: Records of the stale index, if there was one
+        
+        Returns:
+            Index records keyed by file path
+        """
+        previous = previous or {}
+        records = {}
+        for agent_type, dir_path in self._all_agent_dirs().items():
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        if not entry.name.endswith((".json", ".jsonl", ".txt")):
+                            continue
+                        st = entry.stat()
+                        known = previous.get(entry.path, {})
+                        records[entry.path] = {
+                            "agent": agent_type,
+                            "file": entry.path,
+                            "article_id": known.get("article_id"),
+                            "batch_id": known.get("batch_id"),
+                            "mtime": st.st_mtime,
+                            "size": st.st_size,
+                        }
+            except FileNotFoundError:
+                continue
+        
+        self._write_index(records)
+        return records
+    
+    def load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the sidecar metadata index, rebuilding it if it is missing or stale.
+        
+        The index is stale when any agent directory changed (e.g. files were
+        deleted) at or after the time the index was last written; equal mtimes
+        count as stale because a deletion in the same clock tick is otherwise
+        missed. Indexes holding superseded lines are compacted.
+        
+        Returns:
+            Index records keyed by file path
+        """
+        try:
+            index_mtime = self.index_path.stat().st_mtime
+        except FileNotFoundError:
+            return self._rebuild_index()
+        
+        records, lines = self._read_index()
+        
+        for dir_path in self._all_agent_dirs().values():
+            try:
+                if dir_path.stat().st_mtime >= index_mtime:
+                    return self._rebuild_index(records)
+            except FileNotFoundError:
+                continue
+        
+        if lines > len(records):
+            self._write_index(records)
+        return records
+    
+    def find_response_file(self, filename: str) -> Optional[Path]:
+        """Resolve a response filename to its path across all agent directories.
+        
+        The first call scans each directory once; later lookups are dictionary
+        hits, and names already known to be missing are not rescanned.
+        
+        Args:
+            filename: Bare file name (any directory part is ignored)
+            
+        Returns:
+            Path to the file, or None if no agent directory contains it
+        """
+        name = Path(filename).name
+        if name in self._missing_names:
+            return None
+        
+        if self._name_index is None:
+            self._name_index = {}
+            for dir_path in [self.output_dir, *self._all_agent_dirs().values()]:
+                try:
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            if entry.is_file():
+                                self._name_index.setdefault(entry.name, Path(entry.path))
+                except FileNotFoundError:
+                    continue
+        
+        path = self._name_index.get(name)
+        if path is None:
+            self._missing_names.add(name)
+        return path
+    
     def _serialize_output(self, output_data: Any) -> Any:
         """Serialize output data for JSON storage.
         
+        The serializer is resolved once per output type and reused for later
+        outputs of the same type.
+        
         Args:
             output_data: Output data from agent
             
         Returns:
-            JSON-serializable version of the output
+            orjson-serializable version of the output (pydantic models become
+            pre-encoded orjson.Fragment values)
         """
-        if hasattr(output_data, 'model_dump'):
-            # Pydantic model
-            return output_data.model_dump()
-        elif hasattr(output_data, 'content'):
-            # Agent response object
-            return str(output_data.content)
-        elif isinstance(output_data, dict):
-            return output_data
-        else:
-            return str(output_data)
+        cls = type(output_data)
+        serializer = self._serializers.get(cls)
+        if serializer is None:
+            serializer = self._serializers[cls] = _resolve_serializer(cls)
+        return serializer(output_data)
+    
+    def scan_response_files(
+        self,
+        agent_type: Optional[str] = None,
+        article_id: Optional[Any] = None,
+        limit: int = 100
+    ) -> List[Tuple[str, int, float]]:
+        """List response files with their size and mtime from the sidecar index.
+        
+        Includes JSONL batch files (one interaction per line) alongside the
+        per-interaction JSON files.
+        
+        Args:
+            agent_type: Filter by agent type
+            article_id: Filter by article ID
+            limit: Maximum number of files to return
+            
+        Returns:
+            (path, size, mtime) tuples, newest first
+        """
+        entries = []
+        for record in self.load_index().values():
+            path = record["file"]
+            if not path.endswith((".json", ".jsonl")):
+                continue
+            if agent_type and record["agent"] != agent_type:
+                continue
+            # Filter by article ID if specified; JSONL batch files hold many
+            # articles and have no article ID in their name
+            if article_id and f"article_{article_id}_" not in os.path.basename(path):
+                continue
+            entries.append((path, record["size"], record["mtime"]))
+        
+        return heapq.nlargest(limit, entries, key=lambda e: e[2])
     
     def get_response_files(
         self,
@@ -219,46 +802,61 @@ class ResponseTracker:
             limit: Maximum number of files to return
             
         Returns:
-            List of file paths
+            List of file paths, newest first
         """
-        files = []
-        
-        # Determine directories to search
-        if agent_type:
-            dirs = [self.agent_dirs.get(agent_type, self.output_dir / agent_type)]
-        else:
-            dirs = list(self.agent_dirs.values())
+        return [path for path, _, _ in self.scan_response_files(agent_type, article_id, limit)]
+    
+    def load_response(self, filepath: str, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Load a response file.
         
-        # Search for files
-        for dir_path in dirs:
-            if not dir_path.exists():
-                continue
+        Args:
+            filepath: Path to response file
+            keys: Optional top-level keys to keep; other values are dropped
+                right after parsing instead of being passed around
             
-            for filepath in sorted(dir_path.glob("*.json"), reverse=True)[:limit]:
-                if article_id:
-                    # Filter by article ID if specified
-                    if f"article_{article_id}_" in filepath.name:
-                        files.append(str(filepath))
-                else:
-                    files.append(str(filepath))
+        Returns:
+            Response data; for a JSONL batch file, {"records": [...]} with one
+            entry per interaction
+        """
+        if str(filepath).endswith(".jsonl"):
+            return {"records": self.load_response_records(filepath, keys=keys)}
+        
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
         
-        return files[:limit]
+        if keys is None:
+            return data
+        return {key: data[key] for key in keys if key in data}
     
-    def load_response(self, filepath: str) -> Dict[str, Any]:
-        """Load a response file.
+    def load_response_records(self, filepath: str, keys: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Load every interaction record in a response file.
         
         Args:
-            filepath: Path to response file
+            filepath: Path to a JSON response file or JSONL batch file
+            keys: Optional top-level keys to keep in each record
             
         Returns:
-            Response data
+            One dict per interaction (a single one for a JSON file)
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if not str(filepath).endswith(".jsonl"):
+            return [self.load_response(filepath, keys=keys)]
+        
+        keys = list(keys) if keys is not None else None
+        records = []
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                data = orjson.loads(line)
+                records.append(data if keys is None else {key: data[key] for key in keys if key in data})
+        return records
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of all saved responses.
         
+        Reads in-memory per-agent counters, so the cost does not grow with the
+        number of files on disk.
+        
         Returns:
             Summary statistics
         """
@@ -268,26 +866,52 @@ class ResponseTracker:
             "latest_files": []
         }
         
-        for agent_type, dir_path in self.agent_dirs.items():
+        # Seed the counters from the sidecar index once; saves keep them current
+        if self._counts is None:
+            self._counts = {}
+            for record in self.load_index().values():
+                self._count_file(record)
+        
+        for agent_type, dir_path in self._all_agent_dirs().items():
             if not dir_path.exists():
                 continue
-            
-            files = list(dir_path.glob("*.json")) + list(dir_path.glob("*.txt"))
-            count = len(files)
+            count = self._counts.get(agent_type, 0)
             summary["total_responses"] += count
             summary["by_agent"][agent_type] = count
             
             # Add latest file for this agent
-            if files:
-                latest = max(files, key=lambda f: f.stat().st_mtime)
+            if agent_type in self._latest:
+                mtime, filepath = self._latest[agent_type]
                 summary["latest_files"].append({
                     "agent": agent_type,
-                    "file": str(latest),
-                    "modified": datetime.fromtimestamp(latest.stat().st_mtime).isoformat()
+                    "file": filepath,
+                    "modified": datetime.fromtimestamp(mtime).isoformat()
                 })
         
         return summary
 
 
-# Global tracker instance
-response_tracker = ResponseTracker()
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_response_tracker() -> ResponseTracker:
+    """Get the global tracker, creating it (and its directories) on first use.
+
+    Returns:
+        Shared ResponseTracker instance
+    """
+    return ResponseTracker()
+
+
+def drain_response_writers():
+    """Block until every tracker's queued agent interactions have been written."""
+    for tracker in list(_writing_trackers):
+        tracker.drain()
+
+
+async def adrain_response_writers():
+    """Wait for every tracker's queued agent interactions without blocking the event loop."""
+    if _writing_trackers:
+        await asyncio.get_running_loop().run_in_executor(None, drain_response_writers)
+
+
+# Write whatever is still queued when the interpreter exits
+atexit.register(drain_response_writers)
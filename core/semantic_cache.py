@@ -0,0 +1,95 @@
+"""In-memory semantic response cache keyed on text embeddings."""
+
+import re
+import threading
+import zlib
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def hashed_embedding(text: str, dim: int = 1024) -> np.ndarray:
+    """Embed text as an L2-normalized hashed bag of word unigrams and bigrams.
+
+    Near-duplicate texts (cross-posts, light edits) land close together in
+    cosine space without needing a local embedding model. It is lexical, not
+    semantic: long texts differing in a few key words (e.g. the affected
+    product) also score high, so keep thresholds strict.
+
+    Args:
+        text: Text to embed
+        dim: Number of hash buckets
+
+    Returns:
+        Unit-length float32 vector (all zeros for text without tokens)
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    vec = np.zeros(dim, dtype=np.float32)
+    for gram in tokens + [a + " " + b for a, b in zip(tokens, tokens[1:])]:
+        vec[zlib.crc32(gram.encode()) % dim] += 1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+class SemanticCache:
+    """Returns a cached value for texts whose embedding is close to a stored one."""
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 4096,
+        embed_fn: Callable[[str], np.ndarray] = hashed_embedding,
+    ):
+        """Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Oldest entries are evicted beyond this size
+            embed_fn: Callable returning a unit-length vector for a text
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.embed_fn = embed_fn
+        self._vectors: Optional[np.ndarray] = None
+        self._values: List[Any] = []
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> Optional[Any]:
+        """Look up the value stored for the most similar text above the threshold.
+
+        Args:
+            text: Text to look up
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        vec = self.embed_fn(text)
+        with self._lock:
+            if self._vectors is None:
+                return None
+            sims = self._vectors @ vec
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            return self._values[best]
+
+    def put(self, text: str, value: Any):
+        """Store a value under the text's embedding.
+
+        Args:
+            text: Text the value was produced for
+            value: Value to return for similar texts
+        """
+        vec = self.embed_fn(text)[np.newaxis, :]
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = vec
+            else:
+                self._vectors = np.vstack([self._vectors, vec])[-self.max_entries:]
+            self._values.append(value)
+            del self._values[:-self.max_entries]
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -2,9 +2,9 @@
 
 import os
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import AliasChoices, Field, PrivateAttr
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -35,6 +35,12 @@ class Settings(BaseSettings):
         default="output/responses",
         env="AGENT_RESPONSE_OUTPUT_DIR"
     )
+    # SQLite file collecting agent interactions instead of one JSON file each
+    agent_response_store: Optional[str] = Field(default=None, env="AGENT_RESPONSE_STORE")
+    # SQLite file caching agent responses to identical prompts across runs (unset disables)
+    agent_cache_path: Optional[str] = Field(default=None, env="AGENT_CACHE_PATH")
+    # Seconds a cached agent response stays valid; prompts carry the date, so keep it to a day
+    agent_cache_max_age: float = Field(default=86400, env="AGENT_CACHE_MAX_AGE")
     selector_candidate_db: str = Field(
         default="data/selector_candidates.duckdb",
         env="SELECTOR_CANDIDATE_DB"
@@ -48,6 +54,7 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
     api_port: int = Field(default=8000, env="API_PORT")
     api_reload: bool = Field(default=True, env="API_RELOAD")
+    api_workers: Optional[int] = Field(default=None, validation_alias="APP_WORKERS")
     cors_origins: List[str] = Field(
         default=["http://localhost:3000", "http://localhost:8000"],
         env="CORS_ORIGINS"
@@ -62,16 +69,35 @@ class Settings(BaseSettings):
     debug_mode: bool = Field(default=False, env="DEBUG_MODE")
     max_articles_per_batch: int = Field(default=50, env="MAX_ARTICLES_PER_BATCH")
     default_max_selected_articles: int = Field(default=10, env="DEFAULT_MAX_SELECTED_ARTICLES")
+    max_concurrent_llm_calls: int = Field(
+        default=10,
+        validation_alias=AliasChoices("LLM_MAX_CONCURRENCY", "MAX_CONCURRENT_LLM_CALLS")
+    )
+    llm_requests_per_minute: int = Field(default=100, env="LLM_REQUESTS_PER_MINUTE")
+    first_pass_articles_per_call: int = Field(default=8, env="FIRST_PASS_ARTICLES_PER_CALL")
+    # Minimum prompt similarity for the first pass/scoring agents to reuse a
+    # response from the in-process semantic cache (unset disables it)
+    semantic_cache_threshold: Optional[float] = Field(default=None, env="SEMANTIC_CACHE_THRESHOLD")
+    # Start scoring each article alongside its first pass instead of after it
+    speculative_scoring_enabled: bool = Field(default=False, env="SPECULATIVE_SCORING_ENABLED")
     
     # Logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: str = Field(default="logs/article_selector.log", env="LOG_FILE")
     
+    # Derived values, computed once since the environment is fixed at startup
+    _model_config: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _use_motherduck: bool = PrivateAttr(default=False)
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
     
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute settings derived from the loaded fields."""
+        self._use_motherduck = bool(self.motherduck_token)
+    
     def ensure_directories(self):
         """Ensure all required directories exist."""
         dirs = [
@@ -87,9 +113,17 @@ class Settings(BaseSettings):
     def get_model_config(self):
         """Get model configuration based on default_model setting.
         
+        The configuration is built on first use and cached afterwards.
+        
         Returns:
             Dict with model configuration
         """
+        if self._model_config is None:
+            self._model_config = self._build_model_config()
+        return self._model_config
+    
+    def _build_model_config(self) -> Dict[str, Any]:
+        """Build the model configuration for the default_model setting."""
         if self.default_model == "claude":
             return {
                 "provider": "aws_bedrock",
@@ -127,11 +161,34 @@ class Settings(BaseSettings):
         Returns:
             True if MotherDuck token is configured
         """
-        return bool(self.motherduck_token)
+        return self._use_motherduck
 
 
-# Global settings instance
-settings = Settings()
+class _LazySettings:
+    """Proxy that builds the Settings instance on first attribute access.
+    
+    Importing this module stays cheap (e.g. for ``--help``); model validation
+    and directory creation happen only once settings are actually used.
+    """
+    
+    def __init__(self):
+        object.__setattr__(self, "_instance", None)
+    
+    def _load(self) -> Settings:
+        """Create the settings and their directories if not done yet."""
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            instance = Settings()
+            instance.ensure_directories()
+            object.__setattr__(self, "_instance", instance)
+        return instance
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+    
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._load(), name, value)
+
 
-# Ensure directories exist on startup
-settings.ensure_directories()
\ No newline at end of file
+# Global settings instance
+settings = _LazySettings()
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""Shared base for the single-file SQLite stores."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+
+class SQLiteStore:
+    """One WAL-mode SQLite database file, safe to use from executor threads.
+
+    Subclasses pass their schema statements and may set _shared_getter to the
+    lru_cache'd factory returning the process-wide instance, so closing that
+    instance also drops it from the cache.
+    """
+
+    _shared_getter: Optional[Callable[[], Any]] = None
+
+    def __init__(self, path: str, schema: Iterable[str]):
+        """Open (or create) the database.
+
+        Args:
+            path: SQLite database file path
+            schema: Idempotent DDL statements (CREATE ... IF NOT EXISTS)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Autocommit mode; access from executor threads is serialized by _lock
+        self.conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in schema:
+            self.conn.execute(statement)
+        self._lock = threading.Lock()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+        getter = type(self)._shared_getter
+        if getter is not None and getter.cache_info().currsize and getter() is self:
+            getter.cache_clear()
@@ -1,5 +1,6 @@
 """Base workflow classes and registry."""
 
+from collections import defaultdict
 from typing import Dict, Callable, Optional, List, Any
 
 
@@ -8,6 +9,9 @@ class WorkflowRegistry:
     
     def __init__(self):
         self._workflows: Dict[str, Dict[str, Any]] = {}
+        # Category -> workflow IDs, and the factory-free view list_workflows returns
+        self._by_category: Dict[str, List[str]] = defaultdict(list)
+        self._public_views: Dict[str, Dict[str, Any]] = {}
     
     def register(
         self,
@@ -28,6 +32,10 @@ class WorkflowRegistry:
             factory: Factory function to create the workflow
             **metadata: Additional metadata for the workflow
         """
+        previous = self._workflows.get(workflow_id)
+        if previous is not None:
+            self._by_category[previous["category"]].remove(workflow_id)
+        
         self._workflows[workflow_id] = {
             "name": name,
             "description": description,
@@ -35,6 +43,11 @@ class WorkflowRegistry:
             "factory": factory,
             **metadata
         }
+        self._by_category[category].append(workflow_id)
+        self._public_views[workflow_id] = {
+            "id": workflow_id,
+            **{k: v for k, v in self._workflows[workflow_id].items() if k != "factory"}
+        }
     
     def get_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Get a workflow by ID.
@@ -68,11 +81,6 @@ class WorkflowRegistry:
         Returns:
             List of workflow metadata dictionaries
         """
-        workflows = []
-        for workflow_id, metadata in self._workflows.items():
-            if category is None or metadata.get("category") == category:
-                workflows.append({
-                    "id": workflow_id,
-                    **{k: v for k, v in metadata.items() if k != "factory"}
-                })
-        return workflows
\ No newline at end of file
+        if category is None:
+            return list(self._public_views.values())
+        return [self._public_views[workflow_id] for workflow_id in self._by_category.get(category, [])]
\ No newline at end of file
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Demo script showing the complete article selection workflow with formatted output."""
 
+import asyncio
+import heapq
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -10,15 +12,22 @@ sys.path.insert(0, str(Path(__file__)))
 
 from projects.article_selector.models import Article
 from projects.article_selector.agents.tracked_agents import (
-    get_tracked_first_pass_agent,
-    get_tracked_scoring_agent,
+    get_tracked_filter_score_agent,
     get_tracked_selector_agent,
 )
+from core.agents import close_http_client
+from core.batch_processor import BatchProcessor
 from core.output_formatter import SelectionOutputFormatter
+from core.response_tracker import adrain_response_writers
+from core.settings import settings
+import numpy as np
 import time
 
+# Articles scoring below this never reach the selector
+MIN_SELECTION_SCORE = 5.0
 
-def main():
+
+async def main():
     """Run complete article selection workflow with formatted output."""
     
     print("\n" + "="*80)
@@ -31,31 +40,31 @@ def main():
     
     # Sample articles for demo
     test_articles = [
-        Article(
+        Article.trusted(
             title="Critical Zero-Day Vulnerability Discovered in Linux Kernel",
             content="A critical zero-day vulnerability has been discovered in the Linux kernel affecting all major distributions. The vulnerability, tracked as CVE-2024-0001, allows local privilege escalation and could potentially lead to remote code execution. The Linux security team has released emergency patches.",
             domain="kernel.org",
             url="https://kernel.org/security/cve-2024-0001"
         ),
-        Article(
+        Article.trusted(
             title="Microsoft Releases Emergency Windows 11 Security Update",
             content="Microsoft has released an out-of-band security update for Windows 11 addressing multiple critical vulnerabilities. The update fixes issues in Windows Defender and the Windows kernel.",
             domain="microsoft.com",
             url="https://microsoft.com/security/updates"
         ),
-        Article(
+        Article.trusted(
             title="Supply Chain Attack Targets Popular npm Packages",
             content="Security researchers have uncovered a sophisticated supply chain attack targeting multiple popular npm packages. The attack involves malicious code injection that can steal environment variables and authentication tokens. Over 10 million weekly downloads were potentially affected.",
             domain="snyk.io",
             url="https://snyk.io/blog/npm-supply-chain-attack"
         ),
-        Article(
+        Article.trusted(
             title="OpenSSL Releases Critical Security Patch",
             content="The OpenSSL team has released version 3.0.12 addressing a critical vulnerability that could allow remote attackers to cause a denial of service or potentially execute arbitrary code. All users of OpenSSL 3.0.x are urged to update immediately.",
             domain="openssl.org",
             url="https://www.openssl.org/news/secadv/"
         ),
-        Article(
+        Article.trusted(
             title="New Ransomware Campaign Targets Healthcare Sector",
             content="A new ransomware campaign dubbed 'MedLock' is actively targeting healthcare organizations worldwide. The campaign uses sophisticated phishing emails and exploits known vulnerabilities in medical software.",
             domain="bleepingcomputer.com",
@@ -65,35 +74,48 @@ def main():
     
     # Initialize agents
     print("🤖 Initializing agents...")
-    first_pass_agent = get_tracked_first_pass_agent(debug_mode=False)
-    scoring_agent = get_tracked_scoring_agent(debug_mode=False)
+    filter_score_agent = get_tracked_filter_score_agent(debug_mode=False)
     selector_agent = get_tracked_selector_agent(debug_mode=False)
     
-    # Phase 1: First Pass Filtering
+    # Phase 1+2: First Pass Filtering and Scoring in one call per article
     print("\n" + "="*60)
-    print("📋 PHASE 1: First Pass Filtering")
+    print("📋 PHASE 1-2: First Pass Filtering & Scoring")
     print("="*60)
     
-    relevant_articles = []
+    scored_articles = []
     phase_stats = {'first_pass': {'total': len(test_articles), 'relevant': 0, 'filtered': 0}}
+    batch_processor = BatchProcessor()
     
-    for idx, article in enumerate(test_articles, 1):
+    responses = await batch_processor.run_batch(
+        lambda item: filter_score_agent.afilter_and_score(
+            article=item[1],
+            article_id=item[0],
+            save_responses=True
+        ),
+        list(enumerate(test_articles, 1)),
+        max_concurrency=settings.max_concurrent_llm_calls,
+        rpm=settings.llm_requests_per_minute
+    )
+    
+    for idx, (article, response) in enumerate(zip(test_articles, responses), 1):
         print(f"\n[{idx}/{len(test_articles)}] {article.title[:60]}...")
         
-        response = first_pass_agent.process_article(
-            article=article,
-            article_id=idx,
-            save_responses=True
-        )
+        if isinstance(response, Exception):
+            response = {'status': 'Irrelevant', 'reasoning': f"Error: {response}", 'score': 0.0}
         
         status = response['status']
         print(f"    → Status: {status}")
         
         if status == "Relevant":
-            relevant_articles.append({
+            print(f"    → Score: {response['score']:.1f}/10")
+            scored_articles.append({
                 'id': idx,
-                'article': article,
-                'first_pass_reasoning': str(response['result'].content)[:200]
+                'title': article.title,
+                'domain': article.domain,
+                'url': article.url,
+                'content': article.content,
+                'overall_score': response['score'],
+                'first_pass_reasoning': response['reasoning'][:200]
             })
             phase_stats['first_pass']['relevant'] += 1
         else:
@@ -103,51 +125,21 @@ def main():
         phase_stats['first_pass']['relevant'] / phase_stats['first_pass']['total'] * 100
     )
     
-    print(f"\n✅ First pass complete: {len(relevant_articles)}/{len(test_articles)} articles passed")
+    print(f"\n✅ Filtering and scoring complete: {len(scored_articles)}/{len(test_articles)} articles passed")
     
-    if not relevant_articles:
+    if not scored_articles:
         print("\n❌ No articles passed first pass filtering. Exiting.")
         return
     
-    # Phase 2: Scoring
-    print("\n" + "="*60)
-    print("📊 PHASE 2: Article Scoring")
-    print("="*60)
-    
-    scored_articles = []
-    
-    for item in relevant_articles:
-        article = item['article']
-        print(f"\nScoring: {article.title[:60]}...")
-        
-        response = scoring_agent.score_article(
-            article=article,
-            first_pass_reasoning=item['first_pass_reasoning'],
-            article_id=item['id'],
-            save_responses=True
-        )
-        
-        # For demo, use placeholder scores
-        score = 7.5 + (item['id'] % 3)  # Vary scores for demo
-        print(f"    → Score: {score:.1f}/10")
-        
-        scored_articles.append({
-            'id': item['id'],
-            'title': article.title,
-            'domain': article.domain,
-            'url': article.url,
-            'content': article.content,
-            'overall_score': score,
-            'first_pass_reasoning': item['first_pass_reasoning']
-        })
-    
-    # Sort by score
-    scored_articles.sort(key=lambda x: x['overall_score'], reverse=True)
-    
+    scores = np.fromiter(
+        (a['overall_score'] for a in scored_articles),
+        dtype=np.float64,
+        count=len(scored_articles)
+    )
     phase_stats['scoring'] = {
         'total': len(scored_articles),
-        'avg_score': sum(a['overall_score'] for a in scored_articles) / len(scored_articles),
-        'high_quality': len([a for a in scored_articles if a['overall_score'] > 7])
+        'avg_score': float(scores.mean()),
+        'high_quality': int((scores > 7).sum())
     }
     
     # Phase 3: Final Selection
@@ -156,10 +148,25 @@ def main():
     print("="*60)
     
     max_articles = 3
+    
+    # Only send viable candidates to the selector: drop anything below the
+    # median score (never cutting into the top max_articles) or the cutoff
+    kth_score = np.partition(scores, -max_articles)[-max_articles] if len(scores) > max_articles else scores.min()
+    threshold = max(MIN_SELECTION_SCORE, min(float(np.median(scores)), float(kth_score)))
+    candidates = [a for a in scored_articles if a['overall_score'] >= threshold]
+    print(f"\n📉 Score threshold {threshold:.1f}: {len(candidates)}/{len(scored_articles)} candidates")
+    
+    if not candidates:
+        print("\n❌ No articles met the score threshold. Exiting.")
+        return
+    
+    # Rank only the head of the list; the selector reads at most its top 50
+    ranked_articles = heapq.nlargest(50, candidates, key=lambda x: x['overall_score'])
+    
     batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     response = selector_agent.select_articles(
-        scored_articles=scored_articles,
+        scored_articles=ranked_articles,
         max_articles=max_articles,
         batch_id=batch_id,
         save_responses=True
@@ -167,7 +174,7 @@ def main():
     
     # Prepare final selections
     selected_articles = []
-    for idx, article in enumerate(scored_articles[:max_articles], 1):
+    for idx, article in enumerate(ranked_articles[:max_articles], 1):
         selected_articles.append({
             'rank': idx,
             'title': article['title'],
@@ -180,7 +187,7 @@ def main():
         })
     
     phase_stats['selection'] = {
-        'candidates': len(scored_articles),
+        'candidates': len(candidates),
         'selected': len(selected_articles),
         'avg_selected_score': sum(a['overall_score'] for a in selected_articles) / len(selected_articles)
     }
@@ -193,7 +200,7 @@ def main():
         selected_articles=selected_articles,
         batch_id=batch_id,
         total_processed=len(test_articles),
-        total_relevant=len(relevant_articles),
+        total_relevant=len(scored_articles),
         show_details=True
     )
     
@@ -208,12 +215,21 @@ def main():
     print("\n📁 Check output/responses/ for saved agent interactions.")
 
 
+async def run_demo():
+    """Run the demo, then finish saving responses and release the shared LLM HTTP client."""
+    try:
+        await main()
+    finally:
+        await adrain_response_writers()
+        await close_http_client()
+
+
 if __name__ == "__main__":
     print("\n⚠️  Note: This demo requires AWS credentials for Claude.")
     print("   Make sure you have configured your .env file.\n")
     
     try:
-        main()
+        asyncio.run(run_demo())
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("\nTip: Make sure you have:")
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Example usage of the Article Selector agents."""
 
+import asyncio
 import json
 from datetime import datetime
+from core.agents import close_http_client
+from core.batch_processor import BatchProcessor
+from core.settings import settings
 from projects.article_selector.models import Article
 from projects.article_selector.agents import (
     get_first_pass_agent,
@@ -10,27 +14,39 @@ from projects.article_selector.agents import (
     get_selector_agent,
 )
 
+# Prompt templates, filled per article from its fields
+_EVAL_TPL = """Evaluate this article:
+Title: {title}
+Content: {content}
+Domain: {domain}"""
 
-def main():
+_SCORE_TPL = """Score this article that passed first-pass filtering:
+Title: {title}
+Content: {content}
+Domain: {domain}
+First-pass reasoning: Passed initial relevance check for open source security."""
+
+
+async def main():
     """Demonstrate the article selection pipeline."""
     
     # Sample articles for testing
     articles = [
-        Article(
+        Article.trusted(
             title="Critical Vulnerability Found in OpenSSL 3.0",
             content="A critical vulnerability has been discovered in OpenSSL 3.0 that could allow remote code execution. The vulnerability affects all versions prior to 3.0.12. The OpenSSL team has released an emergency patch.",
             url="https://www.openssl.org/news/",
             domain="openssl.org",
             published_date=datetime.now(),
         ),
-        Article(
+        Article.trusted(
             title="Microsoft Patches Windows Zero-Day",
             content="Microsoft has released an emergency patch for a zero-day vulnerability in Windows 11. The vulnerability was being actively exploited in the wild.",
             url="https://www.microsoft.com/",
             domain="microsoft.com",
             published_date=datetime.now(),
         ),
-        Article(
+        Article.trusted(
             title="New Supply Chain Attack on npm Packages",
             content="Security researchers discovered a sophisticated supply chain attack targeting popular npm packages. The attack affected packages with millions of weekly downloads including several React components.",
             url="https://snyk.io/blog/",
@@ -48,17 +64,26 @@ def main():
     print("-" * 40)
     
     first_pass = get_first_pass_agent(debug_mode=False)
+    batch_processor = BatchProcessor()
     filtered_articles = []
     
-    for article in articles:
+    messages = [_EVAL_TPL.format_map(article.__dict__) for article in articles]
+    
+    # Articles are independent, so evaluate them concurrently
+    results = await batch_processor.run_batch(
+        first_pass.arun,
+        messages,
+        max_concurrency=settings.max_concurrent_llm_calls,
+        rpm=settings.llm_requests_per_minute
+    )
+    
+    for article, result in zip(articles, results):
         print(f"\nEvaluating: {article.title}")
         
-        message = f"""Evaluate this article:
-Title: {article.title}
-Content: {article.content}
-Domain: {article.domain}"""
+        if isinstance(result, Exception):
+            print(f"  ❌ Error: {result}")
+            continue
         
-        result = first_pass.run(message)
         print(f"  Status: {result.content}")
         
         # Parse result (in real implementation, use structured output)
@@ -72,20 +97,27 @@ Domain: {article.domain}"""
     print("\n📊 STEP 2: Scoring Relevant Articles")
     print("-" * 40)
     
+    scored_articles = []
+    
     if filtered_articles:
         scoring = get_scoring_agent(debug_mode=False)
-        scored_articles = []
         
-        for article in filtered_articles:
+        messages = [_SCORE_TPL.format_map(article.__dict__) for article in filtered_articles]
+        
+        results = await batch_processor.run_batch(
+            scoring.arun,
+            messages,
+            max_concurrency=settings.max_concurrent_llm_calls,
+            rpm=settings.llm_requests_per_minute
+        )
+        
+        for article, result in zip(filtered_articles, results):
             print(f"\nScoring: {article.title}")
             
-            message = f"""Score this article that passed first-pass filtering:
-Title: {article.title}
-Content: {article.content}
-Domain: {article.domain}
-First-pass reasoning: Passed initial relevance check for open source security."""
+            if isinstance(result, Exception):
+                print(f"  ❌ Error: {result}")
+                continue
             
-            result = scoring.run(message)
             print(f"  Score: {result.content}")
             scored_articles.append({
                 "article": article,
@@ -110,7 +142,7 @@ First-pass reasoning: Passed initial relevance check for open source security.""
 
 Select the best articles for an open source security newsletter."""
         
-        result = selector.run(message)
+        result = await selector.arun(message)
         print(f"\nFinal Selection:\n{result.content}")
     
     print("\n" + "=" * 60)
@@ -118,13 +150,21 @@ Select the best articles for an open source security newsletter."""
     print("=" * 60)
 
 
+async def run_example():
+    """Run the example and release the shared LLM HTTP client afterwards."""
+    try:
+        await main()
+    finally:
+        await close_http_client()
+
+
 if __name__ == "__main__":
     # Note: This requires AWS credentials to be configured for Claude
     print("\nNote: Make sure AWS credentials are configured for Claude (Bedrock)")
     print("Export: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_DEFAULT_REGION\n")
     
     try:
-        main()
+        asyncio.run(run_example())
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("\nTip: Make sure you have:")
@@ -2,6 +2,8 @@
 """Explore MotherDuck to find the articles source table."""
 
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import duckdb
 
@@ -25,51 +27,74 @@ def explore_motherduck():
         for db in databases:
             print(f"   - {db[0]}")
         
+        # Fetch every table's columns and approximate row count up front:
+        # two metadata queries instead of COUNT/DESCRIBE round-trips per table
+        columns = defaultdict(list)
+        schemas = {}
+        for catalog, schema, table_name, column_name, data_type in conn.execute("""
+            SELECT table_catalog, table_schema, table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_catalog NOT IN ('system', 'temp')
+            ORDER BY table_catalog, table_name, ordinal_position
+        """).fetchall():
+            columns[(catalog, table_name)].append((column_name, data_type))
+            schemas[(catalog, table_name)] = schema
+        
+        row_counts = {
+            (catalog, table_name): size
+            for catalog, table_name, size in conn.execute(
+                "SELECT database_name, table_name, estimated_size FROM duckdb_tables()"
+            ).fetchall()
+        }
+        
+        # Views have no size estimate; count them exactly, in parallel, each on
+        # its own cursor with a fully-qualified name (no per-database USE)
+        def count_rows(key):
+            catalog, table_name = key
+            cursor = conn.cursor()
+            try:
+                return cursor.execute(
+                    f'SELECT COUNT(*) FROM "{catalog}"."{schemas[key]}"."{table_name}"'
+                ).fetchone()[0]
+            except Exception:
+                return None
+            finally:
+                cursor.close()
+        
+        uncounted = [key for key in columns if key not in row_counts]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            exact_counts = dict(zip(uncounted, executor.map(count_rows, uncounted)))
+        
+        tables_by_db = defaultdict(list)
+        for catalog, table_name in columns:
+            tables_by_db[catalog].append(table_name)
+        
         # Check each database for tables
         for db in databases:
             db_name = db[0]
             if db_name not in ['system', 'temp']:  # Skip system databases
                 print(f"\n📁 Database: {db_name}")
-                try:
-                    conn.execute(f"USE {db_name}")
-                    tables = conn.execute("SHOW TABLES").fetchall()
-                    if tables:
-                        print(f"   Tables:")
-                        for table in tables:
-                            print(f"      - {table[0]}")
-                            # Get row count
-                            try:
-                                count = conn.execute(f"SELECT COUNT(*) FROM {table[0]}").fetchone()[0]
-                                print(f"        ({count} rows)")
-                            except:
-                                pass
-                    else:
-                        print(f"   No tables")
-                except Exception as e:
-                    print(f"   Error accessing: {e}")
+                tables = tables_by_db.get(db_name)
+                if tables:
+                    print(f"   Tables:")
+                    for table_name in tables:
+                        print(f"      - {table_name}")
+                        count = row_counts.get((db_name, table_name))
+                        if count is not None:
+                            print(f"        (~{count} rows)")
+                        elif exact_counts.get((db_name, table_name)) is not None:
+                            print(f"        ({exact_counts[(db_name, table_name)]} rows)")
+                else:
+                    print(f"   No tables")
         
         # Check for article-related tables in newsletter-data
         print("\n🔍 Checking newsletter-data database in detail...")
-        conn.execute("USE `newsletter-data`")
         
-        # Look for any table with article/news/feed in the name
-        all_tables = conn.execute("SHOW TABLES").fetchall()
         print(f"\nAll tables in newsletter-data:")
-        for table in all_tables:
-            table_name = table[0]
+        for table_name in tables_by_db.get('newsletter-data', []):
             print(f"\n  Table: {table_name}")
-            
-            # Get schema for each table
-            try:
-                schema = conn.execute(f"DESCRIBE {table_name}").fetchall()
-                print(f"  Columns: {', '.join([col[0] for col in schema[:5]])}...")
-                
-                # Get sample data
-                sample = conn.execute(f"SELECT * FROM {table_name} LIMIT 1").fetchone()
-                if sample and len(sample) > 0:
-                    print(f"  Sample: {str(sample[0])[:100]}...")
-            except Exception as e:
-                print(f"  Error: {e}")
+            schema = columns[('newsletter-data', table_name)]
+            print(f"  Columns: {', '.join([f'{name} {data_type}' for name, data_type in schema[:5]])}...")
         
         conn.close()
         
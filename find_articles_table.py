@@ -2,11 +2,29 @@
 """Find the articles source table in MotherDuck."""
 
 import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import duckdb
 
 load_dotenv()
 
+# Column-name keywords suggesting an articles table
+_ARTICLE_PAT = re.compile(r"article|title|content|url|domain", re.IGNORECASE)
+
+
+def _probe(conn, query: str):
+    """Run a query on its own cursor, returning the first row or None on error."""
+    cursor = conn.cursor()
+    try:
+        return cursor.execute(query).fetchone()
+    except Exception:
+        return None
+    finally:
+        cursor.close()
+
+
 def find_articles_table():
     """Find where articles are stored."""
     
@@ -20,36 +38,57 @@ def find_articles_table():
         conn = duckdb.connect(f"md:{database}?motherduck_token={token}")
         print("✅ Connected!")
         
-        # List all tables
-        tables = conn.execute("SHOW TABLES").fetchall()
+        # Fetch all columns and approximate row counts in two metadata queries
+        # rather than COUNT(*) + DESCRIBE per table
+        columns = defaultdict(list)
+        for table_name, column_name in conn.execute("""
+            SELECT table_name, column_name
+            FROM information_schema.columns
+            WHERE table_catalog = current_database()
+            ORDER BY table_name, ordinal_position
+        """).fetchall():
+            columns[table_name].append(column_name)
+        
+        row_counts = dict(conn.execute("""
+            SELECT table_name, estimated_size
+            FROM duckdb_tables()
+            WHERE database_name = current_database()
+        """).fetchall())
+        
+        # Fetch samples for article-like tables concurrently, one cursor each
+        candidates = [
+            table_name for table_name, col_names in columns.items()
+            if _ARTICLE_PAT.search(' '.join(col_names))
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            samples = dict(zip(candidates, executor.map(
+                lambda name: _probe(conn, f"SELECT * FROM {name} LIMIT 1"),
+                candidates
+            )))
+        
         print(f"\n📊 Tables in {database}:")
-        for table in tables:
-            table_name = table[0]
+        for table_name, col_names in columns.items():
             print(f"\n  📁 {table_name}")
             
             # Get table info
             try:
-                # Row count
-                count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
-                print(f"     Rows: {count}")
+                if table_name in row_counts:
+                    print(f"     Rows: ~{row_counts[table_name]}")
                 
                 # Schema (first 8 columns)
-                schema = conn.execute(f"DESCRIBE {table_name}").fetchall()
-                cols = [col[0] for col in schema[:8]]
-                print(f"     Columns: {', '.join(cols)}")
+                print(f"     Columns: {', '.join(col_names[:8])}")
                 
                 # Check if it looks like an articles table
-                col_names = [col[0].lower() for col in schema]
-                if any(word in ' '.join(col_names) for word in ['article', 'title', 'content', 'url', 'domain']):
+                if table_name in samples:
                     print(f"     ⭐ This looks like an articles table!")
                     
                     # Show a sample
-                    sample = conn.execute(f"SELECT * FROM {table_name} LIMIT 1").fetchone()
+                    sample = samples[table_name]
                     if sample:
                         print(f"     Sample record:")
-                        for i, col in enumerate(schema[:5]):
+                        for i, col in enumerate(col_names[:5]):
                             if i < len(sample):
-                                print(f"       {col[0]}: {str(sample[i])[:80]}")
+                                print(f"       {col}: {str(sample[i])[:80]}")
                 
             except Exception as e:
                 print(f"     Error: {e}")
@@ -60,18 +99,19 @@ def find_articles_table():
                        'raw_articles', 'source_articles', 'newsletter_articles',
                        'scraped_articles', 'article_feed', 'news_articles']
         
-        for name in common_names:
-            try:
-                count = conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
-                print(f"   ✅ Found table '{name}' with {count} rows!")
+        # Probe the candidate names concurrently; missing tables yield None
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            counts = list(executor.map(
+                lambda name: _probe(conn, f"SELECT COUNT(*) FROM {name}"),
+                common_names
+            ))
+        
+        for name, count in zip(common_names, counts):
+            if count is not None:
+                print(f"   ✅ Found table '{name}' with {count[0]} rows!")
                 
                 # Show schema
-                schema = conn.execute(f"DESCRIBE {name}").fetchall()
-                print(f"      Columns: {', '.join([col[0] for col in schema[:8]])}")
-                
-            except:
-                # Table doesn't exist
-                pass
+                print(f"      Columns: {', '.join(columns.get(name, [])[:8])}")
         
         conn.close()
         
@@ -1,20 +1,51 @@
 """Article Selector Agents Registration."""
 
-from core.agents import agent_registry
-from .first_pass_agent import get_first_pass_agent
-from .scoring_agent import get_scoring_agent
-from .selector_agent import get_selector_agent
-from .comparative_ranker_agent import get_comparative_ranker_agent
+import os
+import threading
+
+from core.agents import agent_registry, get_gemini
+from .first_pass_agent import get_first_pass_agent, get_first_pass_instructions
+from .scoring_agent import get_scoring_agent, get_scoring_instructions
+from .filter_and_score_agent import get_filter_and_score_agent, get_filter_and_score_instructions
+from .selector_agent import get_selector_agent, get_selector_instructions
+from .comparative_ranker_agent import get_comparative_ranker_agent, get_comparative_ranker_instructions
 
 # Register agents with the article_selector category
 agent_registry.register_agent("article_selector", "first_pass", get_first_pass_agent)
 agent_registry.register_agent("article_selector", "scoring", get_scoring_agent)
+agent_registry.register_agent("article_selector", "filter_and_score", get_filter_and_score_agent)
 agent_registry.register_agent("article_selector", "comparative_ranker", get_comparative_ranker_agent)
 agent_registry.register_agent("article_selector", "selector", get_selector_agent)
 
+
+def _warm_start(model_id: str = "gemini-2.0-flash"):
+    """Load the memoized prompts and the shared Gemini model and client ahead of first use."""
+    get_first_pass_instructions()
+    get_scoring_instructions()
+    get_filter_and_score_instructions()
+    get_selector_instructions()
+    get_comparative_ranker_instructions()
+    
+    model = get_gemini(model_id)
+    # Creating the provider client needs credentials; without them the first
+    # agent call reports the problem instead. Reads the environment (already
+    # populated from .env) rather than settings, so importing stays free of
+    # Settings construction
+    use_vertexai = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "").lower() in ("1", "true")
+    if os.getenv("GOOGLE_API_KEY") or use_vertexai:
+        try:
+            model.get_client()
+        except Exception:
+            pass
+
+
+# Warm the caches off the critical path so the first factory call is a lookup
+threading.Thread(target=_warm_start, name="agent-warm-start", daemon=True).start()
+
 __all__ = [
     "get_first_pass_agent",
     "get_scoring_agent",
+    "get_filter_and_score_agent",
     "get_comparative_ranker_agent",
     "get_selector_agent",
 ]
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""First pass filtering through the Gemini Batch API.
+
+Batch jobs are billed at a discount and remove one HTTPS round-trip per
+article, at the cost of latency (jobs complete asynchronously).
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from google import genai
+
+from projects.article_selector.agents.first_pass_agent import get_first_pass_instructions
+from projects.article_selector.agents.tracked_agents import TrackedFirstPassAgent
+from projects.article_selector.models import Article
+
+_TERMINAL_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+def _get_client() -> genai.Client:
+    """Create a Gemini client from the environment (GOOGLE_API_KEY or Vertex AI settings)."""
+    return genai.Client()
+
+
+def submit_batch(
+    articles_data: List[Dict[str, Any]],
+    model_id: str = "gemini-2.0-flash",
+) -> str:
+    """Submit first pass classification for all articles as a single batch job.
+
+    Args:
+        articles_data: Article rows with id, title, content, url and domain
+        model_id: Gemini model to run the batch on
+
+    Returns:
+        Batch job name used to poll for results
+    """
+    instructions = get_first_pass_instructions()
+
+    requests = []
+    for article_data in articles_data:
+        article = Article(
+            title=article_data['title'],
+            content=article_data['content'],
+            url=article_data.get('url'),
+            domain=article_data.get('domain'),
+        )
+        input_text, _ = TrackedFirstPassAgent._prepare_input(article)
+        requests.append({
+            "contents": [{"role": "user", "parts": [{"text": input_text}]}],
+            "config": {"system_instruction": instructions},
+            "metadata": {"article_id": str(article_data['id'])},
+        })
+
+    job = _get_client().batches.create(
+        model=model_id,
+        src=requests,
+        config={"display_name": f"first_pass_{int(time.time())}"},
+    )
+    return job.name
+
+
+def poll_until_done(
+    batch_id: str,
+    poll_interval: float = 30.0,
+    timeout: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Wait for a batch job to finish and parse its first pass results.
+
+    Args:
+        batch_id: Batch job name returned by submit_batch
+        poll_interval: Seconds between status checks
+        timeout: Optional maximum seconds to wait
+
+    Returns:
+        List of results with article_id, status and reasoning
+    """
+    client = _get_client()
+    deadline = time.time() + timeout if timeout else None
+
+    job = client.batches.get(name=batch_id)
+    while job.state.name not in _TERMINAL_STATES:
+        if deadline and time.time() > deadline:
+            raise TimeoutError(f"Batch job {batch_id} did not finish within {timeout}s")
+        time.sleep(poll_interval)
+        job = client.batches.get(name=batch_id)
+
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        raise RuntimeError(f"Batch job {batch_id} ended in state {job.state.name}")
+
+    results = []
+    for response in job.dest.inlined_responses or []:
+        article_id = (response.metadata or {}).get("article_id")
+        if response.error or response.response is None:
+            status = "Irrelevant"
+            reasoning = f"Error: {response.error}"
+        else:
+            _, status, reasoning = TrackedFirstPassAgent._parse_result(response.response.text or "")
+        results.append({
+            "article_id": article_id,
+            "status": status,
+            "reasoning": reasoning,
+        })
+
+    return results
@@ -1,9 +1,10 @@
 """Comparative Ranker Agent for relative article ranking within batches."""
 
+import functools
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.google import Gemini
+from core.agents import get_cached_content, get_gemini
 from pydantic import BaseModel, Field
 
 
@@ -19,6 +20,7 @@ class ComparativeRankingResult(BaseModel):
     ranked_articles: List[RankedArticle] = Field(description="Articles ranked within batch")
 
 
+@functools.lru_cache(maxsize=1)
 def get_comparative_ranker_instructions() -> str:
     """Generate instructions for the comparative ranker agent."""
     
@@ -38,6 +40,7 @@ def get_comparative_ranker_agent(
     user_id: Optional[str] = None,
     session_id: Optional[str] = None,
     debug_mode: bool = False,
+    cache_key: Optional[str] = None,
 ) -> Agent:
     """Factory function to create the Comparative Ranker Agent.
     
@@ -46,21 +49,28 @@ def get_comparative_ranker_agent(
         user_id: Optional user ID for tracking
         session_id: Optional session ID for conversation context
         debug_mode: Enable debug output
+        cache_key: Cache the static instructions server-side under this key
+            (falls back to sending them per request if caching fails)
         
     Returns:
         Configured Agent instance
     """
     
+    instructions = get_comparative_ranker_instructions()
+    cached_content = get_cached_content(model_id, cache_key, instructions) if cache_key else None
+    
     return Agent(
         name="Comparative Ranker",
         agent_id="comparative_ranker_agent",
         user_id=user_id,
         session_id=session_id,
-        model=Gemini(id=model_id),
+        model=get_gemini(model_id, cached_content),
         description="Re-ranks articles within batches using comparative analysis and domain credibility",
-        instructions=get_comparative_ranker_instructions(),
+        instructions=instructions,
         response_model=ComparativeRankingResult,
         markdown=False,  # Structured JSON output
         add_datetime_to_instructions=True,
         debug_mode=debug_mode,
+        # Cached content already carries the system prompt
+        create_default_system_message=cached_content is None,
     )
\ No newline at end of file
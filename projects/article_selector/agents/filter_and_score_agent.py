@@ -0,0 +1,102 @@
+"""Combined First Pass Filtering and Scoring Agent for article selection."""
+
+import functools
+from typing import Optional
+from pathlib import Path
+from agno.agent import Agent
+from core.agents import CachedAgent, get_cached_content, get_gemini
+from core.semantic_cache import SemanticCache
+from core.settings import settings
+from projects.article_selector.models import FilterScoreResult
+
+# Start of the input/output format section in the task prompts
+_FORMAT_MARKER = "\n---\n\nYou will receive"
+
+_COMBINED_FORMAT = """---
+
+You will receive the article in the following format:
+- Article Title: [title]
+- Source Domain: [domain]
+- Article Content: [content]
+- URL: [url]
+
+---
+
+First apply the First Pass criteria and decide whether the article is Relevant or Irrelevant, with a concise justification.
+If it is Relevant, score it from 0-10 using the Scoring criteria and give a brief rationale.
+If it is Irrelevant, set the score to 0 and leave the rationale empty."""
+
+
+@functools.lru_cache(maxsize=1)
+def get_filter_and_score_instructions() -> str:
+    """Generate instructions for the combined filter and score agent."""
+    
+    # Load the prompts, keeping only the criteria of each task prompt
+    prompt_dir = Path(__file__).parent.parent / "prompts"
+    with open(prompt_dir / "system_prompt.txt", "r") as f:
+        system_prompt = f.read()
+    
+    with open(prompt_dir / "first_pass_prompt.txt", "r") as f:
+        first_pass_prompt = f.read().split(_FORMAT_MARKER, 1)[0].rstrip()
+    
+    with open(prompt_dir / "scoring_prompt.txt", "r") as f:
+        scoring_prompt = f.read().split(_FORMAT_MARKER, 1)[0].rstrip()
+    
+    return "\n\n---\n\n".join([
+        system_prompt,
+        "# First Pass criteria\n\n" + first_pass_prompt,
+        "# Scoring criteria\n\n" + scoring_prompt,
+    ]) + "\n\n" + _COMBINED_FORMAT
+
+
+def get_filter_and_score_agent(
+    model_id: str = "gemini-2.0-flash",
+    user_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    debug_mode: bool = False,
+    cache_key: Optional[str] = None,
+    similarity_threshold: Optional[float] = None,
+) -> Agent:
+    """Factory function to create the combined First Pass Filtering and Scoring Agent.
+    
+    One call both filters and scores an article, replacing a first pass call
+    followed by a scoring call.
+    
+    Args:
+        model_id: The model ID to use
+        user_id: Optional user ID for tracking
+        session_id: Optional session ID for conversation context
+        debug_mode: Enable debug output
+        cache_key: Cache the static instructions server-side under this key
+            (falls back to sending them per request if caching fails)
+        similarity_threshold: Minimum prompt similarity for reusing a cached
+            response (defaults to the SEMANTIC_CACHE_THRESHOLD setting; the
+            semantic cache is off when neither is set)
+        
+    Returns:
+        Configured Agent instance
+    """
+    
+    instructions = get_filter_and_score_instructions()
+    cached_content = get_cached_content(model_id, cache_key, instructions) if cache_key else None
+    
+    agent = CachedAgent(
+        name="Filter and Score",
+        agent_id="filter_and_score_agent",
+        user_id=user_id,
+        session_id=session_id,
+        model=get_gemini(model_id, cached_content),
+        description="Filters articles for open source security relevance and scores the relevant ones in a single pass",
+        instructions=instructions,
+        response_model=FilterScoreResult,
+        markdown=False,  # Structured output
+        add_datetime_to_instructions=True,
+        debug_mode=debug_mode,
+        # Cached content already carries the system prompt
+        create_default_system_message=cached_content is None,
+    )
+    if similarity_threshold is None:
+        similarity_threshold = settings.semantic_cache_threshold
+    if similarity_threshold is not None:
+        agent.semantic_cache = SemanticCache(threshold=similarity_threshold)
+    return agent
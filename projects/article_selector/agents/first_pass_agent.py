@@ -1,13 +1,17 @@
 """First Pass Filtering Agent for article selection."""
 
+import functools
 from textwrap import dedent
 from typing import Optional
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.google import Gemini
+from core.agents import CachedAgent, get_cached_content, get_gemini
+from core.semantic_cache import SemanticCache
+from core.settings import settings
 from projects.article_selector.models import FirstPassResult
 
 
+@functools.lru_cache(maxsize=1)
 def get_first_pass_instructions() -> str:
     """Generate instructions for the first pass agent."""
     
@@ -27,6 +31,8 @@ def get_first_pass_agent(
     user_id: Optional[str] = None,
     session_id: Optional[str] = None,
     debug_mode: bool = False,
+    cache_key: Optional[str] = None,
+    similarity_threshold: Optional[float] = None,
 ) -> Agent:
     """Factory function to create the First Pass Filtering Agent.
     
@@ -35,21 +41,36 @@ def get_first_pass_agent(
         user_id: Optional user ID for tracking
         session_id: Optional session ID for conversation context
         debug_mode: Enable debug output
+        cache_key: Cache the static instructions server-side under this key
+            (falls back to sending them per request if caching fails)
+        similarity_threshold: Minimum prompt similarity for reusing a cached
+            response (defaults to the SEMANTIC_CACHE_THRESHOLD setting; the
+            semantic cache is off when neither is set)
         
     Returns:
         Configured Agent instance
     """
     
-    return Agent(
+    instructions = get_first_pass_instructions()
+    cached_content = get_cached_content(model_id, cache_key, instructions) if cache_key else None
+    
+    agent = CachedAgent(
         name="First Pass Filter",
         agent_id="first_pass_agent",
         user_id=user_id,
         session_id=session_id,
-        model=Gemini(id=model_id),
+        model=get_gemini(model_id, cached_content),
         description="Determines if an article is relevant based on strict open source security criteria and domain credibility",
-        instructions=get_first_pass_instructions(),
+        instructions=instructions,
         # response_model=FirstPassResult,  # Disabled to match ADK plain text output
         markdown=False,
         add_datetime_to_instructions=True,
         debug_mode=debug_mode,
-    )
\ No newline at end of file
+        # Cached content already carries the system prompt
+        create_default_system_message=cached_content is None,
+    )
+    if similarity_threshold is None:
+        similarity_threshold = settings.semantic_cache_threshold
+    if similarity_threshold is not None:
+        agent.semantic_cache = SemanticCache(threshold=similarity_threshold)
+    return agent
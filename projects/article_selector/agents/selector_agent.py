@@ -1,13 +1,15 @@
 """Selector Agent for final article selection and ranking."""
 
+import functools
 from textwrap import dedent
 from typing import Optional
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.google import Gemini
+from core.agents import get_cached_content, get_gemini
 from projects.article_selector.models import SelectorResult
 
 
+@functools.lru_cache(maxsize=1)
 def get_selector_instructions() -> str:
     """Generate instructions for the selector agent."""
     
@@ -27,6 +29,7 @@ def get_selector_agent(
     user_id: Optional[str] = None,
     session_id: Optional[str] = None,
     debug_mode: bool = False,
+    cache_key: Optional[str] = None,
 ) -> Agent:
     """Factory function to create the Selector Agent.
     
@@ -35,21 +38,28 @@ def get_selector_agent(
         user_id: Optional user ID for tracking
         session_id: Optional session ID for conversation context
         debug_mode: Enable debug output
+        cache_key: Cache the static instructions server-side under this key
+            (falls back to sending them per request if caching fails)
         
     Returns:
         Configured Agent instance
     """
     
+    instructions = get_selector_instructions()
+    cached_content = get_cached_content(model_id, cache_key, instructions) if cache_key else None
+    
     return Agent(
         name="Article Selector",
         agent_id="selector_agent",
         user_id=user_id,
         session_id=session_id,
-        model=Gemini(id=model_id),
+        model=get_gemini(model_id, cached_content),
         description="Selects and ranks the best articles from scored candidates for the newsletter",
-        instructions=get_selector_instructions(),
+        instructions=instructions,
         response_model=SelectorResult,
         markdown=False,  # Structured output
         add_datetime_to_instructions=True,
         debug_mode=debug_mode,
+        # Cached content already carries the system prompt
+        create_default_system_message=cached_content is None,
     )
\ No newline at end of file
@@ -1,15 +1,31 @@
 """Enhanced agents with response tracking capabilities."""
 
+import asyncio
+import functools
+import re
+import uuid
 from typing import Optional, Dict, Any, List
-from pathlib import Path
 from agno.models.message import Message
-from core.response_tracker import ResponseTracker
+from core.agent_cache import arun_with_cache, run_with_cache
+from core.response_tracker import get_response_tracker
 from projects.article_selector.agents import (
     get_first_pass_agent as base_first_pass_agent,
     get_scoring_agent as base_scoring_agent,
+    get_filter_and_score_agent as base_filter_and_score_agent,
     get_selector_agent as base_selector_agent,
 )
-from projects.article_selector.models import Article
+from projects.article_selector.agents.first_pass_agent import get_first_pass_instructions
+from projects.article_selector.models import Article, FilterScoreResult, FirstPassBatchResult
+
+# Score patterns for free-text scoring responses
+_SCORE_RE = re.compile(r'score:\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+_NUM_RE = re.compile(r'\b([0-9]|10)(?:\.\d+)?\b')
+
+
+def extract_text(result: Any) -> str:
+    """Get an agent response's content (or the object itself, if it has none) as text."""
+    content = getattr(result, 'content', result)
+    return content if isinstance(content, str) else str(content)
 
 
 class TrackedFirstPassAgent:
@@ -18,7 +34,51 @@ class TrackedFirstPassAgent:
     def __init__(self, debug_mode: bool = False):
         """Initialize tracked first pass agent."""
         self.agent = base_first_pass_agent(debug_mode=debug_mode)
-        self.tracker = ResponseTracker(Path("output/responses"))
+        self.tracker = get_response_tracker()
+    
+    @staticmethod
+    def _prepare_input(article: Article) -> tuple:
+        """Build the agent prompt and the tracked input payload for an article."""
+        input_text = f"""Article Title: {article.title}
+Source Domain: {article.domain or 'unknown'}
+Article Content: {article.truncated_content or 'None'}"""
+        
+        input_data = {
+            "title": article.title,
+            "content": article.truncated_content,
+            "domain": article.domain,
+            "url": article.url
+        }
+        return input_text, input_data
+    
+    @staticmethod
+    def _parse_result(result: Any) -> tuple:
+        """Parse status and reasoning from a first pass agent response."""
+        # Parse result - now expecting plain text like ADK
+        result_text = extract_text(result)
+        
+        # Parse ADK format: "first_pass_result: Relevant/Irrelevant. Reasoning..."
+        i = result_text.find("first_pass_result:")
+        if i >= 0:
+            n = len(result_text)
+            j = i + 18  # len("first_pass_result:")
+            while j < n and result_text[j].isspace():
+                j += 1
+            for status in ("Relevant", "Irrelevant"):
+                if result_text.startswith(status, j):
+                    # Reasoning starts after the separating period and whitespace
+                    k = j + len(status)
+                    while k < n and (result_text[k] == '.' or result_text[k].isspace()):
+                        k += 1
+                    return result_text, status, result_text[k:].rstrip()
+        
+        # Fallback: relevant unless the first sentence says otherwise
+        first_dot = result_text.find('.')
+        irrelevant = result_text.find("Irrelevant", 0, first_dot if first_dot >= 0 else len(result_text)) >= 0
+        status = "Relevant" if "Relevant" in result_text and not irrelevant else "Irrelevant"
+        reasoning = result_text
+        
+        return result_text, status, reasoning
     
     def process_article(
         self,
@@ -36,48 +96,17 @@ class TrackedFirstPassAgent:
         Returns:
             Processing result with status
         """
-        # Prepare input
-        input_text = f"""Article Title: {article.title}
-Source Domain: {article.domain or 'unknown'}
-Article Content: {article.content[:1000] if article.content else 'None'}"""
-        
-        input_data = {
-            "title": article.title,
-            "content": article.content[:1000] if article.content else "",
-            "domain": article.domain,
-            "url": article.url
-        }
+        input_text, input_data = self._prepare_input(article)
         
         try:
-            # Run the agent with proper Message format
-            messages = [Message(role="user", content=input_text)]
-            result = self.agent.run(messages=messages)
-            
-            # Parse result - now expecting plain text like ADK
-            result_text = str(result.content) if hasattr(result, 'content') else str(result)
-            
-            # Parse ADK format: "first_pass_result: Relevant/Irrelevant. Reasoning..."
-            if "first_pass_result:" in result_text:
-                # Extract status and reasoning from ADK format
-                parts = result_text.split("first_pass_result:", 1)[1].strip()
-                if parts.startswith("Relevant"):
-                    status = "Relevant"
-                    reasoning = parts[8:].strip().lstrip('.').strip()
-                elif parts.startswith("Irrelevant"):
-                    status = "Irrelevant"
-                    reasoning = parts[10:].strip().lstrip('.').strip()
-                else:
-                    # Fallback
-                    status = "Relevant" if "Relevant" in result_text and "Irrelevant" not in result_text.split(".")[0] else "Irrelevant"
-                    reasoning = result_text
-            else:
-                # Fallback to simple parsing
-                status = "Relevant" if "Relevant" in result_text and "Irrelevant" not in result_text.split(".")[0] else "Irrelevant"
-                reasoning = result_text
+            # Run the agent, reusing the response to an identical earlier prompt
+            result = run_with_cache(self.agent, input_text)
+            
+            result_text, status, reasoning = self._parse_result(result)
             
             # Save if requested
             if save_responses:
-                self.tracker.save_agent_interaction(
+                self.tracker.enqueue_agent_interaction(
                     agent_type="first_pass",
                     article_id=article_id or article.title[:50],
                     input_data=input_data,
@@ -97,6 +126,147 @@ Article Content: {article.content[:1000] if article.content else 'None'}"""
                 "result": None,
                 "reasoning": f"Error: {str(e)}"
             }
+    
+    async def aprocess_article(
+        self,
+        article: Article,
+        article_id: Optional[Any] = None,
+        save_responses: bool = True
+    ) -> Dict[str, Any]:
+        """Async variant of process_article for concurrent batch processing.
+        
+        Args:
+            article: Article to process
+            article_id: Optional article ID for tracking
+            save_responses: Whether to save responses to files
+            
+        Returns:
+            Processing result with status
+        """
+        input_text, input_data = self._prepare_input(article)
+        
+        try:
+            result = await arun_with_cache(self.agent, input_text)
+            
+            result_text, status, reasoning = self._parse_result(result)
+            
+            if save_responses:
+                self.tracker.enqueue_agent_interaction(
+                    agent_type="first_pass",
+                    article_id=article_id or article.title[:50],
+                    input_data=input_data,
+                    output_data=result_text
+                )
+            
+            return {
+                "status": status,
+                "result": result,
+                "reasoning": reasoning
+            }
+            
+        except Exception as e:
+            print(f"Error in first pass agent: {e}")
+            return {
+                "status": "Irrelevant",
+                "result": None,
+                "reasoning": f"Error: {str(e)}"
+            }
+    
+    async def run_many_async(self, messages: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Classify several prepared article prompts in a single provider call.
+        
+        The model is constrained to a JSON schema with one entry per article,
+        keyed by the article's 1-based position.
+        
+        Args:
+            messages: Article prompts as built by _prepare_input
+            
+        Returns:
+            One {"status", "reasoning"} dict per message, in input order;
+            None for articles missing from the response
+        """
+        prompt = (
+            f"Classify the following {len(messages)} articles independently. "
+            "Return one result per article with its index, status and reasoning.\n"
+            + "".join(f"---\n[{idx}]\n{text}\n" for idx, text in enumerate(messages, 1))
+        )
+        
+        request = [Message(role="user", content=prompt)]
+        if self.agent.model.cached_content is None:
+            request.insert(0, Message(role="system", content=get_first_pass_instructions()))
+        
+        response = await self.agent.model.ainvoke(
+            messages=request,
+            response_format=FirstPassBatchResult
+        )
+        parsed = FirstPassBatchResult.model_validate_json(response.text or "")
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        for item in parsed.results:
+            idx = item.index - 1
+            if 0 <= idx < len(messages) and results[idx] is None:
+                results[idx] = {
+                    "status": item.status.value,
+                    "reasoning": item.reasoning
+                }
+        return results
+    
+    async def aclassify_many(
+        self,
+        articles: List[Article],
+        save_responses: bool = True,
+        article_ids: Optional[List[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Classify several articles with a single agent call.
+        
+        Articles missing from the combined response are retried individually.
+        
+        Args:
+            articles: Articles to classify
+            save_responses: Whether to save responses to files
+            article_ids: Optional article IDs for tracking, parallel to articles
+            
+        Returns:
+            One processing result per article, in input order
+        """
+        if article_ids is None:
+            article_ids = [None] * len(articles)
+        
+        if len(articles) == 1:
+            return [await self.aprocess_article(
+                articles[0], article_id=article_ids[0], save_responses=save_responses
+            )]
+        
+        prepared = [self._prepare_input(article) for article in articles]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        try:
+            batch = await self.run_many_async([text for text, _ in prepared])
+            for idx, item in enumerate(batch):
+                if item is not None:
+                    results[idx] = {**item, "result": None}
+            
+            if save_responses:
+                await self.tracker.asave_batch_interaction(
+                    agent_type="first_pass",
+                    batch_id=uuid.uuid4().hex[:8],
+                    input_data={"articles": [data for _, data in prepared]},
+                    output_data=batch
+                )
+        except Exception as e:
+            print(f"Error in batched first pass agent: {e}")
+        
+        # Fall back to one call per article for anything the batch missed
+        missing = [idx for idx, r in enumerate(results) if r is None]
+        if missing:
+            retried = await asyncio.gather(*[
+                self.aprocess_article(articles[idx], article_id=article_ids[idx], save_responses=save_responses)
+                for idx in missing
+            ])
+            for idx, r in zip(missing, retried):
+                results[idx] = r
+        
+        return results
 
 
 class TrackedScoringAgent:
@@ -105,7 +275,44 @@ class TrackedScoringAgent:
     def __init__(self, debug_mode: bool = False):
         """Initialize tracked scoring agent."""
         self.agent = base_scoring_agent(debug_mode=debug_mode)
-        self.tracker = ResponseTracker(Path("output/responses"))
+        self.tracker = get_response_tracker()
+    
+    @staticmethod
+    def _prepare_input(article: Article, first_pass_reasoning: str) -> tuple:
+        """Build the agent prompt and the tracked input payload for an article."""
+        input_text = f"""Article Title: {article.title}
+Source Domain: {article.domain or 'unknown'}
+Summary: {article.summary_content or 'No content'}
+URL: {article.url or 'N/A'}
+
+First Pass Assessment: {first_pass_reasoning}
+
+Please score this article from 0-10 based on open source security relevance."""
+        
+        input_data = {
+            "title": article.title,
+            "content_preview": article.summary_content,
+            "domain": article.domain,
+            "url": article.url,
+            "first_pass_reasoning": first_pass_reasoning
+        }
+        return input_text, input_data
+    
+    @staticmethod
+    def _parse_result(result: Any) -> tuple:
+        """Parse the score (0-10) from a scoring agent response."""
+        result_text = extract_text(result)
+        
+        # Try to extract score
+        score_match = _SCORE_RE.search(result_text)
+        if score_match:
+            score = float(score_match.group(1))
+        else:
+            # Fallback: look for any number 0-10
+            number_match = _NUM_RE.search(result_text)
+            score = float(number_match.group(1)) if number_match else 5.0
+        
+        return result_text, score
     
     def score_article(
         self,
@@ -125,45 +332,65 @@ class TrackedScoringAgent:
         Returns:
             Scoring result
         """
-        # Prepare input
-        input_text = f"""Article Title: {article.title}
-Source Domain: {article.domain or 'unknown'}
-Summary: {article.content[:500] if article.content else 'No content'}
-URL: {article.url or 'N/A'}
-
-First Pass Assessment: {first_pass_reasoning}
-
-Please score this article from 0-10 based on open source security relevance."""
-        
-        input_data = {
-            "title": article.title,
-            "content_preview": article.content[:500] if article.content else "",
-            "domain": article.domain,
-            "url": article.url,
-            "first_pass_reasoning": first_pass_reasoning
-        }
+        input_text, input_data = self._prepare_input(article, first_pass_reasoning)
         
         try:
-            # Run the agent
-            messages = [Message(role="user", content=input_text)]
-            result = self.agent.run(messages=messages)
+            # Run the agent, reusing the response to an identical earlier prompt
+            result = run_with_cache(self.agent, input_text)
             
             # Parse score from result (look for number 0-10)
-            result_text = str(result.content) if hasattr(result, 'content') else str(result)
-            
-            # Try to extract score
-            import re
-            score_match = re.search(r'score:\s*(\d+(?:\.\d+)?)', result_text, re.IGNORECASE)
-            if score_match:
-                score = float(score_match.group(1))
-            else:
-                # Fallback: look for any number 0-10
-                numbers = re.findall(r'\b([0-9]|10)(?:\.\d+)?\b', result_text)
-                score = float(numbers[0]) if numbers else 5.0
+            result_text, score = self._parse_result(result)
             
             # Save if requested
             if save_responses:
-                self.tracker.save_agent_interaction(
+                self.tracker.enqueue_agent_interaction(
+                    agent_type="scoring",
+                    article_id=article_id or article.title[:50],
+                    input_data=input_data,
+                    output_data=result_text
+                )
+            
+            return {
+                "score": score,
+                "result": result,
+                "rationale": result_text
+            }
+            
+        except Exception as e:
+            print(f"Error in scoring agent: {e}")
+            return {
+                "score": 0.0,
+                "result": None,
+                "rationale": f"Error: {str(e)}"
+            }
+    
+    async def ascore_article(
+        self,
+        article: Article,
+        first_pass_reasoning: str,
+        article_id: Optional[Any] = None,
+        save_responses: bool = True
+    ) -> Dict[str, Any]:
+        """Async variant of score_article for concurrent batch processing.
+        
+        Args:
+            article: Article to score
+            first_pass_reasoning: Reasoning from first pass
+            article_id: Optional article ID for tracking
+            save_responses: Whether to save responses
+            
+        Returns:
+            Scoring result
+        """
+        input_text, input_data = self._prepare_input(article, first_pass_reasoning)
+        
+        try:
+            result = await arun_with_cache(self.agent, input_text)
+            
+            result_text, score = self._parse_result(result)
+            
+            if save_responses:
+                self.tracker.enqueue_agent_interaction(
                     agent_type="scoring",
                     article_id=article_id or article.title[:50],
                     input_data=input_data,
@@ -185,13 +412,91 @@ Please score this article from 0-10 based on open source security relevance."""
             }
 
 
+class TrackedFilterScoreAgent:
+    """Combined filter and score agent with response tracking."""
+    
+    def __init__(self, debug_mode: bool = False):
+        """Initialize tracked filter and score agent."""
+        self.agent = base_filter_and_score_agent(debug_mode=debug_mode)
+        self.tracker = get_response_tracker()
+    
+    @staticmethod
+    def _prepare_input(article: Article) -> tuple:
+        """Build the agent prompt and the tracked input payload for an article."""
+        input_text = f"""Article Title: {article.title}
+Source Domain: {article.domain or 'unknown'}
+Article Content: {article.truncated_content or 'None'}
+URL: {article.url or 'N/A'}"""
+        
+        input_data = {
+            "title": article.title,
+            "content": article.truncated_content,
+            "domain": article.domain,
+            "url": article.url
+        }
+        return input_text, input_data
+    
+    async def afilter_and_score(
+        self,
+        article: Article,
+        article_id: Optional[Any] = None,
+        save_responses: bool = True
+    ) -> Dict[str, Any]:
+        """Filter and score an article with a single agent call.
+        
+        Args:
+            article: Article to process
+            article_id: Optional article ID for tracking
+            save_responses: Whether to save responses to files
+            
+        Returns:
+            Processing result with status, reasoning, score and rationale
+        """
+        input_text, input_data = self._prepare_input(article)
+        
+        try:
+            messages = [Message(role="user", content=input_text)]
+            result = await self.agent.arun(messages=messages)
+            
+            parsed = result.content
+            if not isinstance(parsed, FilterScoreResult):
+                raise ValueError(f"Unexpected response: {str(parsed)[:200]}")
+            
+            if save_responses:
+                self.tracker.enqueue_agent_interaction(
+                    agent_type="filter_and_score",
+                    article_id=article_id or article.title[:50],
+                    input_data=input_data,
+                    output_data=parsed
+                )
+            
+            relevant = parsed.status.value == "Relevant"
+            return {
+                "status": parsed.status.value,
+                "reasoning": parsed.reasoning,
+                "score": parsed.overall_score if relevant else 0.0,
+                "rationale": parsed.rationale,
+                "result": result
+            }
+            
+        except Exception as e:
+            print(f"Error in filter and score agent: {e}")
+            return {
+                "status": "Irrelevant",
+                "reasoning": f"Error: {str(e)}",
+                "score": 0.0,
+                "rationale": "",
+                "result": None
+            }
+
+
 class TrackedSelectorAgent:
     """Selector agent with response tracking."""
     
     def __init__(self, debug_mode: bool = False):
         """Initialize tracked selector agent."""
         self.agent = base_selector_agent(debug_mode=debug_mode)
-        self.tracker = ResponseTracker(Path("output/responses"))
+        self.tracker = get_response_tracker()
     
     def select_articles(
         self,
@@ -212,14 +517,18 @@ class TrackedSelectorAgent:
             Selection result
         """
         # Prepare articles list for agent
+        # Candidates arrive in ranked order, so only the head is formatted; the
+        # fallback keys are only looked up when the primary key is missing
         articles_text = []
         for idx, article in enumerate(scored_articles[:50], 1):  # Limit to top 50
+            score = article['overall_score'] if 'overall_score' in article else article.get('score', 0)
+            rationale = article['scoring_rationale'] if 'scoring_rationale' in article else article.get('rationale', '')
             articles_text.append(
                 f"{idx}. {article.get('title', 'Untitled')}\n"
-                f"   Score: {article.get('overall_score', article.get('score', 0)):.1f}\n"
+                f"   Score: {score:.1f}\n"
                 f"   Domain: {article.get('domain', 'unknown')}\n"
                 f"   URL: {article.get('url', 'N/A')}\n"
-                f"   Rationale: {str(article.get('scoring_rationale', article.get('rationale', '')))[:200]}"
+                f"   Rationale: {str(rationale)[:200]}"
             )
         
         input_text = f"""Select the best {max_articles} articles from this ranked list for the newsletter:
@@ -235,15 +544,14 @@ Ensure source diversity - avoid selecting too many articles from the same domain
         }
         
         try:
-            # Run the agent
-            messages = [Message(role="user", content=input_text)]
-            result = self.agent.run(messages=messages)
+            # Run the agent, reusing the response to an identical earlier prompt
+            result = run_with_cache(self.agent, input_text)
             
-            result_text = str(result.content) if hasattr(result, 'content') else str(result)
+            result_text = extract_text(result)
             
             # Save if requested
             if save_responses:
-                self.tracker.save_agent_interaction(
+                self.tracker.enqueue_agent_interaction(
                     agent_type="selector",
                     article_id=batch_id or "selection_batch",
                     input_data=input_data,
@@ -263,16 +571,25 @@ Ensure source diversity - avoid selecting too many articles from the same domain
             }
 
 
+@functools.lru_cache(maxsize=2)
 def get_tracked_first_pass_agent(debug_mode: bool = False) -> TrackedFirstPassAgent:
     """Get tracked first pass agent."""
     return TrackedFirstPassAgent(debug_mode=debug_mode)
 
 
+@functools.lru_cache(maxsize=2)
 def get_tracked_scoring_agent(debug_mode: bool = False) -> TrackedScoringAgent:
     """Get tracked scoring agent."""
     return TrackedScoringAgent(debug_mode=debug_mode)
 
 
+@functools.lru_cache(maxsize=2)
+def get_tracked_filter_score_agent(debug_mode: bool = False) -> TrackedFilterScoreAgent:
+    """Get tracked combined filter and score agent."""
+    return TrackedFilterScoreAgent(debug_mode=debug_mode)
+
+
+@functools.lru_cache(maxsize=2)
 def get_tracked_selector_agent(debug_mode: bool = False) -> TrackedSelectorAgent:
     """Get tracked selector agent."""
     return TrackedSelectorAgent(debug_mode=debug_mode)
\ No newline at end of file
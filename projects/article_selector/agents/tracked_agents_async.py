@@ -3,12 +3,12 @@ Async-enabled tracked agents with error handling and retry logic.
 """
 
 import asyncio
+import functools
+import re
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
-from pathlib import Path
-
-from agno.models.message import Message
 
 from projects.article_selector.agents import (
     get_first_pass_agent,
@@ -16,10 +16,33 @@ from projects.article_selector.agents import (
     get_selector_agent,
     get_comparative_ranker_agent,
 )
+from projects.article_selector.agents.tracked_agents import TrackedFirstPassAgent, extract_text
 from projects.article_selector.models import Article
-from core.response_tracker import ResponseTracker
+from core.agent_cache import run_with_cache
+from core.response_tracker import get_response_tracker
 from core.settings import settings
 
+# Score and reason patterns for free-text scoring responses
+_SCORE_RE = re.compile(r'Score:\s*(\d+(?:\.\d+)?)')
+_REASON_RE = re.compile(r'Reason:\s*(.+)', re.MULTILINE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_pool() -> ThreadPoolExecutor:
+    """Get the pool for blocking agent calls, created on first use.
+
+    A dedicated pool keeps agent calls from queueing behind other work in the
+    loop's default executor.
+
+    Returns:
+        Thread pool sized by max_concurrent_llm_calls
+    """
+    return ThreadPoolExecutor(max_workers=settings.max_concurrent_llm_calls, thread_name_prefix="llm")
+
+
+# First pass assessment placeholder for scores started before the first pass finishes
+SPECULATIVE_REASONING = "(speculative)"
+
 
 class AsyncRetryConfig:
     """Configuration for async retry logic."""
@@ -74,8 +97,10 @@ class AsyncTrackedFirstPassAgent:
     
     def __init__(self, debug_mode: bool = False):
         self.agent = get_first_pass_agent(debug_mode=debug_mode)
-        self.tracker = ResponseTracker(Path(settings.agent_response_output_dir))
+        self.tracker = get_response_tracker()
         self.retry_config = AsyncRetryConfig()
+        # Caps this agent's in-flight provider calls
+        self._llm_slots = asyncio.Semaphore(settings.max_concurrent_llm_calls)
     
     async def process_article_async(
         self,
@@ -90,49 +115,32 @@ class AsyncTrackedFirstPassAgent:
             input_text = (
                 f"Article Title: {article.title}\n"
                 f"Source Domain: {article.domain or 'unknown'}\n"
-                f"Article Content: {article.content[:1000]}"
+                f"Article Content: {article.truncated_content}"
             )
             
             input_data = {
                 "title": article.title,
                 "domain": article.domain,
-                "content": article.content[:1000],
+                "content": article.truncated_content,
             }
             
             # Run agent (convert to async)
-            loop = asyncio.get_event_loop()
-            messages = [Message(role="user", content=input_text)]
+            loop = asyncio.get_running_loop()
             
-            result = await loop.run_in_executor(
-                None,
-                self.agent.run,
-                messages
-            )
-            
-            # Parse result
-            result_text = str(result.content) if hasattr(result, 'content') else str(result)
+            async with self._llm_slots:
+                result = await loop.run_in_executor(
+                    _get_llm_pool(),
+                    run_with_cache,
+                    self.agent,
+                    input_text
+                )
             
-            # Parse ADK format
-            if "first_pass_result:" in result_text:
-                parts = result_text.split("first_pass_result:", 1)[1].strip()
-                if parts.startswith("Relevant"):
-                    status = "Relevant"
-                    reasoning = parts[8:].strip().lstrip('.').strip()
-                elif parts.startswith("Irrelevant"):
-                    status = "Irrelevant"
-                    reasoning = parts[10:].strip().lstrip('.').strip()
-                else:
-                    status = "Relevant" if "Relevant" in result_text else "Irrelevant"
-                    reasoning = result_text
-            else:
-                status = "Relevant" if "Relevant" in result_text and "Irrelevant" not in result_text.split(".")[0] else "Irrelevant"
-                reasoning = result_text
+            # Parse ADK format: "first_pass_result: Relevant/Irrelevant. Reasoning..."
+            result_text, status, reasoning = TrackedFirstPassAgent._parse_result(result)
             
             # Save if requested
             if save_responses:
-                await loop.run_in_executor(
-                    None,
-                    self.tracker.save_agent_interaction,
+                self.tracker.enqueue_agent_interaction(
                     "first_pass",
                     article_id or article.title[:50],
                     input_data,
@@ -156,8 +164,10 @@ class AsyncTrackedScoringAgent:
     
     def __init__(self, debug_mode: bool = False):
         self.agent = get_scoring_agent(debug_mode=debug_mode)
-        self.tracker = ResponseTracker(Path(settings.agent_response_output_dir))
+        self.tracker = get_response_tracker()
         self.retry_config = AsyncRetryConfig()
+        # Caps this agent's in-flight provider calls
+        self._llm_slots = asyncio.Semaphore(settings.max_concurrent_llm_calls)
     
     async def score_article_async(
         self,
@@ -174,7 +184,7 @@ class AsyncTrackedScoringAgent:
                 f"Article Title: {article.title}\n"
                 f"Source Domain: {article.domain or 'unknown'}\n"
                 f"URL: {article.url or 'N/A'}\n"
-                f"Summary: {article.content[:500]}\n"
+                f"Summary: {article.summary_content}\n"
                 f"First Pass Assessment: {first_pass_reasoning}"
             )
             
@@ -182,41 +192,39 @@ class AsyncTrackedScoringAgent:
                 "title": article.title,
                 "domain": article.domain,
                 "url": article.url,
-                "summary": article.content[:500],
+                "summary": article.summary_content,
                 "first_pass_reasoning": first_pass_reasoning,
             }
             
             # Run agent
-            loop = asyncio.get_event_loop()
-            messages = [Message(role="user", content=input_text)]
+            loop = asyncio.get_running_loop()
             
-            result = await loop.run_in_executor(
-                None,
-                self.agent.run,
-                messages
-            )
+            async with self._llm_slots:
+                result = await loop.run_in_executor(
+                    _get_llm_pool(),
+                    run_with_cache,
+                    self.agent,
+                    input_text
+                )
             
             # Parse result
-            result_text = str(result.content) if hasattr(result, 'content') else str(result)
+            result_text = extract_text(result)
             
             # Extract score
-            import re
             score = 7.5  # Default
             reasoning = result_text
             
-            score_match = re.search(r'Score:\s*(\d+(?:\.\d+)?)', result_text)
+            score_match = _SCORE_RE.search(result_text)
             if score_match:
                 score = float(score_match.group(1))
             
-            reason_match = re.search(r'Reason:\s*(.+)', result_text, re.MULTILINE | re.DOTALL)
+            reason_match = _REASON_RE.search(result_text)
             if reason_match:
                 reasoning = reason_match.group(1).strip()
             
             # Save if requested
             if save_responses:
-                await loop.run_in_executor(
-                    None,
-                    self.tracker.save_agent_interaction,
+                self.tracker.enqueue_agent_interaction(
                     "scoring",
                     article_id or article.title[:50],
                     input_data,
@@ -240,8 +248,10 @@ class AsyncTrackedComparativeRanker:
     
     def __init__(self, debug_mode: bool = False):
         self.agent = get_comparative_ranker_agent(debug_mode=debug_mode)
-        self.tracker = ResponseTracker(Path(settings.agent_response_output_dir))
+        self.tracker = get_response_tracker()
         self.retry_config = AsyncRetryConfig()
+        # Caps this agent's in-flight provider calls
+        self._llm_slots = asyncio.Semaphore(settings.max_concurrent_llm_calls)
     
     async def rank_batch_async(
         self,
@@ -262,20 +272,19 @@ class AsyncTrackedComparativeRanker:
             ])
             
             # Run agent
-            loop = asyncio.get_event_loop()
-            messages = [Message(
-                role="user",
-                content=f"Rank these {len(articles)} articles comparatively:\n\n{batch_text}"
-            )]
+            loop = asyncio.get_running_loop()
+            input_text = f"Rank these {len(articles)} articles comparatively:\n\n{batch_text}"
             
-            result = await loop.run_in_executor(
-                None,
-                self.agent.run,
-                messages
-            )
+            async with self._llm_slots:
+                result = await loop.run_in_executor(
+                    _get_llm_pool(),
+                    run_with_cache,
+                    self.agent,
+                    input_text
+                )
             
             # Parse ranking
-            result_text = str(result.content) if hasattr(result, 'content') else str(result)
+            result_text = extract_text(result)
             
             # Simple ranking extraction (could be improved)
             ranked_articles = []
@@ -287,9 +296,7 @@ class AsyncTrackedComparativeRanker:
             
             # Save if requested
             if save_responses:
-                await loop.run_in_executor(
-                    None,
-                    self.tracker.save_agent_interaction,
+                self.tracker.enqueue_agent_interaction(
                     "comparative_ranker",
                     batch_id,
                     {"batch": articles},
@@ -307,8 +314,10 @@ class AsyncTrackedSelectorAgent:
     
     def __init__(self, debug_mode: bool = False):
         self.agent = get_selector_agent(debug_mode=debug_mode)
-        self.tracker = ResponseTracker(Path(settings.agent_response_output_dir))
+        self.tracker = get_response_tracker()
         self.retry_config = AsyncRetryConfig()
+        # Caps this agent's in-flight provider calls
+        self._llm_slots = asyncio.Semaphore(settings.max_concurrent_llm_calls)
     
     async def select_articles_async(
         self,
@@ -335,27 +344,26 @@ class AsyncTrackedSelectorAgent:
             )
             
             # Run agent
-            loop = asyncio.get_event_loop()
-            messages = [Message(role="user", content=input_text)]
+            loop = asyncio.get_running_loop()
             
-            result = await loop.run_in_executor(
-                None,
-                self.agent.run,
-                messages
-            )
+            async with self._llm_slots:
+                result = await loop.run_in_executor(
+                    _get_llm_pool(),
+                    run_with_cache,
+                    self.agent,
+                    input_text
+                )
             
             # For now, just take top N
             selected = scored_articles[:max_articles]
             
             # Save if requested
             if save_responses:
-                await loop.run_in_executor(
-                    None,
-                    self.tracker.save_agent_interaction,
+                self.tracker.enqueue_agent_interaction(
                     "selector",
                     batch_id or "selection",
                     {"candidates": len(scored_articles), "max_articles": max_articles},
-                    str(result.content) if hasattr(result, 'content') else str(result)
+                    extract_text(result)
                 )
             
             return {
@@ -367,6 +375,105 @@ class AsyncTrackedSelectorAgent:
         return await async_retry(_select, config=self.retry_config)
 
 
+class AsyncPipeline:
+    """Runs first pass and scoring as a per-article dependency graph.
+    
+    Every article starts its first pass at once, and a relevant article is
+    scored as soon as its own first pass finishes rather than after the
+    whole first pass batch. Provider concurrency is capped by each agent's
+    semaphore.
+    
+    With speculative scoring, each article is scored alongside its first
+    pass (without the first pass assessment in the prompt) and the score is
+    discarded if the article turns out to be irrelevant. Relevant articles
+    then take about one call's latency instead of two, at the cost of extra
+    calls for irrelevant ones.
+    """
+    
+    def __init__(
+        self,
+        first_pass: Optional[AsyncTrackedFirstPassAgent] = None,
+        scoring: Optional[AsyncTrackedScoringAgent] = None,
+        debug_mode: bool = False,
+        speculative: Optional[bool] = None,
+    ):
+        self.first_pass = first_pass or get_async_tracked_first_pass_agent(debug_mode=debug_mode)
+        self.scoring = scoring or get_async_tracked_scoring_agent(debug_mode=debug_mode)
+        self.speculative = settings.speculative_scoring_enabled if speculative is None else speculative
+    
+    async def _run_article(
+        self,
+        article: Article,
+        article_id: int,
+        save_responses: bool,
+    ) -> Dict[str, Any]:
+        """Filter one article and score it if it is relevant."""
+        score_task = None
+        if self.speculative:
+            score_task = asyncio.create_task(self.scoring.score_article_async(
+                article,
+                first_pass_reasoning=SPECULATIVE_REASONING,
+                article_id=article_id,
+                save_responses=save_responses,
+            ))
+        
+        try:
+            first_pass = await self.first_pass.process_article_async(
+                article, article_id=article_id, save_responses=save_responses
+            )
+        except Exception as e:
+            first_pass = {"status": "Irrelevant", "reasoning": f"Error: {e}", "result": None}
+        
+        scoring = None
+        if first_pass["status"] == "Relevant":
+            try:
+                if score_task is not None:
+                    scoring = await score_task
+                else:
+                    scoring = await self.scoring.score_article_async(
+                        article,
+                        first_pass_reasoning=first_pass["reasoning"],
+                        article_id=article_id,
+                        save_responses=save_responses,
+                    )
+            except Exception as e:
+                print(f"⚠️ Scoring failed for {article.title[:50]}: {e}")
+        elif score_task is not None:
+            score_task.cancel()
+            # Retrieve a failure that beat the cancel so it isn't reported as unhandled
+            score_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        
+        return {
+            "article": article,
+            "article_id": article_id,
+            "status": first_pass["status"],
+            "first_pass_reasoning": first_pass["reasoning"],
+            "score": scoring["score"] if scoring else None,
+            "scoring_reasoning": scoring["reasoning"] if scoring else None,
+        }
+    
+    async def run(
+        self,
+        articles: List[Article],
+        save_responses: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Filter and score articles concurrently.
+        
+        Args:
+            articles: Articles to process
+            save_responses: Whether to save responses to files
+            
+        Returns:
+            One result per article, in input order, with its first pass status
+            and reasoning and, for relevant articles that scored successfully,
+            its score and scoring reasoning (None otherwise)
+        """
+        return await asyncio.gather(*[
+            self._run_article(article, idx, save_responses)
+            for idx, article in enumerate(articles, 1)
+        ])
+
+
 # Factory functions for async agents
 def get_async_tracked_first_pass_agent(debug_mode: bool = False) -> AsyncTrackedFirstPassAgent:
     """Create async tracked first pass agent."""
@@ -1,24 +1,38 @@
 """Domain configuration for article selector agents."""
 
-PREFERRED_DOMAINS = [
+# Ordered tuples for anything that lists the domains (e.g. prompts); the
+# frozensets below are for membership checks against normalize_domain()
+PREFERRED_DOMAINS_ORDERED = (
     "darkreading.com", "bleepingcomputer.com", "helpnetsecurity.com",
     "securityweek.com", "arstechnica.com", "wired.com", "theverge.com",
     "apnews.com", "reuters.com", "thehackernews.com", "theregister.com",
     "krebsonsecurity.com", "cisa.gov", "googleprojectzero.blogspot.com",
     "snyk.io", "pythonsafety.io", "openssf.org", "linuxfoundation.org",
     "mozilla.org", "arxiv.org", "threatpost.com", "securityaffairs.co", "seclists.org"
-]
+)
 
-PROJECT_VENDOR_AUTH_BUT_NOT_PRIMARY_NEWS = [
+PROJECT_VENDOR_AUTH_BUT_NOT_PRIMARY_NEWS_ORDERED = (
     "postgresql.org", "kernelnewbies.org", "openjsf.org", "home-assistant.io",
     "openmrs.org", "debian.org", "raspberrypi.com", "w3.org", "owasp.org",
     "github.com", "redis.io", "nextcloud.com", "drupal.org", "fossa.com"
-]
+)
 
-CAUTION_AVOID_PRIMARY = [
+CAUTION_AVOID_PRIMARY_ORDERED = (
     "mashable.com", "techradar.com", "forbes.com", "venturebeat.com",
     "coindesk.com", "zdnet.com", "isc2.org", "paloaltonetworks.com",
     "recordedfuture.com", "akamai.com", "lifehacker.com"
-]
+)
 
-EURACTIV_DOMAIN = "euractiv.com"
\ No newline at end of file
+EURACTIV_DOMAIN = "euractiv.com"
+
+
+def normalize_domain(domain: str) -> str:
+    """Normalize a domain for lookups: lowercase, without a leading "www."."""
+    return domain.strip().lower().removeprefix("www.")
+
+
+PREFERRED_DOMAINS: frozenset[str] = frozenset(map(normalize_domain, PREFERRED_DOMAINS_ORDERED))
+PROJECT_VENDOR_AUTH_BUT_NOT_PRIMARY_NEWS: frozenset[str] = frozenset(
+    map(normalize_domain, PROJECT_VENDOR_AUTH_BUT_NOT_PRIMARY_NEWS_ORDERED)
+)
+CAUTION_AVOID_PRIMARY: frozenset[str] = frozenset(map(normalize_domain, CAUTION_AVOID_PRIMARY_ORDERED))
@@ -3,7 +3,10 @@
 from .article_models import (
     Article,
     FirstPassResult,
+    FirstPassBatchItem,
+    FirstPassBatchResult,
     ScoringResult,
+    FilterScoreResult,
     SelectorResult,
     ArticleSelectionInput,
     ArticleSelectionOutput,
@@ -12,7 +15,10 @@ from .article_models import (
 __all__ = [
     "Article",
     "FirstPassResult",
+    "FirstPassBatchItem",
+    "FirstPassBatchResult",
     "ScoringResult", 
+    "FilterScoreResult",
     "SelectorResult",
     "ArticleSelectionInput",
     "ArticleSelectionOutput",
@@ -1,10 +1,16 @@
 """Pydantic models for article selection agents."""
 
+import functools
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from enum import Enum
 from datetime import datetime
 
+# Characters of article content included in agent prompts
+PROMPT_CONTENT_CHARS = 1000
+# Characters of article content included as the summary in scoring prompts
+SUMMARY_CONTENT_CHARS = 500
+
 
 class RelevanceStatus(str, Enum):
     """Article relevance status."""
@@ -22,6 +28,40 @@ class Article(BaseModel):
     author: Optional[str] = Field(default=None, description="Article author")
     tags: Optional[List[str]] = Field(default=None, description="Article tags or categories")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
+    
+    @classmethod
+    def trusted(cls, **data: Any) -> "Article":
+        """Build an article from already-valid internal data, skipping validation.
+        
+        Args:
+            **data: Field values of the correct types
+            
+        Returns:
+            Article constructed without running validators
+        """
+        return cls.model_construct(**data)
+    
+    @functools.cached_property
+    def truncated_content(self) -> str:
+        """Content clipped to PROMPT_CONTENT_CHARS, at a sentence boundary when one is near.
+        
+        Computed once per article and shared by every prompt built from it.
+        """
+        if len(self.content) <= PROMPT_CONTENT_CHARS:
+            return self.content
+        
+        clipped = self.content[:PROMPT_CONTENT_CHARS]
+        cut = max(clipped.rfind(". "), clipped.rfind("\n"))
+        # Only back off to the boundary if it keeps most of the budget
+        return clipped[:cut + 1] if cut >= PROMPT_CONTENT_CHARS // 2 else clipped
+    
+    @functools.cached_property
+    def summary_content(self) -> str:
+        """Content clipped to SUMMARY_CONTENT_CHARS for scoring prompts.
+        
+        Sliced once per article and reused by the prompt and the saved input.
+        """
+        return self.content[:SUMMARY_CONTENT_CHARS]
 
 
 class FirstPassResult(BaseModel):
@@ -36,6 +76,16 @@ class FirstPassResult(BaseModel):
     )
 
 
+class FirstPassBatchItem(FirstPassResult):
+    """First pass result for one article in a multi-article request."""
+    index: int = Field(description="1-based position of the article in the request")
+
+
+class FirstPassBatchResult(BaseModel):
+    """Result from a multi-article first pass request."""
+    results: List[FirstPassBatchItem] = Field(description="One result per article")
+
+
 class ScoringResult(BaseModel):
     """Result from scoring agent."""
     relevance_score: float = Field(
@@ -62,6 +112,18 @@ class ScoringResult(BaseModel):
     recommendation: str = Field(description="Include/Exclude recommendation with explanation")
 
 
+class FilterScoreResult(BaseModel):
+    """Result from the combined first pass filtering and scoring agent."""
+    status: RelevanceStatus = Field(description="Relevance status")
+    reasoning: str = Field(description="Concise justification for the relevance decision")
+    overall_score: float = Field(
+        ge=0.0, 
+        le=10.0, 
+        description="Overall score (0-10); 0 for irrelevant articles"
+    )
+    rationale: str = Field(description="Scoring rationale; empty for irrelevant articles")
+
+
 class RankedArticle(BaseModel):
     """Article with ranking information."""
     article: Article
@@ -87,122 +87,122 @@ def run_comparative_ranking(
     # Create comparative ranker agent
     ranker_agent = get_comparative_ranker_agent(debug_mode=debug_mode)
     
-    # Step 3: Multiple shuffle passes for robustness
-    for pass_num in range(shuffle_runs):
-        print(f"\n🔁 Shuffle Pass {pass_num + 1}/{shuffle_runs}")
-        
-        # Shuffle batches for variety across passes
-        shuffled_batches = batches.copy()
-        random.shuffle(shuffled_batches)
-        
-        for batch_idx, batch in enumerate(shuffled_batches):
-            # Shuffle items within batch
-            shuffled_batch = batch.copy()
-            random.shuffle(shuffled_batch)
-            
-            print(f"  📦 Processing batch {batch_idx + 1}/{len(shuffled_batches)} ({len(shuffled_batch)} articles)")
-            
-            # Prepare batch content for agent
-            batch_content = []
-            for article in shuffled_batch:
-                batch_content.append({
-                    "title": article.get("title", "Untitled"),
-                    "score": article.get("overall_score", article.get("score", 0)),
-                    "domain": article.get("domain", "unknown"),
-                    "url": article.get("url", ""),
-                    "rationale": article.get("scoring_rationale", article.get("rationale", "")),
-                    "content": article.get("content", "")[:500],  # Truncate for context
-                })
+    # Step 3: Multiple shuffle passes for robustness, logging every batch to one file
+    with tracker.batch_writer("comparative_ranker", pipeline_run_id) as save_interaction:
+        for pass_num in range(shuffle_runs):
+            print(f"\n🔁 Shuffle Pass {pass_num + 1}/{shuffle_runs}")
             
-            # Format batch for agent
-            batch_text = "\n\n".join([
-                f"- Title: {a['title']}\n"
-                f"  Score: {a['score']}\n"
-                f"  Domain: {a['domain']}\n"
-                f"  URL: {a['url']}\n"
-                f"  Rationale: {a['rationale']}\n"
-                f"  Content: {a['content']}"
-                for a in batch_content
-            ])
+            # Shuffle batches for variety across passes
+            shuffled_batches = batches.copy()
+            random.shuffle(shuffled_batches)
             
-            try:
-                # Run comparative ranking on this batch
-                # Use Message object for proper Agno format
-                from agno.models.message import Message
-                messages = [Message(
-                    role="user",
-                    content=f"Rank these {len(batch_content)} articles comparatively:\n\n{batch_text}"
-                )]
-                result = ranker_agent.run(messages=messages)
+            for batch_idx, batch in enumerate(shuffled_batches):
+                # Shuffle items within batch
+                shuffled_batch = batch.copy()
+                random.shuffle(shuffled_batch)
                 
-                # Save agent interaction
-                tracker.save_agent_interaction(
-                    agent_type="comparative_ranker",
-                    article_id=f"batch_{pass_num}_{batch_idx}",
-                    input_data={"batch": batch_content, "pass": pass_num, "batch_idx": batch_idx},
-                    output_data=result.content if hasattr(result, 'content') else str(result),
-                )
+                print(f"  📦 Processing batch {batch_idx + 1}/{len(shuffled_batches)} ({len(shuffled_batch)} articles)")
                 
-                # Parse result - the agent returns a RunResponse with content
-                ranking_result = None
+                # Prepare batch content for agent
+                batch_content = []
+                for article in shuffled_batch:
+                    batch_content.append({
+                        "title": article.get("title", "Untitled"),
+                        "score": article.get("overall_score", article.get("score", 0)),
+                        "domain": article.get("domain", "unknown"),
+                        "url": article.get("url", ""),
+                        "rationale": article.get("scoring_rationale", article.get("rationale", "")),
+                        "content": article.get("content", "")[:500],  # Truncate for context
+                    })
                 
-                if hasattr(result, 'content'):
-                    # Check if content is already a ComparativeRankingResult
-                    if isinstance(result.content, ComparativeRankingResult):
-                        ranking_result = result.content
-                    elif isinstance(result.content, dict):
-                        # Content is a dict, convert to model
-                        try:
-                            ranking_result = ComparativeRankingResult(**result.content)
-                        except Exception as e:
-                            print(f"    ⚠️ Failed to parse dict result for batch {batch_idx + 1}: {e}")
-                            if debug_mode:
-                                print(f"    Result content: {result.content}")
-                    elif isinstance(result.content, str):
-                        # Content is a JSON string
-                        try:
-                            parsed = json.loads(result.content)
-                            ranking_result = ComparativeRankingResult(**parsed)
-                        except Exception as e:
-                            print(f"    ⚠️ Failed to parse JSON result for batch {batch_idx + 1}: {e}")
-                            if debug_mode:
-                                print(f"    Result content: {result.content}")
-                    else:
-                        # Try to access ranked_articles directly
-                        if hasattr(result.content, 'ranked_articles'):
+                # Format batch for agent
+                batch_text = "\n\n".join([
+                    f"- Title: {a['title']}\n"
+                    f"  Score: {a['score']}\n"
+                    f"  Domain: {a['domain']}\n"
+                    f"  URL: {a['url']}\n"
+                    f"  Rationale: {a['rationale']}\n"
+                    f"  Content: {a['content']}"
+                    for a in batch_content
+                ])
+                
+                try:
+                    # Run comparative ranking on this batch
+                    # Use Message object for proper Agno format
+                    from agno.models.message import Message
+                    messages = [Message(
+                        role="user",
+                        content=f"Rank these {len(batch_content)} articles comparatively:\n\n{batch_text}"
+                    )]
+                    result = ranker_agent.run(messages=messages)
+                    
+                    # Save agent interaction
+                    save_interaction(
+                        article_id=f"batch_{pass_num}_{batch_idx}",
+                        input_data={"batch": batch_content, "pass": pass_num, "batch_idx": batch_idx},
+                        output_data=result.content if hasattr(result, 'content') else str(result),
+                    )
+                    
+                    # Parse result - the agent returns a RunResponse with content
+                    ranking_result = None
+                    
+                    if hasattr(result, 'content'):
+                        # Check if content is already a ComparativeRankingResult
+                        if isinstance(result.content, ComparativeRankingResult):
                             ranking_result = result.content
+                        elif isinstance(result.content, dict):
+                            # Content is a dict, convert to model
+                            try:
+                                ranking_result = ComparativeRankingResult(**result.content)
+                            except Exception as e:
+                                print(f"    ⚠️ Failed to parse dict result for batch {batch_idx + 1}: {e}")
+                                if debug_mode:
+                                    print(f"    Result content: {result.content}")
+                        elif isinstance(result.content, str):
+                            # Content is a JSON string
+                            try:
+                                parsed = json.loads(result.content)
+                                ranking_result = ComparativeRankingResult(**parsed)
+                            except Exception as e:
+                                print(f"    ⚠️ Failed to parse JSON result for batch {batch_idx + 1}: {e}")
+                                if debug_mode:
+                                    print(f"    Result content: {result.content}")
                         else:
-                            print(f"    ⚠️ Unexpected content type for batch {batch_idx + 1}: {type(result.content)}")
-                            if debug_mode:
-                                print(f"    Result content: {result.content}")
-                
-                if not ranking_result:
-                    print(f"    ⚠️ Could not extract ranking result for batch {batch_idx + 1}")
-                    # Fallback: use original scores as ranks
-                    print(f"    📊 Using score-based ranking as fallback")
-                    sorted_batch = sorted(shuffled_batch, key=lambda x: x.get('overall_score', x.get('score', 0)), reverse=True)
-                    for rank, article in enumerate(sorted_batch, 1):
-                        title = article.get('title', 'Untitled')
-                        rank_accumulator[title].append(rank)
-                        rationale_map[title].append(f"Score-based rank: {article.get('overall_score', article.get('score', 0))}")
-                    continue
-                
-                # Accumulate rankings
-                for ranked_article in ranking_result.ranked_articles:
-                    title = ranked_article.original_title
-                    rank = ranked_article.refined_rank
-                    rationale = ranked_article.comparative_rationale
+                            # Try to access ranked_articles directly
+                            if hasattr(result.content, 'ranked_articles'):
+                                ranking_result = result.content
+                            else:
+                                print(f"    ⚠️ Unexpected content type for batch {batch_idx + 1}: {type(result.content)}")
+                                if debug_mode:
+                                    print(f"    Result content: {result.content}")
                     
-                    rank_accumulator[title].append(rank)
-                    rationale_map[title].append(rationale)
+                    if not ranking_result:
+                        print(f"    ⚠️ Could not extract ranking result for batch {batch_idx + 1}")
+                        # Fallback: use original scores as ranks
+                        print(f"    📊 Using score-based ranking as fallback")
+                        sorted_batch = sorted(shuffled_batch, key=lambda x: x.get('overall_score', x.get('score', 0)), reverse=True)
+                        for rank, article in enumerate(sorted_batch, 1):
+                            title = article.get('title', 'Untitled')
+                            rank_accumulator[title].append(rank)
+                            rationale_map[title].append(f"Score-based rank: {article.get('overall_score', article.get('score', 0))}")
+                        continue
                     
-                print(f"    ✅ Ranked {len(ranking_result.ranked_articles)} articles")
-                
-            except Exception as e:
-                print(f"    ❌ Error ranking batch {batch_idx + 1}: {e}")
-                if debug_mode:
-                    import traceback
-                    traceback.print_exc()
+                    # Accumulate rankings
+                    for ranked_article in ranking_result.ranked_articles:
+                        title = ranked_article.original_title
+                        rank = ranked_article.refined_rank
+                        rationale = ranked_article.comparative_rationale
+                        
+                        rank_accumulator[title].append(rank)
+                        rationale_map[title].append(rationale)
+                        
+                    print(f"    ✅ Ranked {len(ranking_result.ranked_articles)} articles")
+                    
+                except Exception as e:
+                    print(f"    ❌ Error ranking batch {batch_idx + 1}: {e}")
+                    if debug_mode:
+                        import traceback
+                        traceback.print_exc()
     
     # Step 4: Aggregate rankings and compute final scores
     print(f"\n📈 Aggregating rankings from {shuffle_runs} passes...")
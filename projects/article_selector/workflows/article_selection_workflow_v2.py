@@ -4,7 +4,7 @@ This replaces the placeholder workflow with actual implementation.
 """
 
 import asyncio
-import json
+import orjson
 from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
 from pathlib import Path
@@ -22,7 +22,7 @@ from projects.article_selector.agents import (
     get_comparative_ranker_agent,
 )
 from projects.article_selector.models import Article
-from core.response_tracker import ResponseTracker
+from core.response_tracker import ResponseTracker, dump_json
 from core.settings import settings
 
 
@@ -50,15 +50,13 @@ class WorkflowState:
         self.state["timestamp"] = datetime.now().isoformat()
         
         checkpoint_file = self.checkpoint_dir / f"checkpoint_{self.run_id}_{phase}.json"
-        with open(checkpoint_file, "w") as f:
-            json.dump(self.state, f, indent=2, default=str)
+        dump_json(self.state, checkpoint_file)
         return checkpoint_file
     
     def load_checkpoint(self, checkpoint_file: Path) -> bool:
         """Load state from checkpoint file."""
         if checkpoint_file.exists():
-            with open(checkpoint_file, "r") as f:
-                self.state = json.load(f)
+            self.state = orjson.loads(checkpoint_file.read_bytes())
             return True
         return False
     
@@ -201,7 +199,7 @@ class ArticleSelectionWorkflowV2:
                 "article_id": idx,
                 "prompt": f"Article Title: {article.title}\n"
                          f"Source Domain: {article.domain}\n"
-                         f"Article Content: {article.content[:1000]}"
+                         f"Article Content: {article.truncated_content}"
             }
             for idx, article in enumerate(articles)
         ]
@@ -242,7 +240,7 @@ class ArticleSelectionWorkflowV2:
             f"Article Title: {article.title}\n"
             f"Source Domain: {article.domain}\n"
             f"URL: {article.url}\n"
-            f"Summary: {article.content[:500]}\n"
+            f"Summary: {article.summary_content}\n"
             f"First Pass Assessment: {item['first_pass_reasoning']}"
         )
     
@@ -392,7 +390,7 @@ class ArticleSelectionWorkflowV2:
                     role="user",
                     content=f"Article Title: {article.title}\n"
                            f"Source Domain: {article.domain}\n"
-                           f"Article Content: {article.content[:1000]}"
+                           f"Article Content: {article.truncated_content}"
                 )]
                 
                 result = self.first_pass_agent.run(messages=messages)
@@ -442,18 +440,19 @@ class ArticleSelectionWorkflowV2:
                     "reasoning": f"Error: {e}",
                 }
         
-        # Process in parallel batches
-        tasks = []
-        for idx, article in enumerate(articles):
-            task = loop.run_in_executor(
-                self.executor,
-                process_article,
-                article,
-                idx
-            )
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks)
+        # Process in parallel batches, writing responses as one batch file
+        with self.response_tracker.batch():
+            tasks = []
+            for idx, article in enumerate(articles):
+                task = loop.run_in_executor(
+                    self.executor,
+                    process_article,
+                    article,
+                    idx
+                )
+                tasks.append(task)
+            
+            results = await asyncio.gather(*tasks)
         return results
     
     async def _parallel_scoring(self, relevant_articles: List[Dict]) -> List[Dict]:
@@ -468,7 +467,7 @@ class ArticleSelectionWorkflowV2:
                     content=f"Article Title: {article.title}\n"
                            f"Source Domain: {article.domain}\n"
                            f"URL: {article.url}\n"
-                           f"Summary: {article.content[:500]}\n"
+                           f"Summary: {article.summary_content}\n"
                            f"First Pass Assessment: {item['reasoning']}"
                 )]
                 
@@ -512,17 +511,18 @@ class ArticleSelectionWorkflowV2:
                     "scoring_rationale": f"Error: {e}",
                 }
         
-        # Process in parallel
-        tasks = []
-        for item in relevant_articles:
-            task = loop.run_in_executor(
-                self.executor,
-                score_article,
-                item
-            )
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks)
+        # Process in parallel, writing responses as one batch file
+        with self.response_tracker.batch():
+            tasks = []
+            for item in relevant_articles:
+                task = loop.run_in_executor(
+                    self.executor,
+                    score_article,
+                    item
+                )
+                tasks.append(task)
+            
+            results = await asyncio.gather(*tasks)
         return results
     
     async def _comparative_ranking_async(self, scored_articles: List[Dict]) -> List[Dict]:
@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from core.database import ArticleDatabase
 from core.settings import settings
 from core.output_formatter import SelectionOutputFormatter
+from core.response_tracker import drain_response_writers
 from projects.article_selector.agents.tracked_agents import (
     get_tracked_first_pass_agent,
     get_tracked_scoring_agent,
@@ -99,7 +100,7 @@ def fetch_articles_by_date(
     
     if use_motherduck:
         # MotherDuck query with values already embedded
-        result = db.conn.execute(query).fetchall()
+        result = db.conn.execute(query)
     else:
         # Local DuckDB with parameters
         result = db.conn.execute(
@@ -107,12 +108,17 @@ def fetch_articles_by_date(
             [start_date.strftime("%Y-%m-%d"), 
              end_date.strftime("%Y-%m-%d"),
              limit]
-        ).fetchall()
+        )
     
     columns = ['id', 'title', 'content', 'url', 'domain', 'published_date', 
                'author', 'tags', 'metadata', 'created_at']
     
-    return [dict(zip(columns, row)) for row in result]
+    # Stream Arrow record batches rather than materializing every row as a tuple
+    return [
+        dict(zip(columns, values))
+        for batch in result.fetch_record_batch(rows_per_batch=10_000)
+        for values in zip(*(column.to_pylist() for column in batch.columns))
+    ]
 
 
 def clear_response_directory():
@@ -201,11 +207,8 @@ def process_articles(
         # Extract just the justification part (after the status)
         if "Irrelevant" in reasoning or "Relevant" in reasoning:
             # Split on first period after status word to get justification
-            parts = reasoning.split('.', 1)
-            if len(parts) > 1:
-                justification = parts[1].strip()
-            else:
-                justification = reasoning
+            _, dot, rest = reasoning.partition('.')
+            justification = rest.strip() if dot else reasoning
         else:
             justification = reasoning
         
@@ -368,6 +371,9 @@ def process_articles(
             metadata=phase_stats
         )
     
+    # Make sure every queued agent response is on disk before returning
+    drain_response_writers()
+    
     return {
         'selected': selected_articles,
         'stats': phase_stats,
@@ -26,6 +26,7 @@ from projects.article_selector.models import Article
 from core.database import ArticleDatabase
 from core.settings import settings
 from core.output_formatter import SelectionOutputFormatter
+from core.response_tracker import dump_json
 
 
 def parse_arguments():
@@ -188,7 +189,7 @@ async def fetch_articles_async(
                 ORDER BY timestamp DESC
                 LIMIT {limit}
             """
-            result = db.conn.execute(query).fetchall()
+            result = db.conn.execute(query)
         else:
             query = """
                 SELECT * FROM articles 
@@ -202,12 +203,17 @@ async def fetch_articles_async(
                 [start_date.strftime("%Y-%m-%d"), 
                  end_date_val.strftime("%Y-%m-%d"),
                  limit]
-            ).fetchall()
+            )
         
         columns = ['id', 'title', 'content', 'url', 'domain', 'published_date', 
                    'author', 'tags', 'metadata', 'created_at']
         
-        return [dict(zip(columns, row)) for row in result]
+        # Stream Arrow record batches rather than materializing every row as a tuple
+        return [
+            dict(zip(columns, values))
+            for batch in result.fetch_record_batch(rows_per_batch=10_000)
+            for values in zip(*(column.to_pylist() for column in batch.columns))
+        ]
     
     return await loop.run_in_executor(None, fetch)
 
@@ -336,9 +342,7 @@ async def main_async(args):
             
             json_file = output_dir / f"selection_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             
-            import json
-            with open(json_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            dump_json(results, json_file)
             
             print(f"\n📁 Results exported to: {json_file}")
     
@@ -0,0 +1,51 @@
+"""Tests for BatchProcessor's concurrency cap and rate limiting."""
+
+import asyncio
+
+from core.batch_processor import BatchProcessor
+
+
+async def test_results_keep_input_order_and_return_exceptions():
+    async def work(item):
+        await asyncio.sleep(0.01 * (5 - item))
+        if item == 2:
+            raise ValueError("boom")
+        return item * 10
+
+    results = await BatchProcessor().run_batch(work, range(5), max_concurrency=5, rpm=0)
+
+    assert results[:2] == [0, 10]
+    assert isinstance(results[2], ValueError)
+    assert results[3:] == [30, 40]
+
+
+async def test_in_flight_calls_never_exceed_max_concurrency():
+    in_flight = peak = 0
+
+    async def work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item
+
+    results = await BatchProcessor().run_batch(work, range(20), max_concurrency=3, rpm=0)
+
+    assert results == list(range(20))
+    assert peak == 3
+
+
+async def test_call_starts_are_spaced_by_the_rate_limit():
+    loop = asyncio.get_running_loop()
+    starts = []
+
+    async def work(item):
+        starts.append(loop.time())
+        return item
+
+    # 1200 requests per minute -> one start every 50ms
+    await BatchProcessor().run_batch(work, range(4), max_concurrency=4, rpm=1200)
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
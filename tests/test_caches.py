@@ -0,0 +1,109 @@
+"""Tests for the agent response cache and the semantic cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core import agent_cache
+from core.agent_cache import AgentCache, agent_cache_key, arun_with_cache
+from core.semantic_cache import SemanticCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = AgentCache(str(tmp_path / "agent_cache.sqlite"))
+    yield store
+    store.close()
+
+
+def _agent(instructions="Classify the article."):
+    calls = []
+
+    async def arun(messages):
+        calls.append(messages[0].content)
+        return SimpleNamespace(content=f"answer {len(calls)}")
+
+    agent = SimpleNamespace(
+        agent_id="first_pass_agent",
+        name="First Pass Filter",
+        model=SimpleNamespace(id="gemini-2.0-flash"),
+        instructions=instructions,
+        arun=arun,
+    )
+    return agent, calls
+
+
+def test_agent_cache_hit_and_miss(cache):
+    assert cache.get("k") is None
+    cache.put("k", "v")
+    assert cache.get("k") == "v"
+    cache.put("k", "v2")
+    assert cache.get("k") == "v2"
+
+
+def test_agent_cache_entries_expire(cache):
+    cache.put("k", "v")
+    cache.conn.execute("UPDATE agent_cache SET created = created - 120")
+
+    assert cache.get("k", max_age=60) is None
+    assert cache.get("k", max_age=300) == "v"
+
+    cache.evict(60)
+    assert cache.get("k") is None
+
+
+def test_agent_cache_key_changes_with_instructions():
+    agent, _ = _agent()
+    edited, _ = _agent("Classify the article strictly.")
+
+    assert agent_cache_key(agent, "prompt") == agent_cache_key(agent, "prompt")
+    assert agent_cache_key(agent, "prompt") != agent_cache_key(agent, "other prompt")
+    assert agent_cache_key(agent, "prompt") != agent_cache_key(edited, "prompt")
+
+
+async def test_arun_with_cache_answers_repeats_from_the_cache(cache, monkeypatch):
+    monkeypatch.setattr(agent_cache, "get_agent_cache", lambda: cache)
+    monkeypatch.setattr(agent_cache, "settings", SimpleNamespace(agent_cache_max_age=60))
+    agent, calls = _agent()
+
+    first = await arun_with_cache(agent, "prompt")
+    second = await arun_with_cache(agent, "prompt")
+    other = await arun_with_cache(agent, "another prompt")
+
+    assert first.content == second.content == "answer 1"
+    assert other.content == "answer 2"
+    assert calls == ["prompt", "another prompt"]
+
+
+async def test_arun_with_cache_ignores_expired_entries(cache, monkeypatch):
+    monkeypatch.setattr(agent_cache, "get_agent_cache", lambda: cache)
+    monkeypatch.setattr(agent_cache, "settings", SimpleNamespace(agent_cache_max_age=60))
+    agent, calls = _agent()
+
+    await arun_with_cache(agent, "prompt")
+    cache.conn.execute("UPDATE agent_cache SET created = created - 120")
+    result = await arun_with_cache(agent, "prompt")
+
+    assert result.content == "answer 2"
+    assert len(calls) == 2
+
+
+async def test_arun_with_cache_disabled_always_runs_the_agent(monkeypatch):
+    monkeypatch.setattr(agent_cache, "get_agent_cache", lambda: None)
+    agent, calls = _agent()
+
+    await arun_with_cache(agent, "prompt")
+    await arun_with_cache(agent, "prompt")
+
+    assert len(calls) == 2
+
+
+def test_semantic_cache_hit_and_miss():
+    cache = SemanticCache(threshold=0.9)
+    text = "Critical heap overflow in libxml2 lets attackers run code via crafted XML documents"
+
+    assert cache.get(text) is None
+    cache.put(text, "Relevant")
+
+    assert cache.get(text) == "Relevant"
+    assert cache.get("Quarterly earnings beat expectations at a large retailer") is None
@@ -0,0 +1,49 @@
+"""Tests for ArticleDatabase queries."""
+
+import pytest
+
+from core.database import ArticleDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = ArticleDatabase(local_db_path=str(tmp_path / "articles.duckdb"))
+    yield database
+    database.close()
+
+
+def test_relevant_articles_keep_article_ids(db):
+    db.conn.execute("""
+        INSERT INTO articles (id, title, content) VALUES
+        (1, 'Unscored one', 'a'), (2, 'Scored', 'b'), (3, 'Unscored two', 'c')
+    """)
+    db.conn.execute("""
+        INSERT INTO first_pass_results (id, article_id, status, reasoning) VALUES
+        (10, 1, 'Relevant', 'fp'), (11, 2, 'Relevant', 'fp'), (12, 3, 'Relevant', 'fp')
+    """)
+    # Scoring row ids deliberately differ from the article ids they belong to
+    db.conn.execute("""
+        INSERT INTO scoring_results (id, article_id, overall_score, reasoning) VALUES
+        (100, 2, 9.0, 'scored')
+    """)
+
+    rows = db.get_relevant_articles()
+
+    article_ids = [row[0] for row in db.conn.execute("SELECT id FROM articles ORDER BY id").fetchall()]
+    assert sorted(row["id"] for row in rows) == article_ids
+    by_id = {row["id"]: row for row in rows}
+    assert by_id[2]["overall_score"] == 9.0
+    assert by_id[2]["reasoning"] == "scored"
+    assert by_id[1]["overall_score"] is None
+    assert by_id[1]["first_pass_reasoning"] == "fp"
+
+
+def test_first_pass_cache_hit_miss_and_eviction(db):
+    db.put_cached_first_pass_many([("fresh", "Relevant", "r1"), ("stale", "Irrelevant", "r2")])
+    db.conn.execute("UPDATE first_pass_cache SET cached_at = cached_at - INTERVAL 40 DAY WHERE content_hash = 'stale'")
+
+    assert set(db.get_cached_first_pass(["fresh", "stale", "unknown"])) == {"fresh", "stale"}
+
+    db.evict_first_pass_cache(max_age_days=30)
+
+    assert db.get_cached_first_pass(["fresh", "stale"]) == {"fresh": {"status": "Relevant", "reasoning": "r1"}}
@@ -0,0 +1,80 @@
+"""Tests for MicroBatcher batching, ordering and failure handling."""
+
+import asyncio
+
+import pytest
+
+from core.micro_batcher import MicroBatcher
+
+
+async def test_concurrent_submits_share_batches_and_keep_order():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(handler, max_batch_size=4, max_wait=0.05)
+    batcher.start()
+    try:
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(10)])
+    finally:
+        await batcher.stop()
+
+    assert results == [i * 2 for i in range(10)]
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [item for batch in batches for item in batch] == list(range(10))
+
+
+async def test_handler_error_fails_every_item_in_the_batch():
+    async def handler(items):
+        raise ValueError("upstream down")
+
+    batcher = MicroBatcher(handler, max_batch_size=4, max_wait=0.01)
+    batcher.start()
+    try:
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(3)], return_exceptions=True)
+    finally:
+        await batcher.stop()
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+async def test_short_handler_result_fails_unmatched_items():
+    async def handler(items):
+        return items[:1]
+
+    batcher = MicroBatcher(handler, max_batch_size=4, max_wait=0.05)
+    batcher.start()
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*[batcher.submit(i) for i in range(3)], return_exceptions=True),
+            timeout=1
+        )
+    finally:
+        await batcher.stop()
+
+    assert results[0] == 0
+    assert all(isinstance(r, RuntimeError) for r in results[1:])
+
+
+async def test_stop_fails_items_not_yet_dispatched():
+    async def handler(items):
+        return items
+
+    # A long window keeps the submitted items in the collecting batch
+    batcher = MicroBatcher(handler, max_batch_size=100, max_wait=10)
+    batcher.start()
+    pending = [asyncio.create_task(batcher.submit(i)) for i in range(3)]
+    await asyncio.sleep(0.05)
+
+    await batcher.stop()
+
+    results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), timeout=1)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_submit_requires_start():
+    batcher = MicroBatcher(lambda items: items)
+    with pytest.raises(RuntimeError):
+        await batcher.submit(1)
@@ -0,0 +1,144 @@
+"""Tests for the process CLI pipeline's resume and failure paths."""
+
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+
+from cli import process_articles
+
+
+class FakeDatabase:
+    """Records what the pipeline writes; serves fixed unprocessed and relevant rows."""
+
+    def __init__(self, unprocessed, relevant=None):
+        self.unprocessed = unprocessed
+        self.relevant = relevant or []
+        self.first_pass_rows = []
+        self.scoring_rows = []
+        self.selections = []
+
+    def iter_unprocessed_articles(self, limit):
+        if not self.unprocessed:
+            return iter(())
+        return iter([pa.RecordBatch.from_pylist(self.unprocessed[:limit])])
+
+    def evict_first_pass_cache(self, max_age_days):
+        pass
+
+    def get_cached_first_pass(self, content_hashes):
+        return {}
+
+    def put_cached_first_pass_many(self, rows):
+        pass
+
+    def save_first_pass_results(self, rows):
+        self.first_pass_rows.extend(rows)
+
+    def get_relevant_articles(self):
+        return [dict(row) for row in self.relevant]
+
+    def save_scoring_results(self, rows):
+        self.scoring_rows.extend(rows)
+
+    def save_selected_articles(self, selections, batch_id):
+        self.selections.extend(selections)
+
+
+class FakePool:
+    def __init__(self, db):
+        self.db = db
+
+    async def run(self, fn):
+        return fn(self.db)
+
+    def close(self):
+        pass
+
+
+class FakeFirstPass:
+    async def aclassify_many(self, articles, save_responses=True, article_ids=None):
+        return [{"status": "Relevant", "reasoning": "on topic", "result": None} for _ in articles]
+
+
+class FakeScoring:
+    def __init__(self, failing_titles=()):
+        self.failing_titles = set(failing_titles)
+        self.scored_ids = []
+
+    async def ascore_article(self, article, first_pass_reasoning, article_id=None, save_responses=True):
+        self.scored_ids.append(article_id)
+        if article.title in self.failing_titles:
+            return {"score": 0.0, "result": None, "rationale": "Error: provider timeout"}
+        return {"score": 8.0, "result": SimpleNamespace(content="Score: 8"), "rationale": "Score: 8"}
+
+
+class FakeSelector:
+    def __init__(self):
+        self.candidates = None
+
+    def select_articles(self, scored_articles, max_articles, batch_id, save_responses=True):
+        # Mirrors TrackedSelectorAgent, which formats every candidate's score
+        for article in scored_articles:
+            f"{article['overall_score']:.1f}"
+        self.candidates = scored_articles
+        return {"result": SimpleNamespace(content="1, 2"), "selection_text": "1, 2"}
+
+
+def _article_row(article_id, title):
+    return {
+        "id": article_id,
+        "title": title,
+        "content": f"{title} content",
+        "url": f"https://example.com/{article_id}",
+        "domain": "example.com",
+    }
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Patch the pipeline's database, settings and agents; returns a setup function."""
+    def setup(db, scoring):
+        selector = FakeSelector()
+        monkeypatch.setattr(process_articles, "get_database", lambda: db)
+        monkeypatch.setattr(process_articles, "DuckDBPool", FakePool)
+        monkeypatch.setattr(process_articles, "settings", SimpleNamespace(use_motherduck=lambda: False))
+        monkeypatch.setattr(process_articles, "get_tracked_first_pass_agent", lambda debug_mode: FakeFirstPass())
+        monkeypatch.setattr(process_articles, "get_tracked_scoring_agent", lambda debug_mode: scoring)
+        monkeypatch.setattr(process_articles, "get_tracked_selector_agent", lambda debug_mode: selector)
+        monkeypatch.setattr(process_articles.SelectionOutputFormatter, "display_selection_results", lambda **kw: None)
+        monkeypatch.setattr(process_articles.SelectionOutputFormatter, "display_processing_summary", lambda **kw: None)
+        return selector
+    return setup
+
+
+async def test_failed_scoring_is_skipped_and_left_out_of_selection(pipeline):
+    db = FakeDatabase([_article_row(1, "Alpha"), _article_row(2, "Beta"), _article_row(3, "Gamma")])
+    selector = pipeline(db, FakeScoring(failing_titles={"Beta"}))
+
+    await process_articles.process_batch(export_json=False, rpm=0)
+
+    assert [row[0] for row in db.first_pass_rows] == [1, 2, 3]
+    assert sorted(row[0] for row in db.scoring_rows) == [1, 3]
+    assert sorted(a["id"] for a in selector.candidates) == [1, 3]
+    assert sorted(s["article_id"] for s in db.selections) == [1, 3]
+
+
+async def test_resume_scores_unscored_articles_under_their_article_ids(pipeline):
+    db = FakeDatabase(
+        [_article_row(4, "Delta")],
+        relevant=[
+            {**_article_row(2, "Beta"), "first_pass_reasoning": "fp", "overall_score": 9.0},
+            {**_article_row(1, "Alpha"), "first_pass_reasoning": "fp", "overall_score": None},
+            {**_article_row(3, "Gamma"), "first_pass_reasoning": "fp", "overall_score": None},
+        ],
+    )
+    scoring = FakeScoring()
+    selector = pipeline(db, scoring)
+
+    await process_articles.process_batch(export_json=False, rpm=0, resume=True, max_selected=2)
+
+    assert sorted(scoring.scored_ids) == [1, 3]
+    assert sorted(row[0] for row in db.scoring_rows) == [1, 3]
+    assert [a["id"] for a in selector.candidates][0] == 2
+    assert [s["article_id"] for s in db.selections] == [2, 1]